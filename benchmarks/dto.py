@@ -0,0 +1,103 @@
+"""
+Micro-benchmark dựng và serialize danh sách DTOs cho list endpoints.
+
+So sánh (mỗi lần: dựng DTOs từ dữ liệu của database rồi serialize thành JSON):
+- per_item: model_validate từng ORM entity, datetime serialize qua field_serializer (trước đây)
+- batch: validate_many trên rows dạng dict + dump_many_json
+- batch_strict: validate_many(strict=True), validate rows từ database ở strict mode
+
+Chạy:
+    uv run python -m benchmarks.dto
+    uv run python -m benchmarks.dto --sizes 10 100 10000 --repeats 5
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from pydantic import field_serializer
+from pydantic_core import to_json
+
+from src.base.dto.batch import dump_many_json, validate_many
+from src.health.database.model.health_check import HealthCheck
+from src.health.dto.main import DbHealthCheckDto
+
+
+class PerItemDbHealthCheckDto(DbHealthCheckDto):
+    """DbHealthCheckDto với datetime serialize bằng Python callback (trước đây)."""
+
+    @field_serializer("created_at", "updated_at")
+    def serialize_dates(self, value: datetime) -> str:
+        return value.isoformat() if value else None  # type: ignore
+
+
+def _make_data(size: int) -> tuple[list[HealthCheck], list[dict]]:
+    """
+    Tạo cùng một tập dữ liệu dạng ORM entities và dạng rows.
+
+    Args:
+        size: Số entries
+
+    Returns:
+        tuple[list[HealthCheck], list[dict]]: Entities và rows (id, created_at, updated_at)
+    """
+    started = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    rows = [
+        {"id": index, "created_at": started + timedelta(seconds=index), "updated_at": started + timedelta(seconds=index)}
+        for index in range(1, size + 1)
+    ]
+    return [HealthCheck(**row) for row in rows], rows
+
+
+def _bench(operation: Callable[[], bytes], size: int, repeats: int) -> float:
+    """
+    Đo thời gian trung bình cho mỗi row (lấy lần chạy nhanh nhất).
+
+    Args:
+        operation: Dựng và serialize cả danh sách
+        size: Số rows mỗi lần
+        repeats: Số lần đo
+
+    Returns:
+        float: Micro giây mỗi row
+    """
+    loops = max(1, 20_000 // size)
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best / size * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch DTO validation/serialization")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 10_000], help="Số rows mỗi danh sách")
+    parser.add_argument("--repeats", type=int, default=3, help="Số lần đo mỗi trường hợp")
+    args = parser.parse_args()
+
+    print(f"{'rows':>7}  {'mode':<15}{'µs/row':>9}{'speedup':>10}")
+    for size in args.sizes:
+        entities, rows = _make_data(size)
+        operations = {
+            "per_item": lambda: to_json(
+                [PerItemDbHealthCheckDto.model_validate(entity) for entity in entities], by_alias=True
+            ),
+            "batch": lambda: dump_many_json(DbHealthCheckDto, validate_many(DbHealthCheckDto, rows)),
+            "batch_strict": lambda: dump_many_json(
+                DbHealthCheckDto, validate_many(DbHealthCheckDto, rows, strict=True)
+            ),
+        }
+        # Kết quả phải giống nhau để so sánh có ý nghĩa
+        outputs = {operation() for operation in operations.values()}
+        assert len(outputs) == 1, "serialized outputs differ"
+
+        results = {name: _bench(operation, size, args.repeats) for name, operation in operations.items()}
+        baseline = results["per_item"]
+        for name, per_row in results.items():
+            print(f"{size:>7}  {name:<15}{per_row:>9.2f}{baseline / per_row:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
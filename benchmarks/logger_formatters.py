@@ -0,0 +1,96 @@
+"""
+Micro-benchmark cho các log formatters.
+
+So sánh:
+- uncached_text: RelativePathFormatter khi resolve path cho mỗi record (trước đây)
+- text: RelativePathFormatter với cache relative path
+- json: JsonFormatter (có request context)
+
+Chạy:
+    uv run python -m benchmarks.logger_formatters
+    uv run python -m benchmarks.logger_formatters --records 200000
+"""
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from src.logger.JsonFormatter import JsonFormatter
+from src.logger.RelativePathFormatter import RelativePathFormatter
+from src.logger.RequestContext import RequestContext, bind_request_context, reset_request_context
+from src.logger.RequestContextFilter import RequestContextFilter
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class UncachedRelativePathFormatter(RelativePathFormatter):
+    """RelativePathFormatter không cache, resolve path cho mỗi record."""
+
+    def get_relative_path(self, record: logging.LogRecord) -> str:
+        try:
+            return str(Path(record.pathname).resolve().relative_to(self._project_root))
+        except ValueError:
+            return record.filename
+
+
+def _make_record() -> logging.LogRecord:
+    return logging.LogRecord(
+        name="app",
+        level=logging.INFO,
+        pathname=str(PROJECT_ROOT / "src" / "health" / "service" / "health_check" / "main.py"),
+        lineno=56,
+        msg="Created health check entry with id=%s",
+        args=(12345,),
+        exc_info=None,
+    )
+
+
+def _bench(formatter: logging.Formatter, records: int) -> float:
+    """
+    Đo số records/giây của formatter.
+
+    Args:
+        formatter: Formatter cần đo
+        records: Số records format
+
+    Returns:
+        float: Records mỗi giây
+    """
+    context_filter = RequestContextFilter()
+    record = _make_record()
+    started = time.perf_counter()
+    for _ in range(records):
+        context_filter.filter(record)
+        formatter.format(record)
+    return records / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark log formatters")
+    parser.add_argument("--records", type=int, default=100_000, help="Số records mỗi formatter")
+    args = parser.parse_args()
+
+    formatters = {
+        "uncached_text": UncachedRelativePathFormatter(PROJECT_ROOT),
+        "text": RelativePathFormatter(PROJECT_ROOT),
+        "json": JsonFormatter(PROJECT_ROOT),
+    }
+
+    token = bind_request_context(RequestContext(
+        request_id="0" * 32,
+        scope={"type": "http", "path": "/api/health/db"},
+    ))
+    try:
+        results = {name: _bench(formatter, args.records) for name, formatter in formatters.items()}
+    finally:
+        reset_request_context(token)
+
+    baseline = results["uncached_text"]
+    print(f"{'formatter':<15}{'records/s':>14}{'speedup':>10}")
+    for name, rate in results.items():
+        print(f"{name:<15}{rate:>14,.0f}{rate / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
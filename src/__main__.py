@@ -2,48 +2,135 @@
 Entry point của FastAPI application.
 """
 import argparse
+import importlib.util
 from os import environ
 from pathlib import Path
+from typing import Any
 
 import uvicorn
 from dotenv import load_dotenv
 
+from src.bench.main import add_bench_parser
 from src.config import Config
 from src.logger.LoggerConfig import LoggerConfig
 from src.logger.LoggerFactory import LoggerFactory
 
 
 # Khởi tạo logger singleton ngay khi module được load
-_logger_config = LoggerConfig(project_root=Path(__file__).parent.parent)
+load_dotenv('.env')
+_logger_config = LoggerConfig.from_config(Config(environ), project_root=Path(__file__).parent.parent)
 _logger_factory = LoggerFactory(_logger_config)
 logger = _logger_factory.get_instance()
 
 
 
+SERVER_LOOPS = ["auto", "asyncio", "uvloop"]
+SERVER_HTTP_PROTOCOLS = ["auto", "h11", "httptools"]
+
+
+def _get_server_options(args: argparse.Namespace, config: Config) -> dict[str, Any]:
+    """
+    Tổng hợp options cho uvicorn.run từ CLI arguments và Config.
+
+    Thứ tự ưu tiên: CLI argument > Config (SERVER_*) > mặc định.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments của subcommand server.
+        config (Config): Config instance.
+
+    Returns:
+        dict[str, Any]: Keyword arguments cho uvicorn.run.
+
+    Raises:
+        SystemExit: Nếu loop/http không hợp lệ hoặc package tương ứng chưa được cài.
+    """
+
+    def option(name: str, key: str, default: Any) -> Any:
+        value = getattr(args, name, None)
+        if value is not None:
+            return value
+        if isinstance(default, int):
+            return config.get_int(key, default)
+        return config.get_config(key, default)
+
+    debug = getattr(args, "debug", False)
+    workers = 1 if debug else option("workers", "SERVER_WORKERS", 1)
+    loop = option("loop", "SERVER_LOOP", "auto")
+    http = option("http", "SERVER_HTTP", "auto")
+
+    for value, choices, package in ((loop, SERVER_LOOPS, "uvloop"), (http, SERVER_HTTP_PROTOCOLS, "httptools")):
+        if value not in choices:
+            raise SystemExit(f"Invalid server option '{value}', expected one of: {', '.join(choices)}")
+        if value == package and importlib.util.find_spec(package) is None:
+            raise SystemExit(f"'{package}' is not installed, run: uv sync --extra server")
+
+    limit_concurrency = option("limit_concurrency", "SERVER_LIMIT_CONCURRENCY", 0)
+    limit_max_requests = option("limit_max_requests", "SERVER_LIMIT_MAX_REQUESTS", 0)
+    limit_max_requests_jitter = option("limit_max_requests_jitter", "SERVER_LIMIT_MAX_REQUESTS_JITTER", 0)
+    graceful_timeout = option("timeout_graceful_shutdown", "SERVER_TIMEOUT_GRACEFUL_SHUTDOWN", 30)
+
+    options: dict[str, Any] = {
+        "host": option("host", "SERVER_HOST", "0.0.0.0"),
+        "port": option("port", "SERVER_PORT", 8000),
+        "workers": max(workers, 1),
+        "loop": loop,
+        "http": http,
+        "reload": debug,
+        "timeout_keep_alive": option("keep_alive", "SERVER_KEEP_ALIVE", 5),
+        "backlog": option("backlog", "SERVER_BACKLOG", 2048),
+        # 0 = không giới hạn
+        "limit_concurrency": limit_concurrency or None,
+        # Worker tự thoát sau N requests và được process cha khởi động lại
+        "limit_max_requests": limit_max_requests or None,
+        "timeout_graceful_shutdown": graceful_timeout or None,
+    }
+    if limit_max_requests_jitter:
+        # Tránh các workers cùng recycle một lúc
+        options["limit_max_requests_jitter"] = limit_max_requests_jitter
+    return options
+
+
 def run_server(args: argparse.Namespace) -> None:
     """
     Khởi chạy FastAPI server với uvicorn.
 
+    Ở chế độ debug chạy một process với hot reload; ngược lại chạy
+    `workers` processes (mặc định 1).
+
+    Với nhiều workers, TimedRotatingFileHandler không an toàn khi nhiều
+    processes cùng rotate một file, nên mọi process chuyển sang
+    LOG_EXTERNAL_ROTATION (WatchedFileHandler, rotate bằng logrotate).
+
     Args:
-        args (argparse.Namespace): Parsed arguments chứa debug flag.
+        args (argparse.Namespace): Parsed arguments của subcommand server.
     """
     # Load env và config
     load_dotenv('.env')
     config = Config(environ)
 
     root_path = config.get_config("ROOT_PATH", "")
+    options = _get_server_options(args, config)
+
+    if options["workers"] > 1 and not config.get_bool("LOG_EXTERNAL_ROTATION", False):
+        # Workers kế thừa environment; tạo lại logger của process cha với cùng config
+        environ["LOG_EXTERNAL_ROTATION"] = "true"
+        LoggerFactory.close_instance()
+        LoggerFactory(LoggerConfig.from_config(Config(environ), project_root=_logger_config.project_root)).get_instance()
+        logger.info("Multiple workers: log file rotation is left to an external tool (LOG_EXTERNAL_ROTATION)")
 
     logger.info("Starting application...")
     logger.info(f"Debug mode: {args.debug}")
     logger.info(f"Root path: {root_path}")
+    logger.info(
+        f"Listening on {options['host']}:{options['port']} with {options['workers']} worker(s), "
+        f"loop={options['loop']}, http={options['http']}"
+    )
 
     uvicorn.run(
         "src.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=args.debug,
         log_level="debug" if args.debug else "info",
         ws="none",
+        **options,
     )
 
 
@@ -59,6 +146,11 @@ Examples:
   uv run python -m src                  # Start server (default)
   uv run python -m src server           # Start server explicitly
   uv run python -m src server --debug   # Start server in debug mode
+  uv run python -m src server --workers 4 --port 8080 --loop uvloop --http httptools
+  uv run python -m src server --limit-max-requests 10000 --limit-max-requests-jitter 1000
+  uv run python -m src bench --stub-db -c 100 -n 20000
+  uv run python -m src bench --route "GET /api/health/db/latest" --duration 30 --format json
+  uv run python -m src bench --url http://localhost:8000 --route /health
         """,
     )
 
@@ -74,17 +166,73 @@ Examples:
     server_parser.add_argument(
         "--debug",
         action="store_true",
-        help="Chạy ở chế độ debug với hot reload",
+        help="Chạy ở chế độ debug với hot reload (một process)",
+    )
+    server_parser.add_argument("--host", help="Địa chỉ bind (SERVER_HOST, mặc định 0.0.0.0)")
+    server_parser.add_argument("--port", type=int, help="Port (SERVER_PORT, mặc định 8000)")
+    server_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Số worker processes (SERVER_WORKERS, mặc định 1). Với nhiều workers, "
+             "file log không tự rotate (LOG_EXTERNAL_ROTATION)",
+    )
+    server_parser.add_argument(
+        "--loop",
+        choices=SERVER_LOOPS,
+        help="Event loop (SERVER_LOOP, mặc định auto)",
+    )
+    server_parser.add_argument(
+        "--http",
+        choices=SERVER_HTTP_PROTOCOLS,
+        help="HTTP protocol implementation (SERVER_HTTP, mặc định auto)",
+    )
+    server_parser.add_argument(
+        "--keep-alive",
+        type=int,
+        help="Thời gian giữ keep-alive connection, giây (SERVER_KEEP_ALIVE, mặc định 5)",
+    )
+    server_parser.add_argument(
+        "--backlog",
+        type=int,
+        help="Số connections tối đa chờ accept (SERVER_BACKLOG, mặc định 2048)",
+    )
+    server_parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        help="Số connections/tasks đồng thời tối đa mỗi worker, vượt quá trả 503 "
+             "(SERVER_LIMIT_CONCURRENCY, mặc định 0 = không giới hạn)",
+    )
+    server_parser.add_argument(
+        "--limit-max-requests",
+        type=int,
+        help="Recycle worker sau N requests (SERVER_LIMIT_MAX_REQUESTS, mặc định 0 = tắt)",
+    )
+    server_parser.add_argument(
+        "--limit-max-requests-jitter",
+        type=int,
+        help="Cộng ngẫu nhiên tối đa N requests vào giới hạn trên mỗi worker "
+             "(SERVER_LIMIT_MAX_REQUESTS_JITTER, mặc định 0)",
+    )
+    server_parser.add_argument(
+        "--timeout-graceful-shutdown",
+        type=int,
+        help="Thời gian chờ requests đang xử lý khi shutdown, giây "
+             "(SERVER_TIMEOUT_GRACEFUL_SHUTDOWN, mặc định 30)",
     )
     server_parser.set_defaults(func=run_server)
 
+    # =================================================================
+    # Subcommand: bench
+    # =================================================================
+    add_bench_parser(subparsers)
+
     # Parse arguments
     args = parser.parse_args()
 
     # Nếu không có subcommand, mặc định chạy server
     if args.command is None:
-        # Chạy server với default debug=False
-        args.debug = False
+        # Chạy server với default options
+        args = server_parser.parse_args([])
         run_server(args)
     else:
         # Dispatch đến subcommand tương ứng
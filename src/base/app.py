@@ -8,7 +8,14 @@ from typing_extensions import Annotated, Doc
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.responses import Response
 
+from src.base.metrics.middleware import MetricsMiddleware
+from src.base.metrics.process import register_process_collector
+from src.base.middleware.profiling import ProfilingMiddleware
+from src.base.middleware.query_stats import QueryStatsMiddleware
+from src.base.middleware.request_context import RequestContextMiddleware
+from src.base.response.json import FastJSONResponse
 from src.base.exception.api.base import HTTPException
 from src.base.exception.api.handler import (
     rest_exception_handler,
@@ -17,6 +24,9 @@ from src.base.exception.api.handler import (
 )
 from src.base.router.docs import router as router_docs
 from src.base.router.health import router as router_health
+from src.base.router.log_level import router as router_log_level
+from src.base.router.metrics import router as router_metrics
+from src.base.router.route import ModelResponseRoute
 from src.base.initializer import Initializer
 from src.config import Config
 
@@ -58,6 +68,15 @@ def create_fastapi_app(
         str,
         Doc("The root path prefix for all endpoints (e.g., '/webhook/lark')."),
     ] = str(),
+    default_response_class: Annotated[
+        Type[Response],
+        Doc(
+            """
+            The default response class of all endpoints. FastJSONResponse serializes
+            Pydantic models and JSON data straight to bytes with pydantic-core.
+            """
+        ),
+    ] = FastJSONResponse,
     **fastapi_configs: Annotated[
         Any,
         Doc(
@@ -86,6 +105,7 @@ def create_fastapi_app(
         docs_url=docs_url,
         openapi_url=openapi_url,
         lifespan=initializer,
+        default_response_class=default_response_class,
         title=title,
         description=description,
         version=version,
@@ -102,10 +122,25 @@ def create_fastapi_app(
         **fastapi_configs,
     )
 
+    # Routes khai báo trực tiếp trên app trả response model mà không validate lại
+    app.router.route_class = ModelResponseRoute
+
     # Required endpoints with root_path prefix
     app.include_router(router_docs, prefix=root_path)
     app.include_router(router_health, prefix=root_path)
 
+    # Prometheus metrics (METRICS_ENABLED, mặc định bật)
+    metrics_enabled = config.get_bool("METRICS_ENABLED", True)
+    if metrics_enabled:
+        register_process_collector()
+        app.include_router(router_metrics, prefix=root_path)
+
+    # Admin endpoints đổi log level lúc runtime, chỉ bật khi có LOG_ADMIN_TOKEN
+    log_admin_token = config.get_config("LOG_ADMIN_TOKEN", "")
+    if log_admin_token:
+        app.state.log_admin_token = log_admin_token
+        app.include_router(router_log_level, prefix=root_path)
+
     # Required middleware
     app.add_middleware(
         CORSMiddleware,
@@ -115,5 +150,25 @@ def create_fastapi_app(
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Request-ID", "Server-Timing"],
+    )
+    # Sampling profiler theo request, chỉ thêm khi PROFILING_ENABLED
+    if config.get_bool("PROFILING_ENABLED", False):
+        app.add_middleware(
+            ProfilingMiddleware,
+            output_dir=config.get_config("PROFILING_DIR", "profiles"),
+            token=config.get_config("PROFILING_TOKEN", ""),
+            sample_rate=config.get_float("PROFILING_SAMPLE_RATE", 0.0),
+            slow_threshold=config.get_float("PROFILING_SLOW_MS", 0.0) / 1000,
+            interval=config.get_float("PROFILING_INTERVAL_MS", 5.0) / 1000,
+        )
+    # Thống kê queries mỗi request: cảnh báo N+1, header Server-Timing (SERVER_TIMING_ENABLED)
+    app.add_middleware(
+        QueryStatsMiddleware,
+        n_plus_one_threshold=config.get_int("QUERY_N_PLUS_ONE_THRESHOLD", 10),
+        server_timing=config.get_bool("SERVER_TIMING_ENABLED", False),
     )
+    if metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+    app.add_middleware(RequestContextMiddleware)
     return app
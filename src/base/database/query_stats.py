@@ -0,0 +1,200 @@
+"""
+Module theo dõi các statements SQL được gửi trong mỗi request.
+
+instrument_queries() gắn before/after_cursor_execute vào engine để:
+- Cộng dồn số queries, tổng thời gian DB và statement chậm nhất vào
+  QueryStats của context hiện tại (mỗi request một QueryStats, do
+  QueryStatsMiddleware tạo)
+- Ghi slow-query log (SQL đã chuẩn hóa và kiểu của parameters, không ghi giá trị)
+
+SQLAlchemy chạy events trong greenlet dùng chung contextvars với task gọi
+Repository, nên QueryStats của request được nhìn thấy trong events.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+logger = logging.getLogger("app")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_POSITIONAL_PARAM = re.compile(r"\$\d+|%\(\w+\)s|:\w+|\?")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST = re.compile(r"(\(\.\.\.\))(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Chuẩn hóa SQL để gộp các statements cùng dạng.
+
+    Literals và bind parameters được thay bằng "?", danh sách parameters
+    (IN (...), VALUES (...), (...)) được rút gọn, whitespace được gộp.
+
+    Args:
+        statement (str): SQL gốc
+
+    Returns:
+        str: SQL đã chuẩn hóa
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _POSITIONAL_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PARAM_LIST.sub("(...)", normalized)
+    normalized = _VALUES_LIST.sub(r"\1, ...", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """
+    Mô tả kiểu của bound parameters (không chứa giá trị).
+
+    Args:
+        parameters (Any): Parameters truyền cho cursor
+        executemany (bool): Statement chạy với nhiều bộ parameters
+
+    Returns:
+        str: Ví dụ "(int, str)", "{id: int}", "100 x (int, datetime)"
+    """
+    if executemany and isinstance(parameters, (list, tuple)) and parameters:
+        return f"{len(parameters)} x {parameter_shape(parameters[0])}"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+@dataclass
+class QueryStats:
+    """
+    Thống kê queries của một request.
+
+    Attributes:
+        count (int): Số statements
+        total_time (float): Tổng thời gian thực thi (giây)
+        slowest_time (float): Thời gian của statement chậm nhất (giây)
+        slowest_statement (Optional[str]): Statement chậm nhất (đã chuẩn hóa)
+        statements (Counter[str]): Số lần chạy theo statement đã chuẩn hóa
+    """
+
+    count: int = 0
+    total_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: Optional[str] = None
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        """
+        Ghi nhận một statement.
+
+        Args:
+            statement (str): Statement đã chuẩn hóa
+            duration (float): Thời gian thực thi (giây)
+        """
+        self.count += 1
+        self.total_time += duration
+        self.statements[statement] += 1
+        if duration > self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Các statements chạy từ threshold lần trở lên (dấu hiệu N+1).
+
+        Args:
+            threshold (int): Số lần tối thiểu
+
+        Returns:
+            list[tuple[str, int]]: (statement, số lần), nhiều nhất trước
+        """
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+def begin_query_stats() -> tuple[QueryStats, Token]:
+    """
+    Bắt đầu thu thập QueryStats cho context hiện tại.
+
+    Returns:
+        tuple[QueryStats, Token]: QueryStats mới và token cho end_query_stats()
+    """
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def end_query_stats(token: Token) -> None:
+    """
+    Kết thúc thu thập QueryStats.
+
+    Args:
+        token (Token): Token trả về từ begin_query_stats()
+    """
+    _query_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """
+    Lấy QueryStats của context hiện tại.
+
+    Returns:
+        Optional[QueryStats]: QueryStats, hoặc None nếu không thu thập
+    """
+    return _query_stats.get()
+
+
+def instrument_queries(engine: AsyncEngine, name: str, slow_query_ms: float = 500.0) -> None:
+    """
+    Gắn cursor events vào engine để thu thập QueryStats và ghi slow-query log.
+
+    Args:
+        engine (AsyncEngine): Engine cần theo dõi
+        name (str): Tên engine trong log
+        slow_query_ms (float): Ngưỡng (ms) ghi slow-query log, <= 0 để tắt
+    """
+    slow_query_seconds = slow_query_ms / 1000
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+    ) -> None:
+        context._query_started_at = time.perf_counter()  # type: ignore[attr-defined]
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+    ) -> None:
+        started_at = getattr(context, "_query_started_at", None)
+        if started_at is None:
+            return
+        duration = time.perf_counter() - started_at
+
+        stats = _query_stats.get()
+        is_slow = 0 < slow_query_seconds <= duration
+        if stats is None and not is_slow:
+            return
+
+        normalized = normalize_sql(statement)
+        if stats is not None:
+            stats.record(normalized, duration)
+        if is_slow:
+            logger.warning(
+                "Slow query on %s (%.1f ms): %s params=%s",
+                name,
+                duration * 1000,
+                normalized,
+                parameter_shape(parameters, executemany),
+            )
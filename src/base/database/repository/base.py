@@ -2,35 +2,99 @@
 Generic repository module cung cấp các CRUD operations cơ bản cho SQLAlchemy models.
 """
 
+import time
 from abc import ABC
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Optional, Sequence, Type, TypeVar, Generic
+from typing import Any, AsyncContextManager, AsyncIterator, Iterator, Optional, Sequence, Type, TypeVar, Generic, Union
 
-from sqlalchemy import insert, select, update, delete, text
+from sqlalchemy import column, func, insert, literal, select, tuple_, union_all, update, delete, text
+from sqlalchemy import values as values_clause
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.engine import RowMapping
 
 from src.base.database.model.base import Base
+from src.base.engine_group import EngineGroup
+from src.base.database.repository.cache import CacheStats, EntityCache, ICacheBackend
+from src.base.database.repository.count import CountCache, CountStrategy
+from src.base.database.repository.cursor import decode_cursor, encode_cursor
+from src.base.database.repository.statements import (
+    ID_PARAM,
+    LIMIT_PARAM,
+    OFFSET_PARAM,
+    RepositoryStatements,
+    StatementStats,
+)
+from src.base.database.unit_of_work import after_commit, current_session, unit_of_work
 
 
 T = TypeVar("T", bound=Base)
+E = TypeVar("E")
+
+
+def _chunked(items: Sequence[E], size: int) -> Iterator[Sequence[E]]:
+    """
+    Chia sequence thành các chunk có tối đa `size` phần tử.
+
+    Args:
+        items (Sequence[E]): Dữ liệu cần chia
+        size (int): Kích thước mỗi chunk
+
+    Yields:
+        Sequence[E]: Từng chunk theo thứ tự ban đầu
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
 class Repository(ABC, Generic[T]):
     """
     Abstract repository cung cấp các CRUD operations cho SQLAlchemy models.
+
+    Nếu khởi tạo với EngineGroup, các query đọc (get_*, fetch_sql) được gửi tới
+    read replicas, các query ghi (create/update/delete, execute_sql) tới primary.
+
+    Trong một unit_of_work trên primary engine, mọi method dùng chung session
+    của unit-of-work và không tự commit.
+
+    get_one, get_multiple, update và delete dùng statements dựng sẵn một lần
+    cho mỗi model (RepositoryStatements).
     """
 
-    def __init__(self, engine: AsyncEngine, db_model: Type[T]):
+    def __init__(
+        self,
+        engine: Union[AsyncEngine, EngineGroup],
+        db_model: Type[T],
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        count_cache_ttl: float = 30.0,
+        bulk_batch_size: int = 1000,
+        cache: Optional[ICacheBackend] = None,
+        cache_ttl: Optional[float] = None,
+    ):
         """
         Khởi tạo repository.
 
         Args:
-            engine (AsyncEngine): SQLAlchemy async engine
+            engine (Union[AsyncEngine, EngineGroup]): SQLAlchemy async engine, hoặc
+                EngineGroup (primary + read replicas) để tách đọc/ghi
             db_model (Type[T]): SQLAlchemy model class
+            count_strategy (CountStrategy): Chiến lược đếm mặc định cho get_multiple
+            count_cache_ttl (float): TTL (giây) của count khi dùng CountStrategy.CACHED
+            bulk_batch_size (int): Số rows mỗi statement của các bulk operations
+            cache (Optional[ICacheBackend]): Backend cho read-through cache của get_one.
+                None = không cache.
+            cache_ttl (Optional[float]): TTL (giây) của entries, None = TTL mặc định của backend
         """
         self._model = db_model
-        self._engine = engine
+        self._engines = engine if isinstance(engine, EngineGroup) else EngineGroup(primary=engine)
+        self._engine = self._engines.primary
+        self._count_strategy = count_strategy
+        self._count_cache = CountCache(ttl=count_cache_ttl)
+        self._bulk_batch_size = bulk_batch_size
+        self._cache: Optional[EntityCache[T]] = EntityCache(cache, db_model, cache_ttl) if cache is not None else None
+        self._statements = RepositoryStatements.for_model(db_model)
+        for instrumented_engine in (self._engine, *self._engines.replicas):
+            RepositoryStatements.instrument(instrumented_engine)
         self._session_factory = async_sessionmaker(
             bind=self._engine,
             autocommit=False,
@@ -39,14 +103,35 @@ class Repository(ABC, Generic[T]):
         )
 
     @asynccontextmanager
-    async def _get_session(self) -> AsyncIterator[AsyncSession]:
+    async def _get_session(
+        self,
+        read_only: bool = False,
+        record_latency: bool = True,
+    ) -> AsyncIterator[AsyncSession]:
         """
         Context manager để lấy database session.
 
+        Nếu đang trong unit_of_work trên primary engine của repository,
+        trả về session của unit-of-work (không đóng, không rollback tại đây).
+
+        Args:
+            read_only (bool): True nếu session chỉ dùng để đọc, khi đó
+                session được bind tới replica do EngineGroup chọn.
+            record_latency (bool): Ghi nhận thời gian sử dụng session vào latency
+                của replica. Tắt cho streaming vì thời gian phụ thuộc consumer.
+
         Yields:
             AsyncSession: SQLAlchemy async session
         """
-        session = self._session_factory()
+        if self._in_unit_of_work():
+            yield current_session()  # type: ignore[misc]
+            if not read_only:
+                self._engines.mark_write()
+            return
+
+        engine = self._engines.reader() if read_only else self._engine
+        session = self._session_factory(bind=engine)
+        started_at = time.perf_counter()
         try:
             yield session
         except Exception:
@@ -55,6 +140,96 @@ class Repository(ABC, Generic[T]):
         finally:
             await session.close()
 
+        if not read_only:
+            self._engines.mark_write()
+        elif record_latency:
+            self._engines.record_latency(engine, time.perf_counter() - started_at)
+
+    async def _commit(self, session: AsyncSession) -> None:
+        """
+        Commit session, hoặc chỉ flush nếu session thuộc unit-of-work
+        (unit-of-work tự commit khi kết thúc).
+
+        Args:
+            session (AsyncSession): Session lấy từ _get_session
+        """
+        if session is current_session():
+            await session.flush()
+        else:
+            await session.commit()
+
+    def unit_of_work(self) -> AsyncContextManager[AsyncSession]:
+        """
+        Mở unit-of-work trên primary engine của repository.
+
+        Returns:
+            AsyncContextManager[AsyncSession]: Context manager của unit_of_work
+
+        Example:
+            >>> async with repository.unit_of_work():
+            ...     entity = await repository.create({...})
+            ...     await other_repository.update(entity.id, {...})
+        """
+        return unit_of_work(self._engine)
+
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Bộ đếm hits/misses/evictions của entity cache, None nếu không bật cache."""
+        return self._cache.stats if self._cache else None
+
+    @property
+    def statement_stats(self) -> dict[str, StatementStats]:
+        """Bộ đếm executions/cache hits/misses của các statements dựng sẵn của model."""
+        prefix = f"{self._model.__table__.fullname}."
+        return {name: stats for name, stats in RepositoryStatements.stats.items() if name.startswith(prefix)}
+
+    async def invalidate_cache(self, *entity_ids: int) -> None:
+        """
+        Xóa entities khỏi entity cache.
+
+        Cần gọi sau execute_sql hoặc các thao tác ghi không đi qua
+        create/update/delete của repository. Trong unit-of-work, entities
+        được xóa ngay và xóa lại sau khi commit (after_commit), để một lần
+        đọc đồng thời không cache lại dữ liệu cũ trước khi commit.
+
+        Args:
+            *entity_ids (int): IDs cần xóa
+        """
+        if not self._cache or not entity_ids:
+            return
+        cache = self._cache
+        await cache.invalidate(*entity_ids)
+        if self._in_unit_of_work():
+            after_commit(lambda: cache.invalidate(*entity_ids))
+
+    def _in_unit_of_work(self) -> bool:
+        """
+        Kiểm tra repository có đang dùng chung session của unit-of-work không.
+
+        Returns:
+            bool: True nếu đang trong unit_of_work trên primary engine
+        """
+        shared_session = current_session()
+        return shared_session is not None and shared_session.bind is self._engine
+
+    async def _refresh_cache(self, entity_id: int, entity: Optional[T]) -> None:
+        """
+        Cập nhật cache sau một thao tác ghi.
+
+        Trong unit-of-work, transaction chưa commit nên chỉ xóa entry
+        (tránh cache dữ liệu có thể bị rollback), và xóa lại sau khi commit.
+
+        Args:
+            entity_id (int): ID của entity vừa ghi
+            entity (Optional[T]): Entity mới nhất, None nếu đã bị xóa/không tồn tại
+        """
+        if not self._cache:
+            return
+        if entity is None or self._in_unit_of_work():
+            await self.invalidate_cache(entity_id)
+        else:
+            await self._cache.set(entity)
+
     async def get_all(self) -> Sequence[T]:
         """
         Lấy tất cả entities từ database, sắp xếp theo id.
@@ -62,11 +237,32 @@ class Repository(ABC, Generic[T]):
         Returns:
             Sequence[T]: Danh sách entities
         """
-        async with self._get_session() as session:
+        async with self._get_session(read_only=True) as session:
             query = select(self._model).order_by(self._model.id)
             result = await session.scalars(query)
             return result.all()
 
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[T]:
+        """
+        Duyệt tất cả entities bằng server-side cursor, sắp xếp theo id.
+
+        Mỗi lần chỉ fetch `batch_size` rows từ database nên bộ nhớ không
+        tăng theo kích thước bảng. Session được giữ mở cho tới khi duyệt xong
+        (hoặc generator bị đóng).
+
+        Args:
+            batch_size (int): Số rows mỗi lần fetch từ cursor
+
+        Yields:
+            T: Từng entity
+        """
+        async with self._get_session(read_only=True, record_latency=False) as session:
+            query = select(self._model).order_by(self._model.id).execution_options(yield_per=batch_size)
+            result = await session.stream_scalars(query)
+            async for partition in result.partitions(batch_size):
+                for entity in partition:
+                    yield entity
+
     async def get_one(self, entity_id: int) -> Optional[T]:
         """
         Lấy một entity theo id.
@@ -77,39 +273,295 @@ class Repository(ABC, Generic[T]):
         Returns:
             Optional[T]: Entity hoặc None nếu không tìm thấy
         """
-        async with self._get_session() as session:
-            query = select(self._model).where(self._model.id == entity_id)
-            result = await session.scalars(query)
-            return result.first()
+        generation: Optional[int] = None
+        if self._cache:
+            cached = await self._cache.get(entity_id)
+            if cached is not None:
+                return cached
+            # Lấy trước khi đọc: nếu id bị ghi trong lúc đọc, kết quả không được cache
+            generation = self._cache.begin_read(entity_id)
+
+        try:
+            async with self._get_session(read_only=True) as session:
+                result = await session.scalars(self._statements.get_one, {ID_PARAM: entity_id})
+                entity = result.first()
+
+            if self._cache and entity is not None and not self._in_unit_of_work():
+                await self._cache.set(entity, generation)
+        finally:
+            if self._cache:
+                self._cache.end_read(entity_id)
+        return entity
 
     async def get_multiple(
         self,
         skip: int = 0,
         limit: int = 20,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> tuple[Sequence[T], int]:
         """
         Lấy danh sách entities với pagination.
 
+        Với CountStrategy.EXACT, tổng số records được tính bằng COUNT(*) dạng
+        scalar subquery trong cùng câu query lấy trang, chỉ tốn một round trip.
+
         Args:
             skip (int): Số records bỏ qua
             limit (int): Số records tối đa trả về (0 = không giới hạn)
+            count_strategy (Optional[CountStrategy]): Chiến lược đếm cho lần gọi này.
+                None = dùng chiến lược mặc định của repository.
 
         Returns:
             tuple[Sequence[T], int]: (danh sách entities, tổng số records)
         """
-        async with self._get_session() as session:
-            # Count total
-            count_query = select(self._model)
-            count_result = await session.scalars(count_query)
-            total = len(count_result.all())
+        strategy = count_strategy or self._count_strategy
+
+        async with self._get_session(read_only=True) as session:
+            if strategy == CountStrategy.ESTIMATE:
+                total = await self._estimate_count(session)
+                if total is not None:
+                    return await self._fetch_page(session, skip, limit), total
+
+            elif strategy == CountStrategy.CACHED:
+                total = self._count_cache.get()
+                if total is not None:
+                    return await self._fetch_page(session, skip, limit), total
+
+            entities, total = await self._fetch_page_with_count(session, skip, limit)
+
+            if strategy == CountStrategy.CACHED:
+                self._count_cache.set(total)
+
+            return entities, total
+
+    async def get_multiple_rows(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        skip: int = 0,
+        limit: int = 20,
+        count_strategy: Optional[CountStrategy] = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Lấy một trang rows dạng dict chỉ gồm các cột cần thiết, không tạo ORM entities.
+
+        Dùng cho các endpoints chỉ đọc: rows được đưa thẳng vào DTO (ví dụ
+        TypeAdapter(list[Dto]).validate_python(rows)), bỏ qua identity map và
+        instrumentation của ORM. Thứ tự, pagination và count giống get_multiple.
+        Rows không đi qua entity cache.
+
+        Args:
+            columns (Optional[Sequence[str]]): Tên các cột cần lấy (None = tất cả cột)
+            skip (int): Số records bỏ qua
+            limit (int): Số records tối đa trả về (0 = không giới hạn)
+            count_strategy (Optional[CountStrategy]): Chiến lược đếm cho lần gọi này.
+                None = dùng chiến lược mặc định của repository.
+
+        Returns:
+            tuple[list[dict[str, Any]], int]: (danh sách rows theo tên cột, tổng số records)
+
+        Raises:
+            ValueError: Nếu columns chứa cột không tồn tại.
+        """
+        table_columns = self._model.__table__.columns
+        names = tuple(columns) if columns is not None else tuple(table_columns.keys())
+        for name in names:
+            if name not in table_columns:
+                raise ValueError(f"Unknown column: {name}")
+
+        strategy = count_strategy or self._count_strategy
+        parameters = self._page_parameters(skip, limit)
+
+        async with self._get_session(read_only=True) as session:
+            total: Optional[int] = None
+            if strategy == CountStrategy.ESTIMATE:
+                total = await self._estimate_count(session)
+            elif strategy == CountStrategy.CACHED:
+                total = self._count_cache.get()
+
+            if total is not None:
+                query = self._statements.page_rows(names, with_count=False, limited=limit > 0)
+                rows = (await session.execute(query, parameters)).all()
+                return [dict(zip(names, row)) for row in rows], total
+
+            query = self._statements.page_rows(names, with_count=True, limited=limit > 0)
+            rows = (await session.execute(query, parameters)).all()
+            if rows:
+                total = rows[0].total
+            elif skip == 0:
+                total = 0
+            else:
+                total = await session.scalar(self._statements.count) or 0
+
+            if strategy == CountStrategy.CACHED:
+                self._count_cache.set(total)
+
+            # zip dừng ở cột cuối cùng của names, bỏ qua cột "total"
+            return [dict(zip(names, row)) for row in rows], total
+
+    async def get_page_after(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        order_by: Sequence[str] = ("id",),
+    ) -> tuple[Sequence[T], Optional[str], Optional[str]]:
+        """
+        Lấy một trang entities bằng keyset (cursor) pagination.
+
+        Thay vì OFFSET, query lọc theo giá trị các cột sắp xếp của record
+        làm mốc (WHERE (created_at, id) > (:a, :b)), nên chi phí mỗi trang
+        không phụ thuộc vào độ sâu. order_by phải xác định thứ tự duy nhất,
+        vì vậy nên kết thúc bằng "id", ví dụ ("created_at", "id").
+
+        Args:
+            cursor (Optional[str]): Cursor từ lần gọi trước (None = trang đầu)
+            limit (int): Số records tối đa trả về
+            order_by (Sequence[str]): Tên các cột sắp xếp tăng dần
 
-            # Fetch with pagination
-            query = select(self._model).order_by(self._model.id).offset(skip)
-            if limit > 0:
-                query = query.limit(limit)
+        Returns:
+            tuple[Sequence[T], Optional[str], Optional[str]]:
+                (danh sách entities, next_cursor, prev_cursor).
+                Cursor là None nếu không còn trang theo hướng đó.
 
+        Raises:
+            ValueError: Nếu order_by chứa cột không tồn tại hoặc cursor không hợp lệ.
+        """
+        order_by = tuple(order_by)
+        table_columns = self._model.__table__.columns
+        for name in order_by:
+            if name not in table_columns:
+                raise ValueError(f"Unknown order_by column: {name}")
+
+        columns = [getattr(self._model, name) for name in order_by]
+        position = None
+        if cursor:
+            python_types = [table_columns[name].type.python_type for name in order_by]
+            position = decode_cursor(cursor, order_by, python_types)
+
+        backward = position is not None and position.backward
+
+        query = select(self._model)
+        if position is not None:
+            if len(columns) == 1:
+                key, bound = columns[0], literal(position.values[0], columns[0].type)
+            else:
+                key = tuple_(*columns)
+                bound = tuple_(*[literal(value, column.type) for column, value in zip(columns, position.values)])
+            query = query.where(key < bound if backward else key > bound)
+
+        order = [column.desc() for column in columns] if backward else columns
+        # Lấy thêm 1 record để biết còn trang tiếp theo hay không
+        query = query.order_by(*order).limit(limit + 1)
+
+        async with self._get_session(read_only=True) as session:
             result = await session.scalars(query)
-            return result.all(), total
+            entities = list(result.all())
+
+        has_more = len(entities) > limit
+        entities = entities[:limit]
+        if backward:
+            entities.reverse()
+
+        has_next = True if backward else has_more
+        has_prev = has_more if backward else position is not None
+
+        next_cursor = prev_cursor = None
+        if entities and has_next:
+            next_cursor = encode_cursor(order_by, [getattr(entities[-1], name) for name in order_by])
+        if entities and has_prev:
+            prev_cursor = encode_cursor(order_by, [getattr(entities[0], name) for name in order_by], backward=True)
+
+        return entities, next_cursor, prev_cursor
+
+    def invalidate_count_cache(self) -> None:
+        """
+        Xóa count đang cache (CountStrategy.CACHED).
+
+        Gọi sau các thao tác ghi lớn nếu cần count chính xác ngay lập tức.
+        """
+        self._count_cache.invalidate()
+
+    @staticmethod
+    def _page_parameters(skip: int, limit: int) -> dict[str, int]:
+        """
+        Parameters OFFSET/LIMIT của các statements phân trang.
+
+        Args:
+            skip (int): Số records bỏ qua
+            limit (int): Số records tối đa (0 = không giới hạn)
+
+        Returns:
+            dict[str, int]: Parameters cho statement page/page_with_count
+        """
+        if limit > 0:
+            return {OFFSET_PARAM: skip, LIMIT_PARAM: limit}
+        return {OFFSET_PARAM: skip}
+
+    async def _fetch_page(self, session: AsyncSession, skip: int, limit: int) -> Sequence[T]:
+        """
+        Lấy một trang entities, không đếm tổng.
+
+        Args:
+            session (AsyncSession): Session đang dùng
+            skip (int): Số records bỏ qua
+            limit (int): Số records tối đa (0 = không giới hạn)
+
+        Returns:
+            Sequence[T]: Danh sách entities
+        """
+        query = self._statements.page if limit > 0 else self._statements.page_unlimited
+        result = await session.scalars(query, self._page_parameters(skip, limit))
+        return result.all()
+
+    async def _fetch_page_with_count(
+        self,
+        session: AsyncSession,
+        skip: int,
+        limit: int,
+    ) -> tuple[Sequence[T], int]:
+        """
+        Lấy một trang entities kèm COUNT(*) trong cùng một query.
+
+        Nếu trang rỗng (skip vượt quá số records) thì chạy thêm một
+        COUNT(*) riêng để vẫn trả về tổng chính xác.
+
+        Args:
+            session (AsyncSession): Session đang dùng
+            skip (int): Số records bỏ qua
+            limit (int): Số records tối đa (0 = không giới hạn)
+
+        Returns:
+            tuple[Sequence[T], int]: (danh sách entities, tổng số records)
+        """
+        query = self._statements.page_with_count if limit > 0 else self._statements.page_with_count_unlimited
+        rows = (await session.execute(query, self._page_parameters(skip, limit))).all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        if skip == 0:
+            return [], 0
+
+        total = await session.scalar(self._statements.count)
+        return [], total or 0
+
+    async def _estimate_count(self, session: AsyncSession) -> Optional[int]:
+        """
+        Ước lượng tổng số records từ pg_class.reltuples.
+
+        Args:
+            session (AsyncSession): Session đang dùng
+
+        Returns:
+            Optional[int]: Số records ước lượng, hoặc None nếu bảng chưa
+                được ANALYZE (reltuples < 0)
+        """
+        query = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)"
+        )
+        estimate = await session.scalar(query, {"table_name": self._model.__table__.fullname})
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
 
     async def create(self, values: dict[str, Any]) -> T:
         """
@@ -125,8 +577,10 @@ class Repository(ABC, Generic[T]):
             query = insert(self._model).values(values).returning(self._model)
             result = await session.execute(query)
             entity = result.scalar_one()
-            await session.commit()
-            return entity
+            await self._commit(session)
+
+        await self._refresh_cache(entity.id, entity)
+        return entity
 
     async def update(self, entity_id: int, values: dict[str, Any]) -> Optional[T]:
         """
@@ -140,16 +594,12 @@ class Repository(ABC, Generic[T]):
             Optional[T]: Entity đã cập nhật hoặc None nếu không tìm thấy
         """
         async with self._get_session() as session:
-            query = (
-                update(self._model)
-                .where(self._model.id == entity_id)
-                .values(values)
-                .returning(self._model)
-            )
-            result = await session.execute(query)
+            result = await session.execute(self._statements.update, {**values, ID_PARAM: entity_id})
             entity = result.scalar_one_or_none()
-            await session.commit()
-            return entity
+            await self._commit(session)
+
+        await self._refresh_cache(entity_id, entity)
+        return entity
 
     async def delete(self, entity_id: int) -> Optional[T]:
         """
@@ -162,15 +612,243 @@ class Repository(ABC, Generic[T]):
             Optional[T]: Entity đã xóa hoặc None nếu không tìm thấy
         """
         async with self._get_session() as session:
-            query = (
-                delete(self._model)
-                .where(self._model.id == entity_id)
-                .returning(self._model)
-            )
-            result = await session.execute(query)
+            result = await session.execute(self._statements.delete, {ID_PARAM: entity_id})
             entity = result.scalar_one_or_none()
-            await session.commit()
-            return entity
+            await self._commit(session)
+
+        await self.invalidate_cache(entity_id)
+        return entity
+
+    async def create_many(
+        self,
+        values_list: Sequence[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> list[int]:
+        """
+        Tạo nhiều entities bằng multi-row INSERT ... RETURNING id.
+
+        Mỗi chunk `batch_size` rows là một statement, tất cả chunks chạy
+        trong cùng một transaction. Mọi dict phải có cùng tập keys.
+
+        Args:
+            values_list (Sequence[dict[str, Any]]): Dữ liệu các entities
+            batch_size (Optional[int]): Số rows mỗi statement (None = mặc định của repository)
+
+        Returns:
+            list[int]: IDs của các entities đã tạo, theo đúng thứ tự đầu vào
+        """
+        if not values_list:
+            return []
+
+        query = insert(self._model).returning(self._model.id, sort_by_parameter_order=True)
+        return await self._execute_bulk_returning_ids(query, values_list, batch_size)
+
+    async def upsert_many(
+        self,
+        values_list: Sequence[dict[str, Any]],
+        conflict_cols: Sequence[str],
+        update_cols: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> list[int]:
+        """
+        Insert hoặc update nhiều entities bằng INSERT ... ON CONFLICT DO UPDATE.
+
+        Trong cùng một chunk, các rows không được trùng giá trị conflict_cols
+        (giới hạn của Postgres với ON CONFLICT DO UPDATE).
+
+        Args:
+            values_list (Sequence[dict[str, Any]]): Dữ liệu các entities
+            conflict_cols (Sequence[str]): Các cột của unique constraint/index dùng để phát hiện conflict
+            update_cols (Optional[Sequence[str]]): Các cột được cập nhật khi conflict.
+                None = tất cả cột trong values trừ conflict_cols và id.
+            batch_size (Optional[int]): Số rows mỗi statement (None = mặc định của repository)
+
+        Returns:
+            list[int]: IDs của các entities đã insert/update, theo đúng thứ tự đầu vào
+        """
+        if not values_list:
+            return []
+
+        if update_cols is None:
+            update_cols = [key for key in values_list[0] if key not in conflict_cols and key != "id"]
+
+        query = pg_insert(self._model)
+        # Luôn dùng DO UPDATE (kể cả khi không có cột cần cập nhật) để RETURNING
+        # trả về id của cả những rows bị conflict
+        set_columns = update_cols or conflict_cols
+        query = query.on_conflict_do_update(
+            index_elements=list(conflict_cols),
+            set_={name: query.excluded[name] for name in set_columns},
+        ).returning(self._model.id, sort_by_parameter_order=True)
+        ids = await self._execute_bulk_returning_ids(query, values_list, batch_size)
+        await self.invalidate_cache(*ids)
+        return ids
+
+    async def update_many(
+        self,
+        values_list: Sequence[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> list[int]:
+        """
+        Cập nhật nhiều entities, mỗi chunk là một UPDATE ... FROM (VALUES ...)
+        (trên dialect khác Postgres: FROM (SELECT ... UNION ALL SELECT ...)).
+
+        Mỗi dict phải chứa "id" và cùng tập cột cần cập nhật.
+
+        Args:
+            values_list (Sequence[dict[str, Any]]): Dữ liệu cập nhật, mỗi dict có key "id"
+            batch_size (Optional[int]): Số rows mỗi statement (None = mặc định của repository)
+
+        Returns:
+            list[int]: IDs đã được cập nhật, theo thứ tự đầu vào (bỏ qua id không tồn tại)
+        """
+        if not values_list:
+            return []
+
+        table = self._model.__table__
+        names = [name for name in values_list[0] if name != "id"]
+        updated: set[int] = set()
+
+        async with self._get_session() as session:
+            use_values = session.bind.dialect.name == "postgresql"
+            for chunk in _chunked(values_list, self._get_batch_size(batch_size)):
+                if use_values:
+                    data = values_clause(
+                        column("id", table.c.id.type),
+                        *[column(name, table.c[name].type) for name in names],
+                        name="data",
+                    ).data([tuple(row[name] for name in ("id", *names)) for row in chunk])
+                else:
+                    # SQLite không hỗ trợ đặt tên cột cho VALUES (AS data (id, ...))
+                    data = union_all(*[
+                        select(*[literal(row[name], table.c[name].type).label(name) for name in ("id", *names)])
+                        for row in chunk
+                    ]).subquery("data")
+                query = (
+                    update(self._model)
+                    .where(self._model.id == data.c.id)
+                    .values({name: data.c[name] for name in names})
+                    .returning(self._model.id)
+                )
+                result = await session.execute(query)
+                updated.update(result.scalars().all())
+            await self._commit(session)
+
+        await self.invalidate_cache(*updated)
+        return [row["id"] for row in values_list if row["id"] in updated]
+
+    async def delete_many(
+        self,
+        entity_ids: Sequence[int],
+        batch_size: Optional[int] = None,
+    ) -> list[int]:
+        """
+        Xóa nhiều entities theo ids, mỗi chunk là một DELETE ... WHERE id IN (...).
+
+        Args:
+            entity_ids (Sequence[int]): IDs cần xóa
+            batch_size (Optional[int]): Số ids mỗi statement (None = mặc định của repository)
+
+        Returns:
+            list[int]: IDs đã bị xóa, theo thứ tự đầu vào (bỏ qua id không tồn tại)
+        """
+        if not entity_ids:
+            return []
+
+        deleted: set[int] = set()
+        async with self._get_session() as session:
+            for chunk in _chunked(entity_ids, self._get_batch_size(batch_size)):
+                query = delete(self._model).where(self._model.id.in_(chunk)).returning(self._model.id)
+                result = await session.execute(query)
+                deleted.update(result.scalars().all())
+            await self._commit(session)
+
+        await self.invalidate_cache(*deleted)
+        return [entity_id for entity_id in entity_ids if entity_id in deleted]
+
+    async def copy_many(
+        self,
+        values_list: Sequence[dict[str, Any]],
+        columns: Sequence[str],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """
+        Nạp nhiều rows bằng COPY (asyncpg copy_records_to_table).
+
+        Nhanh nhất cho các lần nạp rất lớn, nhưng COPY không hỗ trợ RETURNING
+        nên không trả về ids. Tất cả chunks chạy trong cùng một transaction.
+
+        Args:
+            values_list (Sequence[dict[str, Any]]): Dữ liệu các rows
+            columns (Sequence[str]): Các cột cần nạp (cột không có trong values nhận NULL)
+            batch_size (Optional[int]): Số rows mỗi lệnh COPY (None = mặc định của repository)
+
+        Returns:
+            int: Số rows đã nạp
+        """
+        if not values_list:
+            return 0
+
+        table = self._model.__table__
+        async with self._get_session() as session:
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+
+            async with driver_connection.transaction():
+                for chunk in _chunked(values_list, self._get_batch_size(batch_size)):
+                    await driver_connection.copy_records_to_table(
+                        table.name,
+                        records=[tuple(row.get(name) for name in columns) for row in chunk],
+                        columns=list(columns),
+                        schema_name=table.schema,
+                    )
+            await self._commit(session)
+
+        return len(values_list)
+
+    def _get_batch_size(self, batch_size: Optional[int]) -> int:
+        """
+        Lấy batch size cho bulk operation.
+
+        Args:
+            batch_size (Optional[int]): Batch size truyền vào (None = mặc định)
+
+        Returns:
+            int: Batch size hợp lệ
+
+        Raises:
+            ValueError: Nếu batch size <= 0.
+        """
+        size = batch_size if batch_size is not None else self._bulk_batch_size
+        if size <= 0:
+            raise ValueError("Batch size must be greater than 0")
+        return size
+
+    async def _execute_bulk_returning_ids(
+        self,
+        query: Any,
+        values_list: Sequence[dict[str, Any]],
+        batch_size: Optional[int],
+    ) -> list[int]:
+        """
+        Thực thi INSERT ... RETURNING id theo từng chunk trong một transaction.
+
+        Args:
+            query (Any): INSERT statement có RETURNING id (sort_by_parameter_order=True)
+            values_list (Sequence[dict[str, Any]]): Dữ liệu các rows
+            batch_size (Optional[int]): Số rows mỗi statement
+
+        Returns:
+            list[int]: IDs theo thứ tự đầu vào
+        """
+        ids: list[int] = []
+        async with self._get_session() as session:
+            for chunk in _chunked(values_list, self._get_batch_size(batch_size)):
+                result = await session.execute(query, list(chunk))
+                ids.extend(result.scalars().all())
+            await self._commit(session)
+        return ids
 
     async def fetch_sql(
         self,
@@ -187,11 +865,38 @@ class Repository(ABC, Generic[T]):
         Returns:
             Sequence[RowMapping]: Kết quả query
         """
-        async with self._get_session() as session:
+        async with self._get_session(read_only=True) as session:
             query = text(sql)
             result = await session.execute(query, parameters or {})
             return result.mappings().all()
 
+    async def stream_sql(
+        self,
+        sql: str,
+        parameters: Optional[dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Thực thi SELECT query và duyệt kết quả bằng server-side cursor.
+
+        Args:
+            sql (str): Raw SQL query
+            parameters (Optional[dict[str, Any]]): Query parameters
+            batch_size (int): Số rows mỗi lần fetch từ cursor
+
+        Yields:
+            RowMapping: Từng row của kết quả
+        """
+        async with self._get_session(read_only=True, record_latency=False) as session:
+            result = await session.stream(
+                text(sql),
+                parameters or {},
+                execution_options={"yield_per": batch_size},
+            )
+            async for partition in result.mappings().partitions(batch_size):
+                for row in partition:
+                    yield row
+
     async def execute_sql(
         self,
         sql: str,
@@ -200,6 +905,9 @@ class Repository(ABC, Generic[T]):
         """
         Thực thi INSERT/UPDATE/DELETE query.
 
+        Entity cache không biết rows nào bị ảnh hưởng, gọi invalidate_cache
+        sau đó nếu repository có bật cache.
+
         Args:
             sql (str): Raw SQL statement
             parameters (Optional[dict[str, Any]]): Query parameters
@@ -210,5 +918,5 @@ class Repository(ABC, Generic[T]):
         async with self._get_session() as session:
             query = text(sql)
             result = await session.execute(query, parameters or {})
-            await session.commit()
+            await self._commit(session)
             return result.rowcount
@@ -0,0 +1,264 @@
+"""
+Module cung cấp read-through entity cache cho Repository.get_one.
+
+Gồm:
+- ICacheBackend: Interface backend (in-process, Redis, ...)
+- InMemoryCacheBackend: LRU + TTL trong process, có giới hạn số entries
+- EntityCache: Lưu snapshot (dict các cột) của entity theo id
+
+Cache chỉ lưu snapshot đã tách khỏi session. Mỗi lần hit tạo một instance
+mới từ bản sao snapshot, nên các request không bao giờ dùng chung một object
+ORM (kể cả với expire_on_commit=False).
+
+Read-through lấy generation của id trước khi đọc database; kết quả không
+được lưu nếu id bị ghi (set/invalidate) trong lúc đọc. Generation chỉ theo
+dõi trong process hiện tại.
+"""
+import copy
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, Type, TypeVar
+
+from sqlalchemy import inspect
+
+from src.base.database.model.base import Base
+
+
+T = TypeVar("T", bound=Base)
+
+
+@dataclass
+class CacheStats:
+    """
+    Bộ đếm của một cache backend.
+
+    Attributes:
+        hits (int): Số lần tìm thấy entry còn hạn
+        misses (int): Số lần không tìm thấy (hoặc entry đã hết hạn)
+        evictions (int): Số entries bị loại do vượt giới hạn kích thước
+        expirations (int): Số entries bị loại do hết TTL
+        discarded (int): Số kết quả read-through không được lưu vì id bị ghi trong lúc đọc
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    discarded: int = 0
+
+
+class ICacheBackend(ABC):
+    """
+    Interface cho cache backend của EntityCache.
+
+    Value là dict các giá trị cột (snapshot). Backend ngoài process
+    (ví dụ Redis) tự serialize/deserialize value.
+    """
+
+    stats: CacheStats
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Lấy value theo key.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[dict[str, Any]]: Value hoặc None nếu không có/đã hết hạn
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: dict[str, Any], ttl: Optional[float] = None) -> None:
+        """
+        Lưu value theo key.
+
+        Args:
+            key (str): Cache key
+            value (dict[str, Any]): Snapshot cần lưu
+            ttl (Optional[float]): TTL (giây), None = TTL mặc định của backend
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Xóa các keys khỏi cache.
+
+        Args:
+            *keys (str): Các cache keys
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Xóa toàn bộ cache."""
+        pass
+
+
+class InMemoryCacheBackend(ICacheBackend):
+    """
+    Cache backend LRU + TTL trong process.
+
+    Args:
+        max_size (int): Số entries tối đa, vượt quá sẽ loại entry ít dùng nhất
+        ttl (float): TTL mặc định (giây)
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: dict[str, Any], ttl: Optional[float] = None) -> None:
+        self._entries[key] = (value, time.monotonic() + (ttl if ttl is not None else self._ttl))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class EntityCache(Generic[T]):
+    """
+    Cache snapshot của entities theo id.
+
+    Args:
+        backend (ICacheBackend): Backend lưu trữ
+        db_model (Type[T]): SQLAlchemy model class
+        ttl (Optional[float]): TTL (giây) của entries, None = TTL mặc định của backend
+    """
+
+    def __init__(self, backend: ICacheBackend, db_model: Type[T], ttl: Optional[float] = None) -> None:
+        self._backend = backend
+        self._model = db_model
+        self._ttl = ttl
+        self._prefix = f"entity:{db_model.__table__.fullname}:"
+        self._column_keys = [attribute.key for attribute in inspect(db_model).column_attrs]
+        # id -> (số read-through đang chạy, generation); chỉ giữ ids đang được đọc
+        self._reads: dict[int, tuple[int, int]] = {}
+
+    @property
+    def stats(self) -> CacheStats:
+        """Bộ đếm hits/misses/evictions của backend."""
+        return self._backend.stats
+
+    async def get(self, entity_id: int) -> Optional[T]:
+        """
+        Lấy entity từ cache.
+
+        Args:
+            entity_id (int): ID của entity
+
+        Returns:
+            Optional[T]: Instance mới (transient) tạo từ snapshot, hoặc None nếu miss
+        """
+        snapshot = await self._backend.get(self._key(entity_id))
+        if snapshot is None:
+            return None
+        return self._model(**copy.deepcopy(snapshot))
+
+    def begin_read(self, entity_id: int) -> int:
+        """
+        Bắt đầu một read-through, gọi trước khi đọc database.
+
+        Mỗi lần begin_read phải có một lần end_read tương ứng.
+
+        Args:
+            entity_id (int): ID của entity
+
+        Returns:
+            int: Generation hiện tại của id, truyền vào set() sau khi đọc
+        """
+        readers, generation = self._reads.get(entity_id, (0, 0))
+        self._reads[entity_id] = (readers + 1, generation)
+        return generation
+
+    def end_read(self, entity_id: int) -> None:
+        """
+        Kết thúc một read-through đã bắt đầu bằng begin_read.
+
+        Args:
+            entity_id (int): ID của entity
+        """
+        readers, generation = self._reads[entity_id]
+        if readers > 1:
+            self._reads[entity_id] = (readers - 1, generation)
+        else:
+            del self._reads[entity_id]
+
+    async def set(self, entity: T, generation: Optional[int] = None) -> None:
+        """
+        Lưu snapshot của entity vào cache.
+
+        Args:
+            entity (T): Entity vừa đọc/ghi từ database
+            generation (Optional[int]): Generation từ begin_read nếu là read-through;
+                bỏ qua nếu id đã bị ghi từ đó. None = ghi (write-through).
+        """
+        if generation is None:
+            self._bump(entity.id)
+        elif generation != self._reads.get(entity.id, (0, 0))[1]:
+            self.stats.discarded += 1
+            return
+
+        snapshot = {key: getattr(entity, key) for key in self._column_keys}
+        await self._backend.set(self._key(entity.id), copy.deepcopy(snapshot), self._ttl)
+
+    async def invalidate(self, *entity_ids: int) -> None:
+        """
+        Xóa các entities khỏi cache.
+
+        Args:
+            *entity_ids (int): IDs cần xóa
+        """
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._bump(entity_id)
+            await self._backend.delete(*(self._key(entity_id) for entity_id in entity_ids))
+
+    def _bump(self, entity_id: int) -> None:
+        """
+        Tăng generation của id để các read-through đang chạy không lưu kết quả cũ.
+
+        Args:
+            entity_id (int): ID vừa bị ghi
+        """
+        if entity_id in self._reads:
+            readers, generation = self._reads[entity_id]
+            self._reads[entity_id] = (readers, generation + 1)
+
+    def _key(self, entity_id: int) -> str:
+        return f"{self._prefix}{entity_id}"
@@ -0,0 +1,67 @@
+"""
+Module định nghĩa các chiến lược đếm tổng số records cho Repository.
+
+Hỗ trợ:
+- EXACT: COUNT(*) chính xác, chạy chung round trip với query lấy trang
+- ESTIMATE: Ước lượng từ pg_class.reltuples (không quét bảng)
+- CACHED: COUNT(*) chính xác, cache lại kết quả trong một khoảng TTL
+"""
+import time
+from enum import Enum
+from typing import Optional
+
+
+class CountStrategy(str, Enum):
+    """
+    Chiến lược đếm tổng số records dùng trong Repository.get_multiple.
+
+    Attributes:
+        EXACT: Đếm chính xác bằng COUNT(*) trong cùng query với trang dữ liệu.
+        ESTIMATE: Ước lượng nhanh từ pg_class.reltuples, fallback về EXACT
+            nếu bảng chưa từng được ANALYZE.
+        CACHED: Đếm chính xác nhưng cache kết quả theo TTL.
+    """
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    CACHED = "cached"
+
+
+class CountCache:
+    """
+    Cache đơn giản cho tổng số records của một repository.
+
+    Args:
+        ttl (float): Thời gian sống của giá trị cache (giây).
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._value: Optional[int] = None
+        self._expires_at: float = 0.0
+
+    def get(self) -> Optional[int]:
+        """
+        Lấy giá trị count đang cache.
+
+        Returns:
+            Optional[int]: Giá trị count hoặc None nếu chưa có/đã hết hạn.
+        """
+        if self._value is None or time.monotonic() >= self._expires_at:
+            return None
+        return self._value
+
+    def set(self, value: int) -> None:
+        """
+        Lưu giá trị count vào cache.
+
+        Args:
+            value (int): Tổng số records.
+        """
+        self._value = value
+        self._expires_at = time.monotonic() + self._ttl
+
+    def invalidate(self) -> None:
+        """Xóa giá trị count đang cache."""
+        self._value = None
+        self._expires_at = 0.0
@@ -0,0 +1,86 @@
+"""
+Module encode/decode cursor cho keyset pagination.
+
+Cursor là chuỗi base64url (opaque với client) chứa:
+- Giá trị các cột sắp xếp của record làm mốc
+- Tên các cột sắp xếp (để phát hiện cursor dùng sai order_by)
+- Hướng duyệt (trang sau/trang trước)
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Sequence
+
+
+@dataclass(frozen=True)
+class CursorPosition:
+    """
+    Vị trí đã decode từ cursor.
+
+    Attributes:
+        values (tuple[Any, ...]): Giá trị các cột sắp xếp của record làm mốc
+        backward (bool): True nếu cursor trỏ về trang trước
+    """
+
+    values: tuple[Any, ...]
+    backward: bool = False
+
+
+def encode_cursor(order_by: Sequence[str], values: Sequence[Any], backward: bool = False) -> str:
+    """
+    Encode vị trí keyset thành cursor opaque.
+
+    Args:
+        order_by (Sequence[str]): Tên các cột sắp xếp
+        values (Sequence[Any]): Giá trị tương ứng của record làm mốc
+        backward (bool): True nếu cursor dùng để lấy trang trước
+
+    Returns:
+        str: Cursor dạng base64url
+    """
+    payload = {
+        "o": list(order_by),
+        "k": [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values],
+        "d": "p" if backward else "n",
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, order_by: Sequence[str], python_types: Sequence[type]) -> CursorPosition:
+    """
+    Decode cursor thành CursorPosition.
+
+    Args:
+        cursor (str): Cursor nhận từ client
+        order_by (Sequence[str]): Tên các cột sắp xếp đang dùng
+        python_types (Sequence[type]): Python type của từng cột, dùng để
+            khôi phục giá trị (ví dụ datetime từ ISO string)
+
+    Returns:
+        CursorPosition: Vị trí keyset
+
+    Raises:
+        ValueError: Nếu cursor không hợp lệ hoặc không khớp với order_by.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        columns, values, direction = payload["o"], payload["k"], payload["d"]
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError) as error:
+        raise ValueError("Invalid cursor") from error
+
+    if columns != list(order_by) or len(values) != len(order_by) or direction not in ("n", "p"):
+        raise ValueError("Cursor does not match the requested ordering")
+
+    try:
+        restored = tuple(
+            python_type.fromisoformat(value) if python_type in (date, datetime) else python_type(value)
+            for python_type, value in zip(python_types, values)
+        )
+    except (TypeError, ValueError) as error:
+        raise ValueError("Invalid cursor") from error
+
+    return CursorPosition(values=restored, backward=direction == "p")
@@ -0,0 +1,192 @@
+"""
+Module cung cấp các statements dựng sẵn cho các methods nóng của Repository.
+
+Mỗi model chỉ dựng một lần các statements của get_one, get_multiple,
+update và delete, với bind parameters thay cho giá trị. Dùng lại cùng một
+statement object giúp bỏ qua chi phí dựng construct và tính cache key của
+SQLAlchemy (cache key được memoize trên statement), SQL sinh ra luôn giống
+nhau nên compiled cache của SQLAlchemy và prepared statement cache của
+asyncpg (pool mode queue/asyncpg) luôn hit.
+
+Mỗi statement có tên (ví dụ "health_check.get_one") trong execution options;
+số lần chạy và compiled cache hit/miss theo tên được đếm trong StatementStats.
+"""
+import weakref
+from dataclasses import dataclass
+from typing import Any, ClassVar, Type, TypeVar
+
+from sqlalchemy import Delete, Select, Update, bindparam, delete, event, func, select, update
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.engine.interfaces import CacheStats as CompiledCacheStatus
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.base.database.model.base import Base
+
+
+S = TypeVar("S", Select, Update, Delete)
+
+# Tên bind parameters, có tiền tố "_" để không trùng tên cột trong SET của update
+ID_PARAM = "_pk"
+OFFSET_PARAM = "_offset"
+LIMIT_PARAM = "_limit"
+
+_STATEMENT_OPTION = "repository_statement"
+
+
+@dataclass
+class StatementStats:
+    """
+    Bộ đếm của một statement dựng sẵn.
+
+    Attributes:
+        executions (int): Số lần thực thi
+        cache_hits (int): Số lần dùng lại bản compile trong compiled cache của SQLAlchemy
+        cache_misses (int): Số lần phải compile (lần đầu, hoặc tập parameters mới)
+    """
+
+    executions: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+class RepositoryStatements:
+    """
+    Các statements dựng sẵn của một model, dùng chung giữa các Repository.
+
+    Lấy instance qua for_model(); các statements nhận parameters qua
+    ID_PARAM, OFFSET_PARAM và LIMIT_PARAM.
+
+    Args:
+        db_model (Type[Base]): SQLAlchemy model class
+    """
+
+    _by_model: ClassVar[dict[Type[Base], "RepositoryStatements"]] = {}
+    _instrumented: ClassVar[weakref.WeakSet] = weakref.WeakSet()
+    # Dùng chung giữa các models, key là tên statement
+    stats: ClassVar[dict[str, StatementStats]] = {}
+
+    def __init__(self, db_model: Type[Base]) -> None:
+        model: Any = db_model
+        prefix = db_model.__table__.fullname
+        self._model = model
+        self._prefix = prefix
+        self._row_statements: dict[tuple[tuple[str, ...], bool, bool], Select] = {}
+        total_column = select(func.count()).select_from(model).scalar_subquery().label("total")
+
+        self.get_one = self._named(f"{prefix}.get_one", select(model).where(model.id == bindparam(ID_PARAM)))
+        self.count = self._named(f"{prefix}.count", select(func.count()).select_from(model))
+        self.page = self._named(
+            f"{prefix}.page",
+            select(model).order_by(model.id).offset(bindparam(OFFSET_PARAM)).limit(bindparam(LIMIT_PARAM)),
+        )
+        self.page_unlimited = self._named(
+            f"{prefix}.page_unlimited",
+            select(model).order_by(model.id).offset(bindparam(OFFSET_PARAM)),
+        )
+        self.page_with_count = self._named(
+            f"{prefix}.page_with_count",
+            select(model, total_column)
+            .order_by(model.id)
+            .offset(bindparam(OFFSET_PARAM))
+            .limit(bindparam(LIMIT_PARAM)),
+        )
+        self.page_with_count_unlimited = self._named(
+            f"{prefix}.page_with_count_unlimited",
+            select(model, total_column).order_by(model.id).offset(bindparam(OFFSET_PARAM)),
+        )
+        # Cột cần SET được truyền cùng parameters khi thực thi
+        self.update = self._named(
+            f"{prefix}.update",
+            update(model).where(model.id == bindparam(ID_PARAM)).returning(model),
+        )
+        self.delete = self._named(
+            f"{prefix}.delete",
+            delete(model).where(model.id == bindparam(ID_PARAM)).returning(model),
+        )
+
+    def page_rows(self, columns: tuple[str, ...], with_count: bool, limited: bool) -> Select:
+        """
+        Statement phân trang chỉ lấy một số cột (dựng một lần cho mỗi tổ hợp).
+
+        Args:
+            columns (tuple[str, ...]): Tên các cột cần lấy
+            with_count (bool): Thêm cột "total" (COUNT(*) dạng scalar subquery) ở cuối
+            limited (bool): Có LIMIT (LIMIT_PARAM) hay không
+
+        Returns:
+            Select: Statement nhận OFFSET_PARAM (và LIMIT_PARAM nếu limited)
+        """
+        key = (columns, with_count, limited)
+        statement = self._row_statements.get(key)
+        if statement is None:
+            table_columns = self._model.__table__.columns
+            selected: list[Any] = [table_columns[name] for name in columns]
+            if with_count:
+                selected.append(select(func.count()).select_from(self._model).scalar_subquery().label("total"))
+            query = select(*selected).order_by(self._model.id).offset(bindparam(OFFSET_PARAM))
+            if limited:
+                query = query.limit(bindparam(LIMIT_PARAM))
+            name = f"{self._prefix}.page_rows({','.join(columns)}){'+count' if with_count else ''}"
+            statement = self._row_statements[key] = self._named(name, query)
+        return statement
+
+    @classmethod
+    def for_model(cls, db_model: Type[Base]) -> "RepositoryStatements":
+        """
+        Lấy (hoặc dựng lần đầu) statements của một model.
+
+        Args:
+            db_model (Type[Base]): SQLAlchemy model class
+
+        Returns:
+            RepositoryStatements: Statements của model
+        """
+        statements = cls._by_model.get(db_model)
+        if statements is None:
+            statements = cls._by_model[db_model] = cls(db_model)
+        return statements
+
+    @classmethod
+    def instrument(cls, engine: AsyncEngine) -> None:
+        """
+        Gắn event đếm StatementStats vào engine (mỗi engine một lần).
+
+        Args:
+            engine (AsyncEngine): Engine mà Repository dùng
+        """
+        sync_engine = engine.sync_engine
+        if sync_engine in cls._instrumented:
+            return
+        cls._instrumented.add(sync_engine)
+        event.listen(sync_engine, "after_cursor_execute", _record_statement)
+
+    @classmethod
+    def _named(cls, name: str, statement: S) -> S:
+        """
+        Gắn tên vào statement và tạo bộ đếm cho tên đó.
+
+        Args:
+            name (str): Tên statement
+            statement (S): Statement
+
+        Returns:
+            S: Statement có execution option repository_statement
+        """
+        cls.stats.setdefault(name, StatementStats())
+        return statement.execution_options(**{_STATEMENT_OPTION: name})
+
+
+def _record_statement(
+    conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+) -> None:
+    """Cập nhật StatementStats sau mỗi lần thực thi một statement dựng sẵn."""
+    name = context.execution_options.get(_STATEMENT_OPTION)
+    if name is None:
+        return
+    stats = RepositoryStatements.stats[name]
+    stats.executions += 1
+    cache_hit = getattr(context, "cache_hit", None)
+    if cache_hit == CompiledCacheStatus.CACHE_HIT:
+        stats.cache_hits += 1
+    elif cache_hit == CompiledCacheStatus.CACHE_MISS:
+        stats.cache_misses += 1
@@ -0,0 +1,109 @@
+"""
+Module cung cấp unit-of-work: một session/transaction dùng chung cho nhiều
+Repository calls trong cùng một context (thường là một request).
+
+Trong `async with unit_of_work(engine)`, mọi Repository có primary engine là
+`engine` tự động dùng chung session hiện tại (qua contextvar) thay vì mở
+session riêng, nên cả chuỗi thao tác chỉ dùng một connection và một transaction.
+Unit-of-work lồng nhau tạo SAVEPOINT trên cùng session.
+
+after_commit() đăng ký callback chạy sau khi transaction của unit-of-work
+commit thành công (ví dụ invalidate cache), để không ai đọc lại được dữ liệu
+chưa commit rồi cache nó.
+"""
+import inspect
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Optional, Union
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+
+_current_session: ContextVar[Optional[AsyncSession]] = ContextVar("db_unit_of_work_session", default=None)
+
+_AFTER_COMMIT_KEY = "unit_of_work_after_commit"
+
+AfterCommitCallback = Callable[[], Union[None, Awaitable[None]]]
+
+
+def current_session() -> Optional[AsyncSession]:
+    """
+    Lấy session của unit-of-work đang mở trong context hiện tại.
+
+    Returns:
+        Optional[AsyncSession]: Session đang dùng chung, hoặc None nếu không có unit-of-work.
+    """
+    return _current_session.get()
+
+
+@asynccontextmanager
+async def unit_of_work(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    """
+    Mở unit-of-work trên engine, commit khi thoát bình thường, rollback khi có exception.
+
+    Nếu đã có unit-of-work trong context hiện tại, lời gọi lồng nhau dùng lại
+    session đó và mở một SAVEPOINT: exception bên trong chỉ rollback về savepoint.
+
+    Args:
+        engine (AsyncEngine): Engine (primary) của transaction
+
+    Yields:
+        AsyncSession: Session dùng chung cho các Repository calls
+
+    Example:
+        >>> async with unit_of_work(engine):
+        ...     entity = await repository.create({...})
+        ...     await repository.update(entity.id, {...})  # cùng connection, cùng transaction
+    """
+    session = _current_session.get()
+    if session is not None:
+        async with session.begin_nested():
+            yield session
+        return
+
+    session = AsyncSession(bind=engine, autoflush=False, expire_on_commit=False)
+    callbacks: list[AfterCommitCallback] = []
+    session.info[_AFTER_COMMIT_KEY] = callbacks
+    token = _current_session.set(session)
+    try:
+        async with session.begin():
+            yield session
+    finally:
+        _current_session.reset(token)
+        await session.close()
+
+    # Chỉ tới đây khi commit thành công; rollback bỏ qua các callbacks
+    for callback in callbacks:
+        result = callback()
+        if inspect.isawaitable(result):
+            await result
+
+
+def after_commit(callback: AfterCommitCallback) -> None:
+    """
+    Chạy callback sau khi unit-of-work hiện tại commit thành công.
+
+    Ngoài unit-of-work (Repository đã tự commit), callback chạy ngay. Callback
+    đăng ký trong SAVEPOINT vẫn chạy khi transaction ngoài cùng commit, kể cả
+    nếu savepoint đó đã rollback. Callback async (trả về awaitable) chỉ dùng
+    được trong unit-of-work.
+
+    Args:
+        callback (AfterCommitCallback): Hàm không tham số, ví dụ invalidate cache
+
+    Raises:
+        RuntimeError: Nếu callback async được gọi ngoài unit-of-work.
+
+    Example:
+        >>> await repository.create({...})
+        ... after_commit(lambda: response_cache.invalidate_tags("items"))
+    """
+    session = _current_session.get()
+    if session is None:
+        result = callback()
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+            raise RuntimeError("Async after_commit callbacks need an open unit of work")
+        return
+    session.info[_AFTER_COMMIT_KEY].append(callback)
@@ -2,12 +2,15 @@
 Module cung cấp dependency injection utilities cho FastAPI.
 Cho phép inject dependencies từ request.state vào routers.
 """
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi import Request, params
 from starlette import datastructures
 from typing_extensions import Annotated, Doc
 
+from src.base.database.unit_of_work import unit_of_work
+from src.base.engine_group import read_your_writes
+
 
 def Injects(  # noqa: N802
     dependency: Annotated[
@@ -108,3 +111,80 @@ def InjectState(  # noqa: N802
         return request.state
 
     return params.Depends(dependency=_inject_state, use_cache=use_cache)
+
+
+def ReadYourWrites(  # noqa: N802
+    seconds: Annotated[
+        float,
+        Doc("How long reads stay on the primary after a write in the same request. 0 disables it."),
+    ],
+) -> Any:
+    """
+    Cấu hình khoảng read-your-writes cho request hiện tại.
+
+    Sau khi request ghi dữ liệu qua Repository, các query đọc tiếp theo
+    trong cùng request được gửi tới primary thay vì replica trong
+    khoảng `seconds` giây.
+
+    Args:
+        seconds (float): Số giây đọc từ primary sau một thao tác ghi.
+
+    Returns:
+        Any: FastAPI dependency.
+
+    Example:
+        >>> @router.post("/users", dependencies=[ReadYourWrites(5.0)])
+        ... async def create_user(user_service: UserService = Injects("user_service")):
+        ...     return await user_service.create_and_reload()
+    """
+
+    # Async generator để chạy trong cùng context với endpoint (sync generator
+    # sẽ chạy trong threadpool và contextvar không được truyền lại)
+    async def _read_your_writes() -> AsyncIterator[None]:
+        with read_your_writes(seconds):
+            yield
+
+    return params.Depends(dependency=_read_your_writes, use_cache=False)
+
+
+def UnitOfWork(  # noqa: N802
+    engine: Annotated[
+        str,
+        Doc("The name of the AsyncEngine, defined in State, that the unit-of-work runs on."),
+    ] = "db_engine",
+) -> Any:
+    """
+    Mở một unit-of-work cho toàn bộ request.
+
+    Mọi Repository call trong request (trên cùng engine) dùng chung một
+    session và một transaction: commit khi endpoint trả về bình thường,
+    rollback khi có exception. Commit/rollback xong trước khi response được
+    gửi, nên lỗi khi commit được trả về client (5xx) thay vì bị bỏ qua.
+
+    Args:
+        engine (str): Tên của AsyncEngine trong State. Mặc định "db_engine".
+
+    Returns:
+        Any: FastAPI dependency trả về AsyncSession của unit-of-work.
+
+    Raises:
+        RuntimeError: Nếu engine không tồn tại trong state.
+
+    Example:
+        >>> @router.post("/orders", dependencies=[UnitOfWork()])
+        ... async def create_order(order_service: OrderService = Injects("order_service")):
+        ...     return await order_service.create()  # nhiều repository calls, một transaction
+    """
+
+    async def _unit_of_work(request: Request) -> AsyncIterator[Any]:
+        db_engine = getattr(request.state, engine, None)
+        if db_engine is None:
+            raise RuntimeError(
+                f"Engine '{engine}' not found in request.state. "
+                f"Ensure it is returned by AppInitializer.__aenter__."
+            )
+        async with unit_of_work(db_engine) as session:
+            yield session
+
+    # scope="function": thoát dependency (commit) ngay sau endpoint, trước khi gửi response
+    return params.Depends(dependency=_unit_of_work, use_cache=True, scope="function")
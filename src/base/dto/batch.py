@@ -0,0 +1,71 @@
+"""
+Module cung cấp helpers validate/serialize cả danh sách DTOs trong một lần gọi pydantic-core.
+
+- validate_many: rows (dict hoặc object với from_attributes) -> list DTO, qua
+  TypeAdapter(list[DTO]) được cache theo DTO class
+- validate_many(..., strict=True): rows đã đúng kiểu (ví dụ get_multiple_rows),
+  validate ở strict mode, không coerce lại giá trị
+- dump_many_json: list DTO -> JSON bytes (by_alias=True như FastAPI)
+"""
+import functools
+from typing import Any, Iterable, Sequence, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@functools.lru_cache(maxsize=None)
+def list_adapter(dto: Type[M]) -> TypeAdapter[list[M]]:
+    """
+    TypeAdapter(list[dto]), dựng một lần cho mỗi DTO class.
+
+    Args:
+        dto (Type[M]): DTO class
+
+    Returns:
+        TypeAdapter[list[M]]: Adapter của list[dto]
+    """
+    return TypeAdapter(list[dto])  # type: ignore[valid-type]
+
+
+def validate_many(dto: Type[M], rows: Iterable[Any], strict: bool = False) -> list[M]:
+    """
+    Dựng danh sách DTOs từ rows trong một lần gọi pydantic-core.
+
+    Với strict=True, rows phải có giá trị đã đúng kiểu của DTO, ví dụ rows đọc từ
+    database qua get_multiple_rows: validation vẫn chạy nhưng ở strict mode, chỉ
+    kiểm tra kiểu mà không coerce/parse lại giá trị (validators của DTO vẫn chạy),
+    nên từ chối những giá trị mà mode mặc định chấp nhận (ví dụ "1" cho int).
+    Dựng DTOs bằng vòng lặp Python (model_construct) chậm hơn validate trong
+    pydantic-core.
+
+    Args:
+        dto (Type[M]): DTO class
+        rows (Iterable[Any]): Dicts hoặc objects (ORM entities với from_attributes)
+        strict (bool): Validate ở strict mode, không coerce giá trị
+
+    Returns:
+        list[M]: Danh sách DTOs theo thứ tự rows
+
+    Raises:
+        ValidationError: Nếu row không hợp lệ (với strict=True: sai kiểu)
+    """
+    if not isinstance(rows, Sequence):
+        rows = list(rows)
+    return list_adapter(dto).validate_python(rows, strict=strict or None)
+
+
+def dump_many_json(dto: Type[M], items: Sequence[M]) -> bytes:
+    """
+    Serialize danh sách DTOs thành JSON array trong một lần gọi pydantic-core.
+
+    Args:
+        dto (Type[M]): DTO class
+        items (Sequence[M]): Danh sách DTOs
+
+    Returns:
+        bytes: JSON array, field theo alias (camelCase)
+    """
+    return list_adapter(dto).dump_json(items, by_alias=True)
@@ -2,6 +2,8 @@
 Module định nghĩa base DTOs cho API requests và responses.
 Cung cấp cấu hình chung và pagination support.
 """
+from typing import Optional
+
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from humps import camelize
 from fastapi import Query
@@ -114,6 +116,61 @@ class PaginatedRequestBase(RequestBase):
         """
         return cls(target_page=target_page, page_size=page_size)
 
+class CursorPaginatedRequestBase(RequestBase):
+    """
+    Base class cho request DTOs dùng keyset (cursor) pagination.
+
+    Attributes:
+        cursor (Optional[str]): Cursor opaque từ response trước (None = trang đầu).
+        page_size (int): Số items mỗi trang (1-100).
+    """
+
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor returned as nextCursor/prevCursor"
+    )
+    page_size: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Number of items per page"
+    )
+
+    @classmethod
+    def as_query(
+        cls,
+        cursor: Optional[str] = Query(
+            default=None,
+            alias="cursor",
+            description="Opaque cursor returned as nextCursor/prevCursor"
+        ),
+        page_size: int = Query(
+            default=10,
+            alias="pageSize",
+            ge=1,
+            le=100,
+            description="Number of items per page"
+        )
+    ) -> "CursorPaginatedRequestBase":
+        """
+        Tạo instance từ query parameters.
+
+        Args:
+            cursor (Optional[str]): Cursor từ query param 'cursor'.
+            page_size (int): Số items từ query param 'pageSize'.
+
+        Returns:
+            CursorPaginatedRequestBase: Instance với cursor pagination params.
+
+        Example:
+            >>> @router.get("/items/cursor")
+            ... async def get_items(
+            ...     pagination: CursorPaginatedRequestBase = Depends(CursorPaginatedRequestBase.as_query)
+            ... ):
+            ...     return await service.get_page(pagination.cursor, pagination.page_size)
+        """
+        return cls(cursor=cursor, page_size=page_size)
+
 class ResponseBase(BaseModel):
     """
     Base class cho tất cả response DTOs.
@@ -150,3 +207,18 @@ class PaginatedResponseBase(ResponseBase):
     current_page: int
     total_pages: int
     page_size: int
+
+
+class CursorPaginatedResponseBase(ResponseBase):
+    """
+    Base class cho response DTOs dùng keyset (cursor) pagination.
+
+    Attributes:
+        next_cursor (Optional[str]): Cursor lấy trang sau (None nếu là trang cuối).
+        prev_cursor (Optional[str]): Cursor lấy trang trước (None nếu là trang đầu).
+        page_size (int): Số items mỗi trang.
+    """
+
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    page_size: int
@@ -1,13 +1,42 @@
+import asyncio
+import logging
+import time
+from enum import Enum
 from threading import Lock
 from types import TracebackType
 from typing import Dict, Optional, Type
 from uuid import uuid4
 
 from asyncpg import Connection # type: ignore[import]
-from sqlalchemy import NullPool
+from sqlalchemy import AsyncAdaptedQueuePool, NullPool, text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
-from src.config import Config
+from src.base.database.query_stats import instrument_queries
+from src.base.engine_group import EngineGroup, ReplicaStrategy
+from src.base.metrics.database import instrument_engine
+from src.config import Config, ConfigInvalidValueError
+
+
+logger = logging.getLogger("app")
+
+
+class PoolMode(str, Enum):
+    """
+    Chế độ connection pooling của một engine, đọc từ <<database_identifier>>_POOL_MODE.
+
+    Attributes:
+        NONE: NullPool, tắt mọi statement cache. Dùng khi đứng sau pgbouncer
+            với pool_mode "transaction"/"statement".
+        QUEUE: AsyncAdaptedQueuePool, giữ connection giữa các request và bật lại
+            prepared statement cache với kích thước mặc định.
+        ASYNCPG: Như QUEUE nhưng kích thước statement cache của asyncpg và
+            prepared statement cache của SQLAlchemy đọc từ config, dành cho
+            kết nối trực tiếp tới Postgres với nhiều statement nóng.
+    """
+
+    NONE = "none"
+    QUEUE = "queue"
+    ASYNCPG = "asyncpg"
 
 
 class EngineFactory:
@@ -51,6 +80,8 @@ class EngineFactory:
         self._config = config
         self._engine_init_lock: Lock = Lock()
         self._engines: Dict[str, AsyncEngine] = {}
+        self._pool_modes: Dict[str, PoolMode] = {}
+        self._engine_groups: Dict[str, EngineGroup] = {}
 
     async def __aenter__(self) -> "EngineFactory":
         return self
@@ -64,18 +95,126 @@ class EngineFactory:
     def create_engine(self, database_identifier: str) -> AsyncEngine:
         with self._engine_init_lock:
             if database_identifier not in self._engines:
-                self._engines[database_identifier] = self._create_no_pool_engine(database_identifier.upper())
+                self._engines[database_identifier] = self._create_engine(database_identifier.upper())
 
         return self._engines[database_identifier]
 
-    def _create_no_pool_engine(self, database_identifier: str) -> AsyncEngine:
-        db_host = self._config.require_config(f"{database_identifier}_HOST")
-        db_port = self._config.require_config(f"{database_identifier}_PORT")
+    def create_engine_group(self, database_identifier: str) -> EngineGroup:
+        """
+        Returns the primary engine of the identifier together with one engine per read replica.
+        Without <<database_identifier>>_REPLICA_HOSTS the group only holds the primary engine.
+        """
+        primary = self.create_engine(database_identifier)
+        identifier = database_identifier.upper()
+
+        with self._engine_init_lock:
+            if identifier not in self._engine_groups:
+                replicas = []
+                for replica_host in self._config.get_list(f"{identifier}_REPLICA_HOSTS", ",", []):
+                    replica_host = replica_host.strip()
+                    host, _, port = replica_host.partition(":")
+                    if not host:
+                        continue
+                    replica_key = f"{identifier}@{replica_host}"
+                    if replica_key not in self._engines:
+                        self._engines[replica_key] = self._create_engine(identifier, host=host, port=port or None)
+                    replicas.append(self._engines[replica_key])
+
+                self._engine_groups[identifier] = EngineGroup(
+                    primary=primary,
+                    replicas=replicas,
+                    strategy=self._get_replica_strategy(identifier),
+                    sticky_seconds=self._config.get_float(f"{identifier}_REPLICA_STICKY_SECONDS", 0.0),
+                )
+                logger.info(f"Database engine group {identifier} created with {len(replicas)} replica(s)")
+
+        return self._engine_groups[identifier]
+
+    def get_pool_mode(self, database_identifier: str) -> PoolMode:
+        """
+        Returns the pool mode used by an engine already created by this factory.
+        """
+        return self._pool_modes[database_identifier.upper()]
+
+    async def warmup(self, connections: int = 1) -> None:
+        """
+        Opens and tests connections of every engine (primary and replicas) created so far.
+
+        With a pooled engine up to `connections` connections are opened concurrently and
+        kept in the pool; with NullPool they are closed again, but the dialect is still
+        initialized by the first connect. Failures are logged and do not stop other engines.
+        """
+
+        async def ping(engine: AsyncEngine) -> None:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        async def warm(name: str, engine: AsyncEngine) -> None:
+            started = time.perf_counter()
+            await asyncio.gather(*(ping(engine) for _ in range(max(connections, 1))))
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.info(f"Database engine {name} warmed up with {max(connections, 1)} connection(s) in {elapsed_ms:.1f} ms")
+
+        engines = list(self._engines.items())
+        results = await asyncio.gather(*(warm(name, engine) for name, engine in engines), return_exceptions=True)
+        for (name, _), result in zip(engines, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to warm up database engine {name}: {result!r}")
+
+    def _create_engine(
+        self, database_identifier: str, host: Optional[str] = None, port: Optional[str] = None
+    ) -> AsyncEngine:
+        pool_mode = self._get_pool_mode(database_identifier)
+        self._pool_modes[database_identifier] = pool_mode
+        url = self._get_url(database_identifier, host=host, port=port)
+
+        if pool_mode == PoolMode.NONE:
+            engine = self._create_no_pool_engine(url)
+        else:
+            engine = self._create_pooled_engine(database_identifier, url, pool_mode)
+
+        engine_name = f"{database_identifier}@{host}" if host else database_identifier
+        instrument_queries(
+            engine,
+            name=engine_name,
+            slow_query_ms=self._config.get_float(f"{database_identifier}_SLOW_QUERY_MS", 500.0),
+        )
+        if self._config.get_bool("METRICS_ENABLED", True):
+            instrument_engine(engine, name=engine_name)
+
+        target = f"{database_identifier} replica {host}" if host else database_identifier
+        logger.info(f"Database engine {target} created with pool mode '{pool_mode.value}'")
+        return engine
+
+    def _get_pool_mode(self, database_identifier: str) -> PoolMode:
+        value = self._config.get_config(f"{database_identifier}_POOL_MODE", PoolMode.NONE.value)
+        try:
+            return PoolMode(value.lower())
+        except ValueError as error:
+            raise ConfigInvalidValueError(
+                f"value of {database_identifier}_POOL_MODE is not valid pool mode: '{value}'"
+            ) from error
+
+    def _get_replica_strategy(self, database_identifier: str) -> ReplicaStrategy:
+        value = self._config.get_config(
+            f"{database_identifier}_REPLICA_STRATEGY", ReplicaStrategy.ROUND_ROBIN.value
+        )
+        try:
+            return ReplicaStrategy(value.lower())
+        except ValueError as error:
+            raise ConfigInvalidValueError(
+                f"value of {database_identifier}_REPLICA_STRATEGY is not valid replica strategy: '{value}'"
+            ) from error
+
+    def _get_url(self, database_identifier: str, host: Optional[str] = None, port: Optional[str] = None) -> str:
+        db_host = host or self._config.require_config(f"{database_identifier}_HOST")
+        db_port = port or self._config.require_config(f"{database_identifier}_PORT")
         db_name = self._config.require_config(f"{database_identifier}_NAME")
         db_user = self._config.require_config(f"{database_identifier}_USER")
         db_password = self._config.require_config(f"{database_identifier}_PASSWORD")
-        url = f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+        return f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
 
+    def _create_no_pool_engine(self, url: str) -> AsyncEngine:
         # Data-platform configure DBs in a way that services can't have connection pools,
         # since connections are closed and returned as soon as the query is completed.
         # We should not allow any pooling nor caching in our engine otherwise we will see
@@ -93,6 +232,31 @@ class EngineFactory:
             },
         )
 
+    def _create_pooled_engine(self, database_identifier: str, url: str, pool_mode: PoolMode) -> AsyncEngine:
+        # Direct connections to Postgres keep a session per pooled connection, so prepared
+        # statements are safe again: the asyncpg/SQLAlchemy caches stay enabled and the
+        # _CConnection unique-name hack is not needed.
+        connect_args: dict = {"server_settings": {"application_name": "test"}}
+        if pool_mode == PoolMode.ASYNCPG:
+            connect_args["statement_cache_size"] = self._config.get_int(
+                f"{database_identifier}_STATEMENT_CACHE_SIZE", 100
+            )
+            connect_args["prepared_statement_cache_size"] = self._config.get_int(
+                f"{database_identifier}_PREPARED_STATEMENT_CACHE_SIZE", 500
+            )
+
+        return create_async_engine(
+            url=url,
+            echo=False,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=self._config.get_int(f"{database_identifier}_POOL_SIZE", 5),
+            max_overflow=self._config.get_int(f"{database_identifier}_POOL_MAX_OVERFLOW", 10),
+            pool_recycle=self._config.get_int(f"{database_identifier}_POOL_RECYCLE", 1800),
+            pool_pre_ping=self._config.get_bool(f"{database_identifier}_POOL_PRE_PING", True),
+            pool_timeout=self._config.get_float(f"{database_identifier}_POOL_TIMEOUT", 30.0),
+            connect_args=connect_args,
+        )
+
 
 # Necessary hack to handle data-platform no pooling configuration,
 # see https://github.com/sqlalchemy/sqlalchemy/issues/6467#issuecomment-864943824
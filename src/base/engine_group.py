@@ -0,0 +1,141 @@
+"""
+Module định nghĩa EngineGroup: một primary engine và N read-replica engines.
+
+Repository dùng EngineGroup để gửi query đọc tới replicas và query ghi tới
+primary. Sau một thao tác ghi, các query đọc trong cùng request (context) được
+giữ lại ở primary trong một khoảng "read-your-writes" để không đọc phải dữ liệu
+replica chưa kịp đồng bộ.
+"""
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Iterator, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+# Khoảng stickiness (giây) cấu hình riêng cho request hiện tại, None = dùng mặc định của group
+_sticky_window: ContextVar[Optional[float]] = ContextVar("db_sticky_window", default=None)
+# Thời điểm (monotonic) hết read-your-writes của từng group trong context hiện tại.
+# Dict không bị sửa tại chỗ (mỗi lần ghi set dict mới), nên context khác không thấy thay đổi.
+_sticky_until: ContextVar[Optional[dict["EngineGroup", float]]] = ContextVar("db_sticky_until", default=None)
+
+
+class ReplicaStrategy(str, Enum):
+    """
+    Chiến lược chọn replica cho query đọc.
+
+    Attributes:
+        ROUND_ROBIN: Lần lượt từng replica.
+        LEAST_LATENCY: Replica có latency trung bình (EWMA) thấp nhất.
+    """
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_LATENCY = "least_latency"
+
+
+class EngineGroup:
+    """
+    Nhóm engine gồm primary và các read replicas của cùng một database.
+
+    Args:
+        primary (AsyncEngine): Engine ghi (và đọc khi không có replica).
+        replicas (Sequence[AsyncEngine]): Các engine chỉ đọc.
+        strategy (ReplicaStrategy): Chiến lược chọn replica.
+        sticky_seconds (float): Sau một thao tác ghi, số giây các query đọc
+            trong cùng context được gửi tới primary. 0 = tắt.
+    """
+
+    # Trọng số của sample mới trong latency EWMA
+    _LATENCY_ALPHA = 0.2
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        strategy: ReplicaStrategy = ReplicaStrategy.ROUND_ROBIN,
+        sticky_seconds: float = 0.0,
+    ) -> None:
+        self._primary = primary
+        self._replicas = list(replicas)
+        self._strategy = strategy
+        self._sticky_seconds = sticky_seconds
+        self._round_robin = itertools.cycle(self._replicas) if self._replicas else None
+        self._latencies: dict[int, float] = {id(engine): 0.0 for engine in self._replicas}
+
+    @property
+    def primary(self) -> AsyncEngine:
+        """Engine primary."""
+        return self._primary
+
+    @property
+    def replicas(self) -> list[AsyncEngine]:
+        """Danh sách replica engines."""
+        return list(self._replicas)
+
+    def reader(self) -> AsyncEngine:
+        """
+        Chọn engine cho một query đọc.
+
+        Returns:
+            AsyncEngine: Primary nếu không có replica hoặc đang trong khoảng
+                read-your-writes, ngược lại là replica theo strategy.
+        """
+        if not self._replicas or time.monotonic() < (_sticky_until.get() or {}).get(self, 0.0):
+            return self._primary
+
+        if self._strategy == ReplicaStrategy.LEAST_LATENCY:
+            return min(self._replicas, key=lambda engine: self._latencies[id(engine)])
+
+        return next(self._round_robin)  # type: ignore[arg-type]
+
+    def mark_write(self) -> None:
+        """
+        Ghi nhận một thao tác ghi trong context hiện tại.
+
+        Các query đọc tiếp theo trong cùng context sẽ đi tới primary
+        trong khoảng stickiness.
+        """
+        window = _sticky_window.get()
+        if window is None:
+            window = self._sticky_seconds
+        if window > 0:
+            _sticky_until.set({**(_sticky_until.get() or {}), self: time.monotonic() + window})
+
+    def record_latency(self, engine: AsyncEngine, seconds: float) -> None:
+        """
+        Cập nhật latency EWMA của một replica.
+
+        Args:
+            engine (AsyncEngine): Replica vừa phục vụ query
+            seconds (float): Thời gian thực thi (giây)
+        """
+        key = id(engine)
+        if key not in self._latencies:
+            return
+        previous = self._latencies[key]
+        self._latencies[key] = seconds if previous == 0.0 else (
+            self._LATENCY_ALPHA * seconds + (1 - self._LATENCY_ALPHA) * previous
+        )
+
+
+@contextmanager
+def read_your_writes(seconds: float) -> Iterator[None]:
+    """
+    Cấu hình khoảng read-your-writes cho context hiện tại (thường là một request).
+
+    Args:
+        seconds (float): Số giây đọc từ primary sau một thao tác ghi. 0 = tắt.
+
+    Example:
+        >>> with read_your_writes(5.0):
+        ...     await repository.create({...})
+        ...     await repository.get_multiple()  # đọc từ primary
+    """
+    token = _sticky_window.set(seconds)
+    try:
+        yield
+    finally:
+        _sticky_window.reset(token)
@@ -6,7 +6,8 @@ from http import HTTPStatus
 from typing import Any, Type
 
 from pydantic import BaseModel
-from starlette.responses import JSONResponse
+
+from src.base.response.json import FastJSONResponse
 
 
 class RestException(BaseModel):
@@ -80,14 +81,16 @@ class HTTPException(Exception):
         assert hasattr(self, "status"), "http_status_not_defined"
         self.payload: BaseModel = self.model(**payload_args)
 
-    def get_body(self) -> JSONResponse:
+    def get_body(self) -> FastJSONResponse:
         """
-        Chuyển đổi exception thành JSONResponse.
+        Chuyển đổi exception thành JSON response.
+
+        Payload được serialize trực tiếp (by_alias=True, khớp với schema trong OpenAPI).
 
         Returns:
-            JSONResponse: Response với payload và status code tương ứng.
+            FastJSONResponse: Response với payload và status code tương ứng.
         """
-        return JSONResponse(self.payload.dict(), status_code=self.status, headers=None)
+        return FastJSONResponse(self.payload, status_code=self.status)
 
     @classmethod
     def get_description(cls) -> dict[int | str, dict[str, Any]]:
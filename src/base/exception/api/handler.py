@@ -8,9 +8,10 @@ from http import HTTPStatus
 from typing import Any, Type, Union
 
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import Response
 
 from src.base.exception.api.base import HTTPException
+from src.base.response.json import FastJSONResponse
 
 
 async def rest_exception_handler(_: Request, exc: HTTPException) -> Response:
@@ -22,12 +23,12 @@ async def rest_exception_handler(_: Request, exc: HTTPException) -> Response:
         exc (HTTPException): HTTPException instance
 
     Returns:
-        Response: JSONResponse with proper status code and payload
+        Response: FastJSONResponse with proper status code and payload
     """
     return exc.get_body()
 
 
-async def value_error_handler(_: Request, exc: ValueError) -> JSONResponse:
+async def value_error_handler(_: Request, exc: ValueError) -> FastJSONResponse:
     """
     Handle ValueError (invalid input).
 
@@ -36,16 +37,16 @@ async def value_error_handler(_: Request, exc: ValueError) -> JSONResponse:
         exc (ValueError): ValueError instance
 
     Returns:
-        JSONResponse: Response with 400 Bad Request
+        FastJSONResponse: Response with 400 Bad Request
     """
     traceback.print_exception(type(exc), exc, exc.__traceback__)
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=HTTPStatus.BAD_REQUEST.value,
         content={"detail": str(exc) or HTTPStatus.BAD_REQUEST.phrase},
     )
 
 
-async def generic_exception_handler(_: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(_: Request, exc: Exception) -> FastJSONResponse:
     """
     Catch-all handler for unhandled exceptions.
 
@@ -54,10 +55,10 @@ async def generic_exception_handler(_: Request, exc: Exception) -> JSONResponse:
         exc (Exception): Any unhandled exception
 
     Returns:
-        JSONResponse: Response with 500 Internal Server Error
+        FastJSONResponse: Response with 500 Internal Server Error
     """
     traceback.print_exception(type(exc), exc, exc.__traceback__)
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value,
         content={"detail": HTTPStatus.INTERNAL_SERVER_ERROR.phrase},
     )
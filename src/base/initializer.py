@@ -3,13 +3,23 @@ Application lifecycle management module.
 Quản lý startup/shutdown và validation cho FastAPI app.
 """
 
+import asyncio
+import inspect
+import logging
 from types import TracebackType
 from typing import Optional, Type, Mapping, Any
 
 from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from sqlalchemy.orm import configure_mappers
 
 from src.config import Config
 from src.base.engine_factory import EngineFactory
+from src.base.readiness import Readiness
+
+
+logger = logging.getLogger("app")
 
 
 class State(Mapping):
@@ -21,6 +31,7 @@ class State(Mapping):
     """
 
     config: Config
+    readiness: Readiness
 
     def __init__(self, /, **kwargs: Any):
         """
@@ -68,6 +79,15 @@ class Initializer:
 
     Thực hiện setup, validation và cleanup cho app.
     Có thể được extend để thêm custom initialization logic.
+
+    Sau khi khởi tạo xong, _start_warmup() chạy warmup() trong background task;
+    /health trả 503 cho tới khi warm-up xong (state.readiness).
+
+    Config:
+        WARMUP_ENABLED: Bật warm-up, mặc định true (false = ready ngay)
+        WARMUP_CONNECTIONS: Số connections mở trước cho mỗi engine, mặc định 1
+        WARMUP_CALLS: Số lần lặp các lời gọi warm-up của modules, mặc định 1
+        WARMUP_TIMEOUT: Thời gian tối đa (giây) của warm-up, mặc định 30
     """
 
     _DOCS_ENDPOINT = "/"
@@ -85,6 +105,8 @@ class Initializer:
         self.config: Config = config if config else Config()
         self._app = app
         self.engine_factory = EngineFactory(config=self.config)
+        self.readiness = Readiness()
+        self._warmup_task: Optional[asyncio.Task] = None
 
     async def __aenter__(self) -> State:
         """
@@ -97,11 +119,14 @@ class Initializer:
         4. Validate required endpoints
         5. Khởi tạo database engine factory
 
+        Subclass gọi _start_warmup() khi đã khởi tạo xong dependencies.
+
         Returns:
             State: State instance chứa các dependencies.
         """
         state = State(
             config=self.config,
+            readiness=self.readiness,
         )
 
         # FastAPI setup and validation
@@ -128,8 +153,67 @@ class Initializer:
             exc_tb (Optional[TracebackType]): Traceback nếu có.
         """
         # self.logger.info("service_shutting_down")
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
         await self.engine_factory.__aexit__(exc_type, exc_val, exc_tb)
 
+    async def warmup(self) -> None:
+        """
+        Làm nóng những gì được tạo lazy ở request đầu tiên.
+
+        Thực hiện các bước:
+        1. Mở và kiểm tra connections của mọi engine (WARMUP_CONNECTIONS mỗi engine)
+        2. configure_mappers() của SQLAlchemy
+        3. Dựng validators của các response models còn chưa hoàn chỉnh
+
+        OpenAPI schema đã được tạo (và cache) trong _validate_openapi().
+        Override để thêm bước warm-up, gọi super().warmup() trước.
+        """
+        await self.engine_factory.warmup(connections=self.config.get_int("WARMUP_CONNECTIONS", 1))
+        configure_mappers()
+        self._prebuild_validators()
+
+    def _start_warmup(self) -> None:
+        """
+        Chạy warmup() trong background task, app nhận requests trong lúc đó.
+
+        Với WARMUP_ENABLED=false, readiness được đánh dấu ready ngay.
+        """
+        if not self.config.get_bool("WARMUP_ENABLED", True):
+            self.readiness.mark_ready()
+            return
+        self._warmup_task = asyncio.create_task(self._run_warmup())
+
+    async def _run_warmup(self) -> None:
+        """
+        Chạy warmup() với WARMUP_TIMEOUT rồi đánh dấu ready.
+
+        Warm-up chỉ là tối ưu: lỗi hoặc hết thời gian được ghi log và worker
+        vẫn được đánh dấu ready.
+        """
+        timeout = self.config.get_float("WARMUP_TIMEOUT", 30.0)
+        try:
+            await asyncio.wait_for(self.warmup(), timeout=timeout if timeout > 0 else None)
+        except asyncio.TimeoutError:
+            logger.warning(f"Warm-up did not finish within {timeout:.1f}s")
+        except Exception:
+            logger.exception("Warm-up failed")
+        self.readiness.mark_ready()
+        logger.info(f"Warm-up finished in {(self.readiness.duration or 0.0) * 1000:.1f} ms, ready to accept traffic")
+
+    def _prebuild_validators(self) -> None:
+        """
+        Dựng validators của các response models chưa hoàn chỉnh (defer_build, forward refs).
+        """
+        for route in self._app.routes:
+            model = getattr(route, "response_model", None) if isinstance(route, APIRoute) else None
+            if inspect.isclass(model) and issubclass(model, BaseModel) and not model.__pydantic_complete__:
+                model.model_rebuild()
+
     def _setup_app(self) -> None:
         """
         Setup FastAPI app với config từ environment.
@@ -0,0 +1,150 @@
+"""
+Module cung cấp metrics cho SQLAlchemy AsyncEngine.
+
+Metrics (label engine là tên engine trong EngineFactory, ví dụ DB, DB@replica-1):
+    db_connections_opened_total{engine}
+    db_connections_checked_out{engine}
+    db_pool_size{engine}, db_pool_overflow{engine} (chỉ với QueuePool)
+    db_connection_checkout_seconds{engine} (histogram, thời gian chờ lấy connection từ
+        pool, chỉ với QueuePool: NullPool luôn mở connection mới nên không có thời gian chờ)
+    db_query_duration_seconds{engine} (histogram)
+    db_query_errors_total{engine}
+"""
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import Pool, QueuePool
+
+from src.base.metrics.registry import MetricsRegistry, registry as default_registry
+
+
+logger = logging.getLogger("app")
+
+_QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def instrument_engine(engine: AsyncEngine, name: str, registry: MetricsRegistry = default_registry) -> None:
+    """
+    Gắn SQLAlchemy pool/cursor events để ghi metrics của engine.
+
+    Args:
+        engine (AsyncEngine): Engine cần theo dõi
+        name (str): Giá trị label engine
+        registry (MetricsRegistry): Registry lưu metrics
+    """
+    sync_engine = engine.sync_engine
+    pool = sync_engine.pool
+
+    opened = registry.counter(
+        "db_connections_opened_total", "Database connections opened.", ["engine"]
+    ).labels(name)
+    checked_out = registry.gauge(
+        "db_connections_checked_out", "Database connections currently checked out of the pool.", ["engine"]
+    ).labels(name)
+    checkout_seconds = registry.histogram(
+        "db_connection_checkout_seconds",
+        "Time spent waiting for a database connection from the pool.",
+        ["engine"],
+        buckets=_QUERY_BUCKETS,
+    ).labels(name)
+    query_seconds = registry.histogram(
+        "db_query_duration_seconds", "Database statement execution time.", ["engine"], buckets=_QUERY_BUCKETS
+    ).labels(name)
+    query_errors = registry.counter(
+        "db_query_errors_total", "Database statements that raised an error.", ["engine"]
+    ).labels(name)
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(*_: Any) -> None:
+        opened.inc()
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(*_: Any) -> None:
+        checked_out.inc()
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(*_: Any) -> None:
+        checked_out.dec()
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+    ) -> None:
+        context._metrics_started_at = time.perf_counter()  # type: ignore[attr-defined]
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+    ) -> None:
+        started_at = getattr(context, "_metrics_started_at", None)
+        if started_at is not None:
+            query_seconds.observe(time.perf_counter() - started_at)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _on_error(*_: Any) -> None:
+        query_errors.inc()
+
+    if isinstance(pool, QueuePool):
+        _time_pool_checkout(sync_engine, checkout_seconds)
+
+        pool_size = registry.gauge("db_pool_size", "Configured pool size.", ["engine"]).labels(name)
+        pool_overflow = registry.gauge(
+            "db_pool_overflow", "Connections opened above the pool size.", ["engine"]
+        ).labels(name)
+
+        def _collect_pool() -> None:
+            # Đọc pool hiện tại: engine.dispose() thay pool bằng một pool mới
+            current_pool = sync_engine.pool
+            if isinstance(current_pool, QueuePool):
+                pool_size.set(current_pool.size())
+                pool_overflow.set(max(current_pool.overflow(), 0))
+
+        registry.add_collector(_collect_pool)
+
+
+def _time_pool_checkout(sync_engine: Engine, checkout_seconds: Any) -> None:
+    """
+    Đo thời gian chờ lấy connection từ QueuePool của engine.
+
+    Pool không có public event khi bắt đầu chờ connection ("checkout" chỉ chạy
+    khi đã có connection), nên đo quanh QueuePool._do_get của instance pool (chạy
+    trong greenlet, thời gian chờ async được tính đầy đủ). engine.dispose() thay
+    pool bằng pool.recreate() (không còn wrapper), nên pool mới được bọc lại trong
+    event engine_disposed. _do_get là API nội bộ: phiên bản SQLAlchemy được giới
+    hạn trong pyproject.toml, và nếu method không còn tồn tại thì metric này bị
+    bỏ qua thay vì làm hỏng pool.
+
+    Args:
+        sync_engine (Engine): Sync engine của AsyncEngine
+        checkout_seconds (Any): Histogram (đã gắn label engine)
+    """
+
+    def _wrap(pool: Pool) -> bool:
+        do_get = getattr(pool, "_do_get", None)
+        if not isinstance(pool, QueuePool) or getattr(do_get, "_metrics_timed", False):
+            return True
+        if not callable(do_get):
+            logger.warning("QueuePool._do_get is not available, db_connection_checkout_seconds is disabled")
+            return False
+
+        def _timed_do_get() -> Any:
+            started_at = time.perf_counter()
+            try:
+                return do_get()
+            finally:
+                checkout_seconds.observe(time.perf_counter() - started_at)
+
+        _timed_do_get._metrics_timed = True  # type: ignore[attr-defined]
+        pool._do_get = _timed_do_get  # type: ignore[method-assign]
+        return True
+
+    if not _wrap(sync_engine.pool):
+        return
+
+    @event.listens_for(sync_engine, "engine_disposed")
+    def _on_disposed(engine: Engine) -> None:
+        _wrap(engine.pool)
@@ -0,0 +1,74 @@
+"""
+Module cung cấp ASGI middleware ghi metrics cho HTTP requests.
+
+Label route là route template (ví dụ /api/health/db/{id}) lấy từ
+scope["route"] sau khi router đã match, không phải path thật, nên số
+time series không tăng theo số giá trị path params. Request không match
+route nào được gộp vào route "<unmatched>".
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.base.metrics.registry import MetricsRegistry, registry as default_registry
+
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware ghi số requests, latency và requests đang xử lý.
+
+    Metrics:
+        http_requests_total{method,route,status}
+        http_request_duration_seconds{method,route} (histogram)
+        http_requests_in_progress{method}
+
+    Args:
+        app (ASGIApp): ASGI application bên trong
+        registry (MetricsRegistry): Registry lưu metrics
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = default_registry) -> None:
+        self.app = app
+        self._requests = registry.counter(
+            "http_requests_total",
+            "Total HTTP requests by method, route template and status code.",
+            ["method", "route", "status"],
+        )
+        self._duration = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by method and route template.",
+            ["method", "route"],
+        )
+        self._in_progress = registry.gauge(
+            "http_requests_in_progress",
+            "HTTP requests currently being processed.",
+            ["method"],
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = self._in_progress.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            self._requests.labels(method, route, str(status)).inc()
+            self._duration.labels(method, route).observe(time.perf_counter() - started)
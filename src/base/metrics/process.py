@@ -0,0 +1,92 @@
+"""
+Module cung cấp process metrics, được cập nhật mỗi lần scrape.
+
+Metrics:
+    process_cpu_seconds_total (không có trên Windows)
+    process_resident_memory_bytes (không có trên Windows)
+    process_open_fds (Linux)
+    process_start_time_seconds
+    python_gc_collections_total{generation}
+    python_asyncio_tasks
+"""
+import asyncio
+import gc
+import os
+import sys
+import time
+from types import ModuleType
+from typing import Optional
+
+from src.base.metrics.registry import MetricsRegistry, registry as default_registry
+
+resource: Optional[ModuleType]
+try:
+    import resource
+except ImportError:
+    # Windows không có module resource
+    resource = None
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+# Xấp xỉ thời điểm process bắt đầu (module được import khi tạo app)
+_STARTED_AT = time.time()
+_registered: set[int] = set()
+
+
+def register_process_collector(registry: MetricsRegistry = default_registry) -> None:
+    """
+    Đăng ký process metrics vào registry.
+
+    Gọi nhiều lần với cùng registry chỉ đăng ký một lần.
+
+    Args:
+        registry (MetricsRegistry): Registry lưu metrics
+    """
+    if id(registry) in _registered:
+        return
+    _registered.add(id(registry))
+
+    is_linux = sys.platform.startswith("linux")
+    # Không có module resource (Windows): bỏ qua CPU và RSS
+    cpu_seconds = registry.counter(
+        "process_cpu_seconds_total", "Total user and system CPU time in seconds."
+    ) if resource is not None else None
+    memory = registry.gauge(
+        "process_resident_memory_bytes", "Resident memory size in bytes."
+    ) if resource is not None or is_linux else None
+    open_fds = registry.gauge("process_open_fds", "Number of open file descriptors.")
+    start_time = registry.gauge("process_start_time_seconds", "Start time of the process since unix epoch.")
+    gc_collections = registry.counter(
+        "python_gc_collections_total", "Garbage collections per generation.", ["generation"]
+    )
+    asyncio_tasks = registry.gauge("python_asyncio_tasks", "Asyncio tasks alive in the event loop.")
+
+    start_time.set(_STARTED_AT)
+
+    def _collect() -> None:
+        usage = resource.getrusage(resource.RUSAGE_SELF) if resource is not None else None
+        if cpu_seconds is not None and usage is not None:
+            cpu_seconds.set(usage.ru_utime + usage.ru_stime)
+
+        if is_linux:
+            try:
+                with open("/proc/self/statm", "rb") as statm:
+                    memory.set(int(statm.read().split()[1]) * _PAGE_SIZE)  # type: ignore[union-attr]
+                open_fds.set(len(os.listdir("/proc/self/fd")))
+            except OSError:
+                pass
+        elif memory is not None and usage is not None:
+            # ru_maxrss là KiB trên Linux, bytes trên macOS; chỉ là peak RSS
+            memory.set(usage.ru_maxrss)
+
+        for generation, stats in enumerate(gc.get_stats()):
+            gc_collections.labels(str(generation)).set(stats["collections"])
+
+        try:
+            asyncio_tasks.set(len(asyncio.all_tasks()))
+        except RuntimeError:
+            # Không có event loop đang chạy
+            pass
+
+    registry.add_collector(_collect)
+
@@ -0,0 +1,318 @@
+"""
+Module cung cấp metrics registry tối giản theo Prometheus text format.
+
+Gồm Counter, Gauge, Histogram có labels và MetricsRegistry để render tất cả
+metrics ở định dạng text exposition 0.0.4. Mỗi worker process có registry
+riêng, Prometheus scrape từng worker (không hỗ trợ multiprocess mode).
+
+Registry không dùng lock: metrics được cập nhật trên event loop thread
+(middleware, SQLAlchemy events chạy trong greenlet của cùng thread).
+"""
+import bisect
+import math
+from typing import Callable, Generic, Iterator, Optional, Sequence, TypeVar
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+C = TypeVar("C")
+
+
+def _escape(value: str) -> str:
+    """Escape label value theo Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Định dạng giá trị sample."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Tạo phần {label="value",...} của một sample."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterValue:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Tăng counter."""
+        self.value += amount
+
+    def set(self, value: float) -> None:
+        """Đặt giá trị từ một bộ đếm có sẵn bên ngoài (ví dụ CPU time của process)."""
+        self.value = value
+
+
+class _GaugeValue:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Tăng gauge."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Giảm gauge."""
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        """Đặt giá trị gauge."""
+        self.value = value
+
+
+class _HistogramValue:
+    __slots__ = ("_upper_bounds", "counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Sequence[float]) -> None:
+        self._upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Ghi nhận một giá trị."""
+        self.counts[bisect.bisect_left(self._upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric(Generic[C]):
+    """
+    Base class của một metric family có labels.
+
+    Args:
+        name (str): Tên metric
+        documentation (str): Mô tả (# HELP)
+        label_names (Sequence[str]): Tên các labels
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: dict[tuple[str, ...], C] = {}
+        if not self.label_names:
+            self._default = self.labels()
+
+    def labels(self, *values: str) -> C:
+        """
+        Lấy child metric theo giá trị labels (tạo mới nếu chưa có).
+
+        Args:
+            *values (str): Giá trị labels theo thứ tự label_names
+
+        Returns:
+            C: Child metric
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} expects labels {self.label_names}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def clear(self) -> None:
+        """Xóa tất cả children (dùng cho gauges được tính lại mỗi lần scrape)."""
+        self._children.clear()
+        if not self.label_names:
+            self._default = self.labels()
+
+    def _new_child(self) -> C:
+        raise NotImplementedError
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> Iterator[str]:
+        """
+        Render metric family ở Prometheus text format.
+
+        Yields:
+            str: Từng dòng
+        """
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        yield from self._samples()
+
+
+class Counter(_Metric[_CounterValue]):
+    """Counter chỉ tăng."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Tăng counter không có labels."""
+        self._default.inc(amount)
+
+    def set(self, value: float) -> None:
+        """Đặt giá trị counter không có labels từ một bộ đếm có sẵn bên ngoài."""
+        self._default.set(value)
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in self._children.items():
+            yield f"{self.name}{_format_labels(self.label_names, values)} {_format_value(child.value)}"
+
+
+class Gauge(_Metric[_GaugeValue]):
+    """Gauge có thể tăng, giảm hoặc đặt giá trị."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeValue:
+        return _GaugeValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Tăng gauge không có labels."""
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Giảm gauge không có labels."""
+        self._default.dec(amount)
+
+    def set(self, value: float) -> None:
+        """Đặt giá trị gauge không có labels."""
+        self._default.set(value)
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in self._children.items():
+            yield f"{self.name}{_format_labels(self.label_names, values)} {_format_value(child.value)}"
+
+
+class Histogram(_Metric[_HistogramValue]):
+    """
+    Histogram với các buckets cố định.
+
+    Args:
+        name (str): Tên metric
+        documentation (str): Mô tả
+        label_names (Sequence[str]): Tên các labels
+        buckets (Sequence[float]): Upper bounds (tăng dần, không gồm +Inf)
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self._upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, label_names)
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self._upper_bounds)
+
+    def observe(self, value: float) -> None:
+        """Ghi nhận giá trị cho histogram không có labels."""
+        self._default.observe(value)
+
+    def _samples(self) -> Iterator[str]:
+        bounds = [_format_value(bound) for bound in self._upper_bounds] + ["+Inf"]
+        for values, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(bounds, child.counts):
+                cumulative += count
+                labels = _format_labels(self.label_names, values, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.label_names, values)
+            yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+            yield f"{self.name}_count{labels} {child.count}"
+
+
+class MetricsRegistry:
+    """
+    Tập hợp các metrics của process.
+
+    Collectors là các hàm được gọi ngay trước khi render, dùng để cập nhật
+    gauges tính theo thời điểm scrape (process stats, trạng thái pool, ...).
+
+    Example:
+        >>> requests_total = registry.counter("app_jobs_total", "Jobs processed", ["status"])
+        >>> requests_total.labels("ok").inc()
+        >>> text = registry.render()
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        """Lấy hoặc tạo Counter."""
+        return self._get_or_create(Counter, name, documentation, label_names)
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        """Lấy hoặc tạo Gauge."""
+        return self._get_or_create(Gauge, name, documentation, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        """Lấy hoặc tạo Histogram."""
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = Histogram(name, documentation, label_names, buckets or DEFAULT_BUCKETS)
+            self._metrics[name] = metric
+        if not isinstance(metric, Histogram):
+            raise ValueError(f"Metric {name} is already registered as {metric.type_name}")
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """
+        Đăng ký hàm cập nhật metrics trước mỗi lần render.
+
+        Args:
+            collector (Callable[[], None]): Hàm cập nhật gauges
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Render tất cả metrics ở Prometheus text format.
+
+        Returns:
+            str: Nội dung cho endpoint /metrics
+        """
+        for collector in self._collectors:
+            collector()
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        lines.append("")
+        return "\n".join(lines)
+
+    def _get_or_create(self, metric_type: type, name: str, documentation: str, label_names: Sequence[str]) -> C:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = metric_type(name, documentation, label_names)
+            self._metrics[name] = metric
+        if not isinstance(metric, metric_type):
+            raise ValueError(f"Metric {name} is already registered as {metric.type_name}")
+        return metric  # type: ignore[return-value]
+
+
+registry = MetricsRegistry()
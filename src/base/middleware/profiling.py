@@ -0,0 +1,187 @@
+"""
+Module cung cấp ASGI middleware profile từng request bằng StackSampler.
+
+Một request được profile khi:
+- Gửi header X-Profile với PROFILING_TOKEN; thêm X-Profile-Output: inline để
+  nhận profile thay cho response body (status gốc ở header X-Profile-Status)
+- Được chọn ngẫu nhiên theo sample_rate
+- Chạy lâu hơn slow_threshold: các requests đều được đăng ký nhưng chỉ được
+  lấy mẫu sau khi vượt ngưỡng, và chỉ được ghi nếu kết thúc sau ngưỡng
+
+Profile không trả inline được ghi vào output_dir dạng folded stacks
+(<thời điểm>-<request id>.folded). Middleware chỉ được thêm khi
+PROFILING_ENABLED, nên không tốn chi phí khi tắt.
+"""
+import asyncio
+import hmac
+import logging
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.base.profiler import RequestProfile, StackSampler
+from src.logger.RequestContext import current_request_context
+
+
+logger = logging.getLogger("app")
+
+PROFILE_HEADER = "x-profile"
+PROFILE_OUTPUT_HEADER = "x-profile-output"
+PROFILE_STATUS_HEADER = "X-Profile-Status"
+
+# Request ID có thể do client gửi, chỉ giữ ký tự an toàn cho tên file
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware lấy mẫu stack của các requests được chọn.
+
+    Args:
+        app (ASGIApp): ASGI application bên trong
+        output_dir (str): Thư mục ghi các file .folded
+        token (str): Token của header X-Profile, rỗng để tắt trigger theo header
+        sample_rate (float): Tỉ lệ requests được profile ngẫu nhiên (0..1)
+        slow_threshold (float): Ngưỡng (giây) profile các requests chậm, <= 0 để tắt
+        interval (float): Khoảng thời gian giữa hai lần lấy mẫu (giây)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        output_dir: str = "profiles",
+        token: str = "",
+        sample_rate: float = 0.0,
+        slow_threshold: float = 0.0,
+        interval: float = 0.005,
+    ) -> None:
+        self.app = app
+        self._output_dir = Path(output_dir)
+        self._token = token.encode()
+        self._sample_rate = sample_rate
+        self._slow_threshold = slow_threshold
+        self._sampler = StackSampler(interval=interval)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        inline = False
+        collect_after: Optional[float] = None
+        if self._token and self._has_valid_token(scope):
+            collect_after = 0.0
+            inline = Headers(scope=scope).get(PROFILE_OUTPUT_HEADER, "").lower() == "inline"
+        elif self._sample_rate > 0 and random.random() < self._sample_rate:
+            collect_after = 0.0
+        elif self._slow_threshold > 0:
+            collect_after = self._slow_threshold
+
+        task = asyncio.current_task()
+        if collect_after is None or task is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(
+            task=task,
+            root_frame=sys._getframe(),
+            thread_id=threading.get_ident(),
+            collect_after=collect_after,
+        )
+        self._sampler.register(profile)
+        try:
+            if inline:
+                await self._call_inline(profile, scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+        finally:
+            self._sampler.unregister(profile)
+
+        elapsed = time.perf_counter() - profile.started_at
+        if profile.sample_count and elapsed >= collect_after:
+            await self._write(profile, scope, elapsed)
+
+    def _has_valid_token(self, scope: Scope) -> bool:
+        """
+        Kiểm tra header X-Profile với PROFILING_TOKEN.
+
+        Args:
+            scope (Scope): ASGI scope của request
+
+        Returns:
+            bool: True nếu header có và khớp token
+        """
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER.encode():
+                return hmac.compare_digest(value, self._token)
+        return False
+
+    async def _call_inline(self, profile: RequestProfile, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Chạy request và trả profile thay cho response gốc.
+
+        Args:
+            profile (RequestProfile): Profile của request
+            scope (Scope): ASGI scope
+            receive (Receive): ASGI receive
+            send (Send): ASGI send
+        """
+        status = 500
+
+        async def discard_response(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await self.app(scope, receive, discard_response)
+        self._sampler.unregister(profile)
+
+        body = profile.to_folded().encode()
+        start: Message = {"type": "http.response.start", "status": 200, "headers": []}
+        headers = MutableHeaders(scope=start)
+        headers["Content-Type"] = "text/plain; charset=utf-8"
+        headers["Content-Length"] = str(len(body))
+        headers[PROFILE_STATUS_HEADER] = str(status)
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+    async def _write(self, profile: RequestProfile, scope: Scope, elapsed: float) -> None:
+        """
+        Ghi profile vào output_dir.
+
+        Args:
+            profile (RequestProfile): Profile của request
+            scope (Scope): ASGI scope của request
+            elapsed (float): Thời gian xử lý request (giây)
+        """
+        context = current_request_context()
+        request_id = _UNSAFE_FILENAME_CHARS.sub("", context.request_id)[:64] if context is not None else ""
+        request_id = request_id or uuid.uuid4().hex
+        route = scope["route"].path if "route" in scope else scope["path"]
+        path = self._output_dir / f"{time.strftime('%Y%m%dT%H%M%S')}-{request_id}.folded"
+
+        def write() -> None:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(profile.to_folded(), encoding="utf-8")
+
+        try:
+            await asyncio.to_thread(write)
+        except OSError:
+            logger.exception("Failed to write profile of %s %s to %s", scope["method"], route, path)
+            return
+        logger.info(
+            "Profile of %s %s (%.1f ms, %d samples) written to %s",
+            scope["method"],
+            route,
+            elapsed * 1000,
+            profile.sample_count,
+            path,
+        )
@@ -0,0 +1,109 @@
+"""
+Module cung cấp ASGI middleware thu thập QueryStats cho mỗi HTTP request.
+
+Sau request, middleware cảnh báo các statements lặp lại nhiều lần (dấu hiệu
+N+1) và ghi tóm tắt ở DEBUG. Khi bật, tóm tắt được trả về trong header
+Server-Timing (số queries, tổng thời gian DB, statement chậm nhất) để xem
+trực tiếp trong DevTools của trình duyệt.
+"""
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.base.database.query_stats import QueryStats, begin_query_stats, end_query_stats
+
+
+logger = logging.getLogger("app")
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware thu thập QueryStats cho mỗi HTTP request.
+
+    Server-Timing chỉ gồm các queries chạy trước khi response bắt đầu gửi
+    (với streaming response, các queries sau đó vẫn được tính vào log).
+
+    Args:
+        app (ASGIApp): ASGI application bên trong
+        n_plus_one_threshold (int): Số lần một statement lặp lại trong request để cảnh báo N+1,
+            <= 0 để tắt
+        server_timing (bool): Thêm header Server-Timing vào response
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 10, server_timing: bool = False) -> None:
+        self.app = app
+        self._n_plus_one_threshold = n_plus_one_threshold
+        self._server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        stats, token = begin_query_stats()
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    SERVER_TIMING_HEADER, _format_server_timing(stats, time.perf_counter() - started_at)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing if self._server_timing else send)
+        finally:
+            end_query_stats(token)
+            if stats.count:
+                self._report(scope, stats)
+
+    def _report(self, scope: Scope, stats: QueryStats) -> None:
+        """
+        Ghi log tóm tắt và cảnh báo N+1 của một request.
+
+        Args:
+            scope (Scope): ASGI scope của request
+            stats (QueryStats): QueryStats của request
+        """
+        route = scope["route"].path if "route" in scope else scope["path"]
+        if self._n_plus_one_threshold > 0:
+            for statement, count in stats.repeated_statements(self._n_plus_one_threshold):
+                logger.warning(
+                    "Possible N+1 in %s %s: statement executed %d times: %s",
+                    scope["method"],
+                    route,
+                    count,
+                    statement,
+                )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s %s issued %d queries in %.1f ms (slowest %.1f ms: %s)",
+                scope["method"],
+                route,
+                stats.count,
+                stats.total_time * 1000,
+                stats.slowest_time * 1000,
+                stats.slowest_statement,
+            )
+
+
+def _format_server_timing(stats: QueryStats, elapsed: float) -> str:
+    """
+    Tạo giá trị header Server-Timing.
+
+    Args:
+        stats (QueryStats): QueryStats của request
+        elapsed (float): Thời gian từ đầu request tới khi gửi response (giây)
+
+    Returns:
+        str: Ví dụ 'db;dur=3.2;desc="4 queries", db-slowest;dur=1.9, app;dur=12.5'
+    """
+    metrics = [f'db;dur={stats.total_time * 1000:.1f};desc="{stats.count} queries"']
+    if stats.count:
+        metrics.append(f"db-slowest;dur={stats.slowest_time * 1000:.1f}")
+    metrics.append(f"app;dur={elapsed * 1000:.1f}")
+    return ", ".join(metrics)
@@ -0,0 +1,53 @@
+"""
+Module cung cấp ASGI middleware gắn request context cho logging.
+
+Mỗi HTTP request được gắn một RequestContext (request_id, ASGI scope, thời
+điểm bắt đầu) vào contextvar, để log records ghi trong request có
+request_id, route và latency_ms. Request ID lấy từ header X-Request-ID
+nếu client gửi, và được trả lại trong response header.
+"""
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.logger.RequestContext import RequestContext, bind_request_context, reset_request_context
+
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+
+class RequestContextMiddleware:
+    """
+    ASGI middleware gắn RequestContext cho mỗi HTTP request.
+
+    Args:
+        app (ASGIApp): ASGI application bên trong
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:128]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = bind_request_context(RequestContext(request_id=request_id, scope=scope))
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            reset_request_context(token)
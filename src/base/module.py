@@ -8,10 +8,11 @@ dependencies của mình mà không cần biết về các module khác.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar, Optional
 
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from src.base.engine_group import EngineGroup
 from src.config import Config
 
 
@@ -29,11 +30,16 @@ class ModuleContext:
         shared_repositories (dict): Repositories từ các modules đã khởi tạo trước.
             Dùng để giải quyết cross-module dependencies.
             Ví dụ: AuthModule cần UserRepository từ UserModule.
+        shared_services (dict): Services từ các modules đã khởi tạo trước.
+        db_engine_group (Optional[EngineGroup]): Primary + read replicas của
+            db_engine. Truyền vào Repository để tách đọc/ghi.
     """
 
     db_engine: AsyncEngine
     config: Config
     shared_repositories: dict[str, Any] = field(default_factory=dict)
+    shared_services: dict[str, Any] = field(default_factory=dict)
+    db_engine_group: Optional[EngineGroup] = None
 
 
 @dataclass
@@ -63,13 +69,36 @@ class IModule(ABC):
     Module KHÔNG tạo FastAPI app, chỉ khởi tạo và trả về dependencies.
 
     Workflow:
-        1. AppInitializer tạo ModuleContext với shared resources
-        2. AppInitializer gọi module.initialize(context) theo thứ tự
-        3. Module khởi tạo repositories và services của mình
-        4. Module trả về ModuleDependencies
-        5. AppInitializer cập nhật shared_repositories để module sau có thể dùng
+        1. AppInitializer dựng DAG từ provides/requires của các modules
+        2. AppInitializer tạo ModuleContext với shared resources
+        3. AppInitializer gọi module.initialize(context), các modules không phụ
+           thuộc nhau được khởi tạo đồng thời
+        4. Module khởi tạo repositories và services của mình
+        5. Module trả về ModuleDependencies
+        6. AppInitializer cập nhật shared_repositories/shared_services để các
+           modules phụ thuộc có thể dùng
+        7. Sau khi app khởi tạo xong, AppInitializer gọi module.warmup(calls)
+           trong background task, /health trả 503 cho tới khi warm-up xong
+
+    Attributes:
+        provides (tuple[str, ...]): Tên các repositories/services mà module trả về
+        requires (tuple[str, ...]): Tên các repositories/services module cần từ
+            modules khác (đọc qua context.shared_repositories/shared_services)
     """
 
+    provides: ClassVar[tuple[str, ...]] = ()
+    requires: ClassVar[tuple[str, ...]] = ()
+
+    @property
+    def name(self) -> str:
+        """
+        Tên module dùng trong logs và lỗi.
+
+        Returns:
+            str: Tên class của module
+        """
+        return type(self).__name__
+
     @abstractmethod
     async def initialize(self, context: ModuleContext) -> ModuleDependencies:
         """
@@ -77,14 +106,28 @@ class IModule(ABC):
 
         Args:
             context (ModuleContext): Shared resources từ AppInitializer.
-                Bao gồm db_engine, config, và shared_repositories từ
-                các modules đã khởi tạo trước.
+                Bao gồm db_engine, config, và shared_repositories/shared_services
+                từ các modules được khai báo trong requires.
 
         Returns:
             ModuleDependencies: Services và repositories của module này.
         """
         pass
 
+    async def warmup(self, calls: int) -> None:
+        """
+        Warm-up sau khi app đã khởi tạo, trước khi /health báo sẵn sàng.
+
+        Override method này để dựng trước những gì được tạo lazy ở request đầu
+        tiên (validators, TypeAdapters, ...) và chạy các lời gọi đọc để compiled
+        cache của SQLAlchemy và connection pool được làm nóng. Lỗi được
+        AppInitializer ghi log, không chặn app nhận traffic.
+
+        Args:
+            calls (int): Số lần lặp lại các lời gọi warm-up (WARMUP_CALLS)
+        """
+        pass
+
     async def shutdown(self) -> None:
         """
         Cleanup khi app shutdown.
@@ -0,0 +1,88 @@
+"""
+Module sắp xếp các IModule theo dependencies để khởi tạo song song.
+
+Mỗi module khai báo tên các repositories/services nó cung cấp (provides) và
+cần từ module khác (requires). resolve_module_levels dựng DAG từ các khai báo
+đó và chia modules thành các levels: modules trong cùng một level không phụ
+thuộc nhau nên có thể khởi tạo đồng thời, level sau chỉ phụ thuộc các levels
+trước. Cycle, tên không có module nào cung cấp hoặc được nhiều modules cùng
+cung cấp đều bị báo lỗi ngay lúc startup.
+"""
+from typing import Sequence
+
+from src.base.module import IModule
+
+
+class ModuleGraphError(ValueError):
+    """
+    Khai báo provides/requires của các modules không tạo thành DAG hợp lệ.
+    """
+
+    pass
+
+
+def resolve_module_levels(modules: Sequence[IModule]) -> list[list[IModule]]:
+    """
+    Chia modules thành các levels theo thứ tự topo.
+
+    Thứ tự của modules trong mỗi level giữ nguyên thứ tự trong danh sách đầu vào.
+
+    Args:
+        modules (Sequence[IModule]): Các modules của app
+
+    Returns:
+        list[list[IModule]]: Levels, level sau phụ thuộc các levels trước
+
+    Raises:
+        ModuleGraphError: Nếu có tên được nhiều modules cung cấp, tên được require
+            nhưng không module nào cung cấp, hoặc dependencies tạo thành cycle
+    """
+    # Modules (thường là dataclass) không hashable, nên được đánh số theo vị trí
+    providers: dict[str, int] = {}
+    for index, module in enumerate(modules):
+        for name in module.provides:
+            other = providers.setdefault(name, index)
+            if other != index:
+                raise ModuleGraphError(f"'{name}' is provided by both {modules[other].name} and {module.name}")
+
+    dependencies: list[set[int]] = []
+    for module in modules:
+        missing = [name for name in module.requires if name not in providers]
+        if missing:
+            raise ModuleGraphError(f"{module.name} requires {', '.join(missing)} but no module provides it")
+        dependencies.append({providers[name] for name in module.requires})
+
+    levels: list[list[IModule]] = []
+    resolved: set[int] = set()
+    pending = list(range(len(modules)))
+    while pending:
+        level = [index for index in pending if dependencies[index] <= resolved]
+        if not level:
+            cycle = _find_cycle(pending, dependencies)
+            raise ModuleGraphError(f"Module dependency cycle: {' -> '.join(modules[index].name for index in cycle)}")
+        levels.append([modules[index] for index in level])
+        resolved.update(level)
+        pending = [index for index in pending if index not in resolved]
+    return levels
+
+
+def _find_cycle(pending: list[int], dependencies: list[set[int]]) -> list[int]:
+    """
+    Tìm một cycle trong các modules chưa xếp được level.
+
+    Mọi module còn lại đều phụ thuộc ít nhất một module còn lại, nên đi theo
+    dependency bất kỳ sẽ quay lại một module đã gặp.
+
+    Args:
+        pending (list[int]): Vị trí các modules chưa xếp được level
+        dependencies (list[set[int]]): Vị trí các modules mà từng module phụ thuộc
+
+    Returns:
+        list[int]: Cycle, phần tử đầu và cuối trùng nhau
+    """
+    path: list[int] = []
+    index = pending[0]
+    while index not in path:
+        path.append(index)
+        index = next(dependency for dependency in pending if dependency in dependencies[index])
+    return path[path.index(index):] + [index]
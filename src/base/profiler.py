@@ -0,0 +1,213 @@
+"""
+Module cung cấp sampling profiler theo request (wall-clock).
+
+Một background thread định kỳ lấy stack của các requests đang được profile:
+- Nếu task của request đang chạy trên event loop thread: stack thực tế của
+  thread (gồm cả các hàm sync như Pydantic serialization)
+- Nếu task đang chờ (await I/O, lock, ...): chuỗi coroutine đang await,
+  kết thúc bằng frame "[awaiting]"
+
+Kết quả ở dạng folded stacks ("root;...;leaf count"), đọc được bằng
+flamegraph.pl, speedscope hoặc inferno. Code chạy trong threadpool
+(sync endpoints/dependencies) chỉ hiện ở điểm await của run_in_threadpool.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import CodeType, FrameType
+from typing import Any, Optional
+
+
+AWAITING_FRAME = "[awaiting]"
+
+# Đường dẫn được rút gọn theo thư mục hiện tại hoặc site-packages
+_path_prefixes = sorted(
+    {os.path.join(os.path.abspath(path), "") for path in [os.getcwd(), *sys.path] if path},
+    key=len,
+    reverse=True,
+)
+_labels: dict[CodeType, str] = {}
+
+
+def _frame_label(code: CodeType) -> str:
+    """
+    Tên hiển thị của một function trong flamegraph.
+
+    Args:
+        code (CodeType): Code object của frame
+
+    Returns:
+        str: Ví dụ "HealthCheckService.get_latest_db_health_check (src/health/service/health_check/main.py:141)"
+    """
+    label = _labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        for prefix in _path_prefixes:
+            if filename.startswith(prefix):
+                filename = filename[len(prefix):]
+                break
+        # co_qualname chỉ có từ Python 3.11
+        name = getattr(code, "co_qualname", code.co_name)
+        # Dấu ";" phân tách frames trong folded stacks
+        label = f"{name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+        _labels[code] = label
+    return label
+
+
+@dataclass(eq=False)
+class RequestProfile:
+    """
+    Profile của một request.
+
+    Attributes:
+        task (asyncio.Task): Task xử lý request
+        root_frame (FrameType): Frame gốc, chỉ các frames bên trong frame này được ghi nhận
+        thread_id (int): Thread chạy event loop
+        collect_after (float): Chỉ lấy mẫu sau khi request chạy được ngần này giây
+        started_at (float): Thời điểm bắt đầu (perf_counter)
+        samples (Counter[str]): Số mẫu theo folded stack, được sampler thread ghi;
+            chỉ đọc sau StackSampler.unregister()
+    """
+
+    task: asyncio.Task
+    root_frame: FrameType
+    thread_id: int
+    collect_after: float = 0.0
+    started_at: float = field(default_factory=time.perf_counter)
+    samples: Counter = field(default_factory=Counter)
+
+    @property
+    def sample_count(self) -> int:
+        """Tổng số mẫu đã lấy."""
+        return sum(self.samples.values())
+
+    def to_folded(self) -> str:
+        """
+        Xuất profile ở dạng folded stacks.
+
+        Returns:
+            str: Mỗi dòng "frame;frame;...;frame count"
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class StackSampler:
+    """
+    Background thread lấy mẫu stack của các RequestProfile đã đăng ký.
+
+    Thread chỉ được tạo khi có profile đầu tiên và ngủ khi không có profile nào.
+
+    Args:
+        interval (float): Khoảng thời gian giữa hai lần lấy mẫu (giây)
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self._interval = interval
+        self._profiles: set[RequestProfile] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, profile: RequestProfile) -> None:
+        """
+        Bắt đầu lấy mẫu cho một profile.
+
+        Args:
+            profile (RequestProfile): Profile của request
+        """
+        with self._lock:
+            self._profiles.add(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def unregister(self, profile: RequestProfile) -> None:
+        """
+        Dừng lấy mẫu cho một profile.
+
+        Chờ lần lấy mẫu đang chạy (nếu có) kết thúc, sau đó samples của
+        profile không thay đổi nữa.
+
+        Args:
+            profile (RequestProfile): Profile của request
+        """
+        with self._lock:
+            self._profiles.discard(profile)
+
+    def _run(self) -> None:
+        while True:
+            # Lấy mẫu trong lock: sau khi unregister() trả về, samples của profile
+            # không còn bị thread này ghi nên đọc (to_folded) an toàn
+            with self._lock:
+                if self._profiles:
+                    self._sample_all()
+                else:
+                    self._wakeup.clear()
+                idle = not self._profiles
+            if idle:
+                self._wakeup.wait()
+                continue
+            time.sleep(self._interval)
+
+    def _sample_all(self) -> None:
+        """Lấy một mẫu cho mỗi profile đã đăng ký (gọi khi đang giữ lock)."""
+        now = time.perf_counter()
+        frames = sys._current_frames()
+        for profile in self._profiles:
+            if now - profile.started_at >= profile.collect_after:
+                stack = self._sample(profile, frames)
+                if stack:
+                    profile.samples[stack] += 1
+        del frames
+
+    @staticmethod
+    def _sample(profile: RequestProfile, frames: dict[int, FrameType]) -> Optional[str]:
+        """
+        Lấy folded stack hiện tại của một request.
+
+        Args:
+            profile (RequestProfile): Profile của request
+            frames (dict[int, FrameType]): Frame hiện tại của mỗi thread
+
+        Returns:
+            Optional[str]: Folded stack, None nếu request đã kết thúc
+        """
+        # Task đang chạy: root_frame nằm trong stack của event loop thread
+        codes: list[CodeType] = []
+        frame = frames.get(profile.thread_id)
+        while frame is not None:
+            codes.append(frame.f_code)
+            if frame is profile.root_frame:
+                codes.reverse()
+                return ";".join(_frame_label(code) for code in codes)
+            frame = frame.f_back
+
+        # Task đang chờ: đi theo chuỗi await từ coroutine của task
+        codes = []
+        recording = False
+        awaitable: Any = profile.task.get_coro()
+        while awaitable is not None:
+            frame = (
+                getattr(awaitable, "cr_frame", None)
+                or getattr(awaitable, "gi_frame", None)
+                or getattr(awaitable, "ag_frame", None)
+            )
+            if frame is None:
+                break
+            recording = recording or frame is profile.root_frame
+            if recording:
+                codes.append(frame.f_code)
+            awaitable = (
+                getattr(awaitable, "cr_await", None)
+                or getattr(awaitable, "gi_yieldfrom", None)
+                or getattr(awaitable, "ag_await", None)
+            )
+
+        if not codes:
+            return None
+        return ";".join([*(_frame_label(code) for code in codes), AWAITING_FRAME])
@@ -0,0 +1,33 @@
+"""
+Module theo dõi trạng thái sẵn sàng nhận traffic của app.
+
+Initializer đặt Readiness vào State (key "readiness") và đánh dấu ready khi
+warm-up xong; endpoint /health trả 503 cho tới lúc đó để load balancer chưa
+gửi requests vào worker còn "lạnh".
+"""
+import time
+from typing import Optional
+
+
+class Readiness:
+    """
+    Trạng thái warm-up của một worker.
+
+    Attributes:
+        ready (bool): Warm-up đã kết thúc (thành công, lỗi hoặc hết thời gian)
+        started_at (float): Thời điểm tạo (time.monotonic())
+        duration (Optional[float]): Thời gian warm-up (giây), None nếu chưa xong
+    """
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.started_at = time.monotonic()
+        self.duration: Optional[float] = None
+
+    def mark_ready(self) -> None:
+        """
+        Đánh dấu worker sẵn sàng nhận traffic.
+        """
+        if not self.ready:
+            self.ready = True
+            self.duration = time.monotonic() - self.started_at
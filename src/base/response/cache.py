@@ -0,0 +1,415 @@
+"""
+Module cung cấp HTTP response cache cho GET endpoints.
+
+ResponseCache cache body đã serialize theo path + query string, với TTL,
+giới hạn số entries và stale-while-revalidate. Response có strong ETag,
+request có If-None-Match khớp nhận 304 mà không cần gọi tới service layer.
+Services gọi invalidate_tags() sau khi ghi dữ liệu đã commit (after_commit
+của unit-of-work). Kết quả được tính trước một lần invalidate của tag không
+được lưu lại vào cache.
+
+Làm mới stale-while-revalidate chạy sau khi response đã gửi, với arguments
+đã resolve của request cũ, nên endpoint được cache chỉ được nhận dependencies
+sống cùng app (Injects, InjectState), không nhận yield dependencies (UnitOfWork).
+"""
+import asyncio
+import contextvars
+import functools
+import hashlib
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Awaitable, Callable, Optional, Sequence, get_args, get_origin, get_type_hints
+from urllib.parse import urlencode
+
+from fastapi import params
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.base.response.json import encode_json
+
+
+logger = logging.getLogger("app")
+
+
+@dataclass
+class _CacheEntry:
+    """
+    Một response đã cache.
+
+    Attributes:
+        body (bytes): Body đã serialize
+        etag (str): Strong ETag của body
+        fresh_until (float): Thời điểm (monotonic) hết hạn
+        stale_until (float): Thời điểm (monotonic) hết hạn stale-while-revalidate
+        tags (frozenset[str]): Tags dùng để invalidate
+    """
+
+    body: bytes
+    etag: str
+    fresh_until: float
+    stale_until: float
+    tags: frozenset[str] = field(default_factory=frozenset)
+
+
+@dataclass
+class ResponseCacheStats:
+    """
+    Bộ đếm của ResponseCache.
+
+    Attributes:
+        hits (int): Số response trả từ cache còn hạn
+        stale_hits (int): Số response trả từ cache đã hết hạn (stale-while-revalidate)
+        misses (int): Số lần phải gọi endpoint
+        not_modified (int): Số response 304
+        evictions (int): Số entries bị loại do vượt giới hạn kích thước
+        discarded (int): Số kết quả không được lưu vì tag bị invalidate trong lúc tính
+        refresh_errors (int): Số lần làm mới ở background bị lỗi
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    evictions: int = 0
+    discarded: int = 0
+    refresh_errors: int = 0
+
+
+class ResponseCache:
+    """
+    Cache response của GET endpoints theo path và query string.
+
+    Args:
+        max_entries (int): Số responses tối đa được cache (LRU)
+
+    Example:
+        >>> response_cache = ResponseCache(max_entries=256)
+        ...
+        ... @router.get("/items", response_model=ItemsDto)
+        ... @response_cache.cached(ttl=5.0, stale_while_revalidate=30.0, tags=["items"])
+        ... async def get_items(service: ItemService = Injects("item_service")) -> ItemsDto:
+        ...     return await service.get_items()
+        ...
+        ... # Trong service, sau khi ghi (chạy sau khi unit-of-work commit):
+        ... after_commit(lambda: response_cache.invalidate_tags("items"))
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._refreshing: set[str] = set()
+        self._background_tasks: set[asyncio.Task] = set()
+        # Tăng mỗi lần invalidate tag / clear(), kết quả tính trước đó không được lưu
+        self._tag_generations: dict[str, int] = {}
+        self._clear_generation = 0
+        self.stats = ResponseCacheStats()
+
+    def cached(
+        self,
+        ttl: float,
+        stale_while_revalidate: float = 0.0,
+        tags: Sequence[str] = (),
+    ) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+        """
+        Decorator cache response của một GET endpoint.
+
+        Đặt decorator bên dưới decorator của router. Endpoint nên trả về
+        Pydantic model (được serialize với by_alias=True như FastAPI) hoặc
+        dữ liệu JSON-serializable. Nếu endpoint trả về Response, kết quả
+        không được cache.
+
+        Endpoint chỉ được nhận dependencies sống cùng app: làm mới ở background
+        gọi lại endpoint với arguments của request cũ sau khi response đã gửi,
+        lúc yield dependencies (UnitOfWork, session) đã đóng.
+
+        Args:
+            ttl (float): Thời gian (giây) response được coi là còn mới
+            stale_while_revalidate (float): Thời gian (giây) sau ttl vẫn trả response cũ,
+                đồng thời làm mới cache ở background
+            tags (Sequence[str]): Tags dùng để invalidate qua invalidate_tags()
+
+        Returns:
+            Callable: Decorator cho endpoint
+
+        Raises:
+            TypeError: Nếu endpoint nhận yield dependency (ví dụ UnitOfWork()).
+        """
+        entry_tags = frozenset(tags)
+
+        def decorator(endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            # Resolve cả annotations dạng string (from __future__ import annotations)
+            hints = get_type_hints(endpoint, include_extras=True)
+            signature = inspect.signature(endpoint)
+            signature = signature.replace(parameters=[
+                param.replace(annotation=hints.get(name, param.annotation))
+                for name, param in signature.parameters.items()
+            ])
+            for name, param in signature.parameters.items():
+                if _is_yield_dependency(param):
+                    raise TypeError(
+                        f"Cached endpoint '{endpoint.__qualname__}' cannot take yield dependency '{name}': "
+                        f"background refreshes run after it has been closed"
+                    )
+            request_param = next(
+                (name for name, param in signature.parameters.items() if param.annotation is Request),
+                None,
+            )
+            injected_param = request_param is None
+            if injected_param:
+                request_param = "_response_cache_request"
+                signature = signature.replace(parameters=[
+                    *signature.parameters.values(),
+                    inspect.Parameter(request_param, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+                ])
+
+            @functools.wraps(endpoint)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                request: Request = kwargs.pop(request_param) if injected_param else kwargs[request_param]
+
+                async def compute() -> Any:
+                    return await endpoint(*args, **kwargs)
+
+                return await self._respond(request, compute, ttl, stale_while_revalidate, entry_tags)
+
+            wrapper.__signature__ = signature  # type: ignore[attr-defined]
+            return wrapper
+
+        return decorator
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """
+        Xóa các responses được cache với bất kỳ tag nào trong tags.
+
+        Args:
+            *tags (str): Tags cần invalidate
+        """
+        for tag in tags:
+            self._tag_generations[tag] = self._tag_generations.get(tag, 0) + 1
+        targets = set(tags)
+        for key in [key for key, entry in self._entries.items() if entry.tags & targets]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Xóa toàn bộ responses đã cache."""
+        self._clear_generation += 1
+        self._entries.clear()
+
+    def _generation(self, tags: frozenset[str]) -> tuple[int, ...]:
+        """
+        Phiên bản hiện tại của các tags, thay đổi sau mỗi lần invalidate/clear.
+
+        Args:
+            tags (frozenset[str]): Tags của entry
+
+        Returns:
+            tuple[int, ...]: Generation của clear() và của từng tag
+        """
+        return (self._clear_generation, *(self._tag_generations.get(tag, 0) for tag in sorted(tags)))
+
+    async def _respond(
+        self,
+        request: Request,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_while_revalidate: float,
+        tags: frozenset[str],
+    ) -> Any:
+        """
+        Trả response từ cache hoặc gọi endpoint và cache kết quả.
+
+        Args:
+            request (Request): Request hiện tại
+            compute (Callable[[], Awaitable[Any]]): Gọi endpoint gốc
+            ttl (float): Thời gian response còn mới (giây)
+            stale_while_revalidate (float): Thời gian stale-while-revalidate (giây)
+            tags (frozenset[str]): Tags của entry
+
+        Returns:
+            Any: Response (200 hoặc 304), hoặc kết quả gốc nếu không cache được
+        """
+        key = self._get_key(request)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+
+        if entry is not None and now < entry.fresh_until:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        elif entry is not None and now < entry.stale_until:
+            self.stats.stale_hits += 1
+            self._schedule_refresh(key, compute, ttl, stale_while_revalidate, tags)
+        else:
+            self.stats.misses += 1
+            generation = self._generation(tags)
+            result = await compute()
+            if isinstance(result, Response):
+                return result
+            entry = self._make_entry(result, ttl, stale_while_revalidate, tags)
+            self._store(key, entry, generation)
+
+        return self._build_response(request, entry, ttl, stale_while_revalidate)
+
+    def _make_entry(
+        self,
+        result: Any,
+        ttl: float,
+        stale_while_revalidate: float,
+        tags: frozenset[str],
+    ) -> _CacheEntry:
+        """
+        Serialize kết quả endpoint thành entry.
+
+        Dùng cùng encoder với FastJSONResponse, nên body (và ETag) giống
+        response không qua cache.
+
+        Args:
+            result (Any): Kết quả endpoint
+            ttl (float): Thời gian response còn mới (giây)
+            stale_while_revalidate (float): Thời gian stale-while-revalidate (giây)
+            tags (frozenset[str]): Tags của entry
+
+        Returns:
+            _CacheEntry: Entry (chưa lưu)
+        """
+        body = encode_json(result)
+        now = time.monotonic()
+        return _CacheEntry(
+            body=body,
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            fresh_until=now + ttl,
+            stale_until=now + ttl + stale_while_revalidate,
+            tags=tags,
+        )
+
+    def _store(self, key: str, entry: _CacheEntry, generation: tuple[int, ...]) -> None:
+        """
+        Lưu entry vào cache, trừ khi tags của nó bị invalidate từ lúc bắt đầu tính.
+
+        Args:
+            key (str): Cache key
+            entry (_CacheEntry): Entry cần lưu
+            generation (tuple[int, ...]): _generation(tags) lấy trước khi gọi endpoint
+        """
+        if generation != self._generation(entry.tags):
+            self.stats.discarded += 1
+            return
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_while_revalidate: float,
+        tags: frozenset[str],
+    ) -> None:
+        """
+        Làm mới một entry stale ở background (tối đa một lần refresh mỗi key).
+
+        Args:
+            key (str): Cache key
+            compute (Callable[[], Awaitable[Any]]): Gọi endpoint gốc
+            ttl (float): Thời gian response còn mới (giây)
+            stale_while_revalidate (float): Thời gian stale-while-revalidate (giây)
+            tags (frozenset[str]): Tags của entry
+        """
+        if key in self._refreshing:
+            return
+
+        generation = self._generation(tags)
+
+        async def refresh() -> None:
+            try:
+                result = await compute()
+                if not isinstance(result, Response):
+                    self._store(key, self._make_entry(result, ttl, stale_while_revalidate, tags), generation)
+            except Exception:
+                self.stats.refresh_errors += 1
+                logger.exception(f"Failed to refresh cached response {key}")
+            finally:
+                self._refreshing.discard(key)
+
+        self._refreshing.add(key)
+        # Context trống: không mang RequestContext, QueryStats, read-your-writes... của request cũ
+        task = contextvars.Context().run(asyncio.get_running_loop().create_task, refresh())
+        # Giữ reference để task không bị garbage collect trước khi chạy xong
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _build_response(
+        self,
+        request: Request,
+        entry: _CacheEntry,
+        ttl: float,
+        stale_while_revalidate: float,
+    ) -> Response:
+        """
+        Tạo response từ entry, trả 304 nếu If-None-Match khớp ETag.
+
+        Args:
+            request (Request): Request hiện tại
+            entry (_CacheEntry): Entry đã cache
+            ttl (float): Thời gian response còn mới (giây)
+            stale_while_revalidate (float): Thời gian stale-while-revalidate (giây)
+
+        Returns:
+            Response: Response 200 với body hoặc 304 không có body
+        """
+        cache_control = f"max-age={int(ttl)}"
+        if stale_while_revalidate:
+            cache_control += f", stale-while-revalidate={int(stale_while_revalidate)}"
+        headers = {"ETag": entry.etag, "Cache-Control": cache_control}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if "*" in candidates or entry.etag in candidates:
+                self.stats.not_modified += 1
+                return Response(status_code=304, headers=headers)
+
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    @staticmethod
+    def _get_key(request: Request) -> str:
+        """
+        Tạo cache key từ path và query string (đã sắp xếp).
+
+        Args:
+            request (Request): Request hiện tại
+
+        Returns:
+            str: Cache key
+        """
+        query = urlencode(sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{query}"
+
+
+def _is_yield_dependency(param: inspect.Parameter) -> bool:
+    """
+    Kiểm tra parameter có phải dependency dạng generator (yield) không.
+
+    Args:
+        param (inspect.Parameter): Parameter của endpoint (annotation đã resolve)
+
+    Returns:
+        bool: True nếu default hoặc metadata Annotated là Depends của một generator function
+    """
+    candidates = [param.default]
+    if get_origin(param.annotation) is Annotated:
+        candidates.extend(get_args(param.annotation)[1:])
+    return any(
+        isinstance(candidate, params.Depends)
+        and (
+            inspect.isasyncgenfunction(candidate.dependency)
+            or inspect.isgeneratorfunction(candidate.dependency)
+        )
+        for candidate in candidates
+    )
@@ -0,0 +1,39 @@
+"""
+Module cung cấp JSON response class mặc định của app.
+
+FastJSONResponse serialize bằng pydantic-core (Rust) thẳng ra bytes:
+Pydantic models được serialize với by_alias=True như FastAPI, các giá trị
+khác (dict, list, datetime, ...) không cần qua jsonable_encoder.
+"""
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    Serialize content thành JSON bytes.
+
+    Args:
+        content (Any): Pydantic model hoặc dữ liệu JSON-serializable
+
+    Returns:
+        bytes: JSON (UTF-8, không có khoảng trắng thừa)
+    """
+    return to_json(content, by_alias=True)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse dùng encode_json thay cho json của stdlib.
+
+    Content có thể là Pydantic model, khi đó model được serialize trực tiếp
+    không qua dict trung gian.
+
+    Example:
+        >>> return FastJSONResponse(DbHealthCheckDto(...), status_code=201)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
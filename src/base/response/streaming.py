@@ -0,0 +1,142 @@
+"""
+Module cung cấp StreamingResponse serialize từng row khi gửi đi.
+
+Dùng cùng Repository.stream_all/stream_sql để export dữ liệu lớn mà không
+phải giữ toàn bộ kết quả trong bộ nhớ của worker.
+"""
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Mapping, Optional, Type
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+
+def _serialize_row(row: Any, dto: Optional[Type[BaseModel]]) -> bytes:
+    """
+    Serialize một row thành JSON bytes.
+
+    Args:
+        row (Any): ORM entity, RowMapping, dict hoặc Pydantic model
+        dto (Optional[Type[BaseModel]]): DTO dùng để validate row trước khi serialize
+
+    Returns:
+        bytes: JSON của row
+    """
+    if dto is not None:
+        row = dto.model_validate(dict(row) if isinstance(row, Mapping) else row)
+    if isinstance(row, BaseModel):
+        return row.model_dump_json(by_alias=True).encode()
+    return json.dumps(jsonable_encoder(row), separators=(",", ":")).encode()
+
+
+async def _iter_chunks(
+    rows: AsyncIterable[Any],
+    dto: Optional[Type[BaseModel]],
+    rows_per_chunk: int,
+    prefix: bytes,
+    separator: bytes,
+    suffix: bytes,
+) -> AsyncIterator[bytes]:
+    """
+    Gom các rows đã serialize thành chunks để giảm số lần gửi.
+
+    Args:
+        rows (AsyncIterable[Any]): Nguồn rows
+        dto (Optional[Type[BaseModel]]): DTO dùng để validate từng row
+        rows_per_chunk (int): Số rows mỗi chunk gửi đi
+        prefix (bytes): Bytes gửi trước row đầu tiên
+        separator (bytes): Bytes giữa hai rows
+        suffix (bytes): Bytes gửi sau row cuối cùng
+
+    Yields:
+        bytes: Từng chunk của body
+    """
+    buffer: list[bytes] = [prefix] if prefix else []
+    count = 0
+    first = True
+
+    async for row in rows:
+        if not first:
+            buffer.append(separator)
+        buffer.append(_serialize_row(row, dto))
+        first = False
+        count += 1
+
+        if count >= rows_per_chunk:
+            yield b"".join(buffer)
+            buffer.clear()
+            count = 0
+
+    buffer.append(suffix)
+    yield b"".join(buffer)
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse trả về mỗi row là một JSON object trên một dòng (NDJSON).
+
+    Args:
+        rows (AsyncIterable[Any]): Nguồn rows, ví dụ Repository.stream_all()
+        dto (Optional[Type[BaseModel]]): DTO dùng để validate/serialize từng row
+        rows_per_chunk (int): Số rows gom vào mỗi chunk gửi đi
+        status_code (int): HTTP status code
+        headers (Optional[Mapping[str, str]]): Headers bổ sung
+        background (Optional[BackgroundTask]): Task chạy sau khi gửi xong
+
+    Example:
+        >>> @router.get("/items/export")
+        ... async def export_items(repository: ItemRepository = Injects("item_repository")):
+        ...     return NDJSONStreamingResponse(repository.stream_all(), dto=ItemDto)
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(
+        self,
+        rows: AsyncIterable[Any],
+        dto: Optional[Type[BaseModel]] = None,
+        rows_per_chunk: int = 100,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        super().__init__(
+            _iter_chunks(rows, dto, rows_per_chunk, prefix=b"", separator=b"\n", suffix=b"\n"),
+            status_code=status_code,
+            headers=headers,
+            background=background,
+        )
+
+
+class JSONArrayStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse trả về một JSON array, gửi dần từng chunk rows.
+
+    Args:
+        rows (AsyncIterable[Any]): Nguồn rows, ví dụ Repository.stream_all()
+        dto (Optional[Type[BaseModel]]): DTO dùng để validate/serialize từng row
+        rows_per_chunk (int): Số rows gom vào mỗi chunk gửi đi
+        status_code (int): HTTP status code
+        headers (Optional[Mapping[str, str]]): Headers bổ sung
+        background (Optional[BackgroundTask]): Task chạy sau khi gửi xong
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        rows: AsyncIterable[Any],
+        dto: Optional[Type[BaseModel]] = None,
+        rows_per_chunk: int = 100,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        super().__init__(
+            _iter_chunks(rows, dto, rows_per_chunk, prefix=b"[", separator=b",", suffix=b"]"),
+            status_code=status_code,
+            headers=headers,
+            background=background,
+        )
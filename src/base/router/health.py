@@ -2,7 +2,9 @@
 Module cung cấp health check endpoint.
 Endpoint này được sử dụng bởi load balancer và monitoring systems.
 """
-from fastapi import APIRouter
+from http import HTTPStatus
+
+from fastapi import APIRouter, Request
 from starlette.responses import PlainTextResponse
 
 
@@ -10,14 +12,21 @@ router = APIRouter()
 
 
 @router.get("/health", include_in_schema=False, response_class=PlainTextResponse)
-async def get_health() -> PlainTextResponse:
+async def get_health(request: Request) -> PlainTextResponse:
     """
     Health check endpoint.
 
-    Trả về "OK" nếu service đang hoạt động bình thường.
+    Trả về "OK" nếu service đang hoạt động bình thường, "WARMING UP" với
+    status 503 khi worker còn đang warm-up (state.readiness chưa ready).
     Endpoint này không xuất hiện trong OpenAPI schema.
 
+    Args:
+        request (Request): Request hiện tại, chứa readiness trong state
+
     Returns:
-        PlainTextResponse: "OK" với status 200.
+        PlainTextResponse: "OK" với status 200, hoặc "WARMING UP" với status 503.
     """
+    readiness = getattr(request.state, "readiness", None)
+    if readiness is not None and not readiness.ready:
+        return PlainTextResponse("WARMING UP", status_code=HTTPStatus.SERVICE_UNAVAILABLE)
     return PlainTextResponse("OK")
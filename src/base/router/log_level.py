@@ -0,0 +1,79 @@
+"""
+Module cung cấp admin endpoints để xem/đổi log level lúc runtime.
+
+Chỉ được đăng ký khi có LOG_ADMIN_TOKEN; mỗi request phải gửi token
+qua header X-Admin-Token. Endpoints không xuất hiện trong OpenAPI schema.
+Với nhiều workers, mỗi request chỉ đổi level của worker nhận request.
+"""
+import hmac
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Request
+from pydantic import BaseModel
+
+from src.base.exception.api.base import HTTPException
+from src.logger.LoggerFactory import LoggerFactory
+
+
+class AdminForbiddenException(HTTPException):
+    """Admin token không hợp lệ."""
+
+    status = HTTPStatus.FORBIDDEN
+
+
+class LogLevelUpdate(BaseModel):
+    """
+    Body đổi log level.
+
+    Attributes:
+        level (str): Level mới (DEBUG, INFO, WARNING, ...)
+        logger (str): Tên logger, mặc định "app"
+    """
+
+    level: str
+    logger: str = "app"
+
+
+def _verify_admin_token(request: Request, x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """
+    Kiểm tra header X-Admin-Token với LOG_ADMIN_TOKEN.
+
+    Raises:
+        AdminForbiddenException: Nếu token thiếu hoặc không khớp.
+    """
+    expected = request.app.state.log_admin_token
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise AdminForbiddenException(detail="Invalid admin token")
+
+
+router = APIRouter(dependencies=[Depends(_verify_admin_token)])
+
+
+@router.get("/admin/log-level", include_in_schema=False)
+async def get_log_levels() -> dict[str, str]:
+    """
+    Lấy log level hiện tại của các loggers đã cấu hình.
+
+    Returns:
+        dict[str, str]: Tên logger -> level
+    """
+    return LoggerFactory.get_levels()
+
+
+@router.put("/admin/log-level", include_in_schema=False)
+async def put_log_level(body: LogLevelUpdate) -> dict[str, str]:
+    """
+    Đổi log level của một logger (không cần restart).
+
+    Args:
+        body (LogLevelUpdate): Logger và level mới
+
+    Returns:
+        dict[str, str]: Log levels sau khi đổi
+
+    Raises:
+        ValueError: Nếu level không hợp lệ (400).
+    """
+    LoggerFactory.set_level(body.level, body.logger)
+    return LoggerFactory.get_levels()
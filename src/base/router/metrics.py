@@ -0,0 +1,21 @@
+"""
+Module cung cấp endpoint /metrics theo Prometheus text format.
+"""
+from fastapi import APIRouter
+from starlette.responses import Response
+
+from src.base.metrics.registry import registry
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """
+    Trả về metrics của worker process hiện tại.
+
+    Returns:
+        Response: Metrics ở Prometheus text exposition format 0.0.4.
+    """
+    return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
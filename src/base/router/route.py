@@ -0,0 +1,136 @@
+"""
+Module cung cấp APIRoute bỏ qua bước validate lại response model.
+
+Với response_model, FastAPI validate kết quả của endpoint rồi mới serialize,
+kể cả khi endpoint đã trả về đúng instance của model đó. ModelResponseRoute
+trả trực tiếp instance đó qua FastJSONResponse (serialize một lần, thẳng
+ra bytes). Các trường hợp khác (dict, subclass của model, ...) vẫn đi qua
+FastAPI như cũ.
+"""
+import dataclasses
+import functools
+import inspect
+from typing import Any, Callable, Optional, Type
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute, request_response
+from pydantic import BaseModel
+
+from src.base.response.json import FastJSONResponse
+
+
+class ModelResponseRoute(APIRoute):
+    """
+    APIRoute trả response model trực tiếp khi endpoint trả về đúng model đã khai báo.
+
+    Chỉ áp dụng khi response class là FastJSONResponse (hoặc subclass), response_model
+    là một Pydantic model, route không dùng response_model_include/exclude/exclude_*
+    và không dependency nào nhận tham số Response (headers/status code đặt qua tham số
+    đó sẽ không được áp dụng cho response trả trực tiếp).
+
+    Example:
+        >>> router = APIRouter(prefix="/items", route_class=ModelResponseRoute)
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, endpoint, **kwargs)
+
+        response_class = self._get_response_class()
+        if response_class is None or not self._can_return_model_directly():
+            return
+
+        self.dependant = dataclasses.replace(
+            self.dependant,
+            call=_return_model_directly(endpoint, self.response_model, response_class, self.status_code),
+        )
+        self.app = request_response(self.get_route_handler())
+
+    def _get_response_class(self) -> Optional[Type[FastJSONResponse]]:
+        """
+        Response class của route nếu là FastJSONResponse.
+
+        Returns:
+            Optional[Type[FastJSONResponse]]: Response class, hoặc None
+        """
+        response_class = self.response_class
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        if inspect.isclass(response_class) and issubclass(response_class, FastJSONResponse):
+            return response_class
+        return None
+
+    def _can_return_model_directly(self) -> bool:
+        """
+        Kiểm tra route có thể bỏ qua validate/serialize của FastAPI.
+
+        Returns:
+            bool: True nếu serialize trực tiếp cho kết quả giống FastAPI
+        """
+        return (
+            inspect.isclass(self.response_model)
+            and issubclass(self.response_model, BaseModel)
+            and self.response_model_by_alias
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+            and not _uses_response_param(self.dependant)
+        )
+
+
+def _uses_response_param(dependant: Dependant) -> bool:
+    """
+    Kiểm tra endpoint hoặc dependency nào đó nhận tham số Response.
+
+    Args:
+        dependant (Dependant): Dependant của endpoint
+
+    Returns:
+        bool: True nếu có tham số Response
+    """
+    return dependant.response_param_name is not None or any(
+        _uses_response_param(sub_dependant) for sub_dependant in dependant.dependencies
+    )
+
+
+def _return_model_directly(
+    endpoint: Callable[..., Any],
+    response_model: Type[BaseModel],
+    response_class: Type[FastJSONResponse],
+    status_code: Optional[int],
+) -> Callable[..., Any]:
+    """
+    Bọc endpoint để trả response khi kết quả đúng là instance của response_model.
+
+    Args:
+        endpoint (Callable[..., Any]): Endpoint gốc
+        response_model (Type[BaseModel]): Response model đã khai báo
+        response_class (Type[FastJSONResponse]): Response class của route
+        status_code (Optional[int]): Status code của route
+
+    Returns:
+        Callable[..., Any]: Endpoint đã bọc (giữ nguyên sync/async)
+    """
+    response_args = {"status_code": status_code} if status_code else {}
+
+    def to_response(result: Any) -> Any:
+        # Subclass có thể có thêm fields, FastAPI sẽ lọc theo response_model
+        if type(result) is response_model:
+            return response_class(result, **response_args)
+        return result
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(**values: Any) -> Any:
+            return to_response(await endpoint(**values))
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(**values: Any) -> Any:
+        return to_response(endpoint(**values))
+
+    return sync_wrapper
@@ -0,0 +1,164 @@
+"""
+Module cung cấp single-flight: gộp các lời gọi đồng thời giống nhau thành một.
+
+Khi nhiều coroutine cùng gọi một hàm với cùng key trong lúc lời gọi đầu
+tiên chưa xong, chỉ lời gọi đầu tiên thực sự chạy; các lời gọi sau chờ và
+nhận cùng kết quả (hoặc cùng exception).
+"""
+import asyncio
+import functools
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+
+R = TypeVar("R")
+
+
+@dataclass
+class SingleFlightStats:
+    """
+    Bộ đếm của một SingleFlight.
+
+    Attributes:
+        calls (int): Tổng số lời gọi
+        executions (int): Số lần hàm thực sự được chạy
+        deduplicated (int): Số lời gọi được gộp vào một lời gọi đang chạy
+        timeouts (int): Số lời gọi hết thời gian chờ
+        errors (int): Số lần hàm thực sự chạy bị exception
+    """
+
+    calls: int = 0
+    executions: int = 0
+    deduplicated: int = 0
+    timeouts: int = 0
+    errors: int = 0
+
+
+class SingleFlight:
+    """
+    Gộp các lời gọi đồng thời có cùng key thành một lời gọi duy nhất.
+
+    Lời gọi được chạy trong task riêng (copy context của caller đầu tiên),
+    nên việc một caller bị cancel hoặc timeout không ảnh hưởng các caller khác.
+    Không dùng cho các hàm phụ thuộc unit-of-work của caller.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> result = await flight.do(("user", user_id), lambda: repository.get_one(user_id))
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[R]],
+        timeout: Optional[float] = None,
+    ) -> R:
+        """
+        Chạy fn, hoặc chờ lời gọi đang chạy với cùng key.
+
+        Args:
+            key (Hashable): Key xác định các lời gọi giống nhau
+            fn (Callable[[], Awaitable[R]]): Hàm cần chạy
+            timeout (Optional[float]): Thời gian chờ tối đa (giây) của caller này.
+                Hết thời gian chỉ caller này nhận TimeoutError, lời gọi chung vẫn chạy tiếp.
+
+        Returns:
+            R: Kết quả của fn
+
+        Raises:
+            asyncio.TimeoutError: Nếu chờ quá timeout.
+            Exception: Exception của fn được truyền tới tất cả callers.
+        """
+        self.stats.calls += 1
+        task = self._in_flight.get(key)
+
+        if task is None:
+            self.stats.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._on_done, key))
+        else:
+            self.stats.deduplicated += 1
+
+        try:
+            if timeout is None:
+                return await asyncio.shield(task)
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        """
+        Xóa lời gọi đã xong khỏi danh sách đang chạy.
+
+        Args:
+            key (Hashable): Key của lời gọi
+            task (asyncio.Task): Task đã xong
+        """
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Đánh dấu exception đã được lấy, tránh warning khi mọi caller đều đã timeout
+        if not task.cancelled() and task.exception() is not None:
+            self.stats.errors += 1
+
+
+def _default_key(args: tuple, kwargs: dict) -> Hashable:
+    """
+    Tạo key từ arguments của lời gọi.
+
+    Args:
+        args (tuple): Positional arguments (bao gồm self với method)
+        kwargs (dict): Keyword arguments
+
+    Returns:
+        Hashable: Key, dùng repr nếu arguments không hashable
+    """
+    key = (args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return repr(key)
+    return key
+
+
+def single_flight(
+    key: Optional[Callable[..., Hashable]] = None,
+    timeout: Optional[float] = None,
+) -> Callable[[Callable[..., Awaitable[R]]], Callable[..., Awaitable[R]]]:
+    """
+    Decorator gộp các lời gọi đồng thời giống nhau của một async function/method.
+
+    Mặc định key là toàn bộ arguments (với method, self được so sánh theo identity).
+    Bộ đếm truy cập qua `decorated_function.single_flight.stats`.
+
+    Args:
+        key (Optional[Callable[..., Hashable]]): Hàm tạo key từ arguments
+        timeout (Optional[float]): Thời gian chờ tối đa (giây) của mỗi caller
+
+    Returns:
+        Callable: Decorator
+
+    Example:
+        >>> class UserService:
+        ...     @single_flight(timeout=5.0)
+        ...     async def get_user(self, user_id: int) -> UserDto:
+        ...         ...
+    """
+
+    def decorator(fn: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+        flight = SingleFlight()
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> R:
+            call_key = key(*args, **kwargs) if key else _default_key(args, kwargs)
+            return await flight.do(call_key, lambda: fn(*args, **kwargs), timeout)
+
+        wrapper.single_flight = flight  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -0,0 +1,258 @@
+"""
+Load generator và báo cáo kết quả cho bench subcommand.
+
+Chạy `concurrency` workers song song, mỗi worker lần lượt gửi requests theo
+vòng các routes, tới khi đủ số requests hoặc hết thời gian. Kết quả gồm RPS,
+latency p50/p95/p99 và tỉ lệ lỗi cho từng route và tổng.
+"""
+import asyncio
+import itertools
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import httpx
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    Một route cần đo.
+
+    Attributes:
+        method (str): HTTP method
+        path (str): Path (có thể kèm query string)
+    """
+
+    method: str
+    path: str
+
+    @classmethod
+    def parse(cls, value: str) -> "Route":
+        """
+        Parse route từ chuỗi "METHOD /path" hoặc "/path" (GET).
+
+        Args:
+            value (str): Chuỗi route
+
+        Returns:
+            Route: Route đã parse
+
+        Raises:
+            ValueError: Nếu path không bắt đầu bằng "/".
+        """
+        parts = value.split(maxsplit=1)
+        method, path = ("GET", parts[0]) if len(parts) == 1 else (parts[0].upper(), parts[1].strip())
+        if not path.startswith("/"):
+            raise ValueError(f"Invalid route '{value}', expected 'METHOD /path'")
+        return cls(method=method, path=path)
+
+    def __str__(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+@dataclass
+class RouteStats:
+    """
+    Kết quả đo của một route.
+
+    Attributes:
+        latencies (list[float]): Latency (giây) của các requests thành công
+        errors (int): Số requests lỗi (status >= 400 hoặc exception)
+        status_codes (dict[str, int]): Số requests theo status code (hoặc tên exception)
+    """
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        """Tổng số requests."""
+        return len(self.latencies) + self.errors
+
+    def record(self, status: str, latency: Optional[float]) -> None:
+        """
+        Ghi nhận một request.
+
+        Args:
+            status (str): Status code hoặc tên exception
+            latency (Optional[float]): Latency (giây), None nếu request lỗi
+        """
+        self.status_codes[status] = self.status_codes.get(status, 0) + 1
+        if latency is None:
+            self.errors += 1
+        else:
+            self.latencies.append(latency)
+
+    def merge(self, other: "RouteStats") -> None:
+        """Gộp kết quả của route khác vào route này."""
+        self.latencies.extend(other.latencies)
+        self.errors += other.errors
+        for status, count in other.status_codes.items():
+            self.status_codes[status] = self.status_codes.get(status, 0) + count
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        """
+        Tổng hợp kết quả.
+
+        Args:
+            elapsed (float): Thời gian chạy (giây)
+
+        Returns:
+            dict[str, Any]: requests, errors, error_rate, rps, latency (ms)
+        """
+        ordered = sorted(self.latencies)
+        return {
+            "requests": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "rps": self.count / elapsed if elapsed else 0.0,
+            "latency_ms": {
+                "mean": sum(ordered) / len(ordered) * 1000 if ordered else 0.0,
+                "p50": _percentile(ordered, 50) * 1000,
+                "p95": _percentile(ordered, 95) * 1000,
+                "p99": _percentile(ordered, 99) * 1000,
+                "max": ordered[-1] * 1000 if ordered else 0.0,
+            },
+            "status_codes": dict(sorted(self.status_codes.items())),
+        }
+
+
+@dataclass
+class BenchReport:
+    """
+    Kết quả của một lần chạy bench.
+
+    Attributes:
+        target (str): URL hoặc "in-process"/"in-process (stub)"
+        concurrency (int): Số workers song song
+        elapsed (float): Thời gian chạy (giây), không tính warm-up
+        routes (dict[str, RouteStats]): Kết quả theo route
+    """
+
+    target: str
+    concurrency: int
+    elapsed: float
+    routes: dict[str, RouteStats]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Chuyển kết quả thành dict (JSON-serializable).
+
+        Returns:
+            dict[str, Any]: Kết quả theo route và tổng
+        """
+        total = RouteStats()
+        for stats in self.routes.values():
+            total.merge(stats)
+        return {
+            "target": self.target,
+            "concurrency": self.concurrency,
+            "elapsed_seconds": self.elapsed,
+            "routes": {route: stats.summary(self.elapsed) for route, stats in self.routes.items()},
+            "total": total.summary(self.elapsed),
+        }
+
+    def format_table(self) -> str:
+        """
+        Định dạng kết quả thành bảng text.
+
+        Returns:
+            str: Bảng kết quả
+        """
+        data = self.to_dict()
+        header = f"{'route':<36}{'requests':>10}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>9}"
+        lines = [
+            f"target={data['target']} concurrency={data['concurrency']} elapsed={data['elapsed_seconds']:.2f}s",
+            header,
+            "-" * len(header),
+        ]
+        rows = [*data["routes"].items(), ("TOTAL", data["total"])]
+        for name, summary in rows:
+            latency = summary["latency_ms"]
+            lines.append(
+                f"{name[:35]:<36}{summary['requests']:>10}{summary['rps']:>10.1f}"
+                f"{latency['p50']:>10.2f}{latency['p95']:>10.2f}{latency['p99']:>10.2f}"
+                f"{summary['error_rate']:>8.1%}"
+            )
+        return "\n".join(lines)
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """
+    Percentile theo nearest-rank.
+
+    Args:
+        ordered (list[float]): Giá trị đã sắp xếp tăng dần
+        percent (float): Percentile (0-100)
+
+    Returns:
+        float: Giá trị percentile, 0.0 nếu không có dữ liệu
+    """
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    routes: list[Route],
+    concurrency: int,
+    requests: Optional[int],
+    duration: Optional[float],
+    warmup: int = 0,
+    target: str = "",
+) -> BenchReport:
+    """
+    Chạy tải lên các routes.
+
+    Args:
+        client (httpx.AsyncClient): Client đã cấu hình base_url/transport
+        routes (list[Route]): Các routes, được gửi lần lượt theo vòng
+        concurrency (int): Số workers song song
+        requests (Optional[int]): Tổng số requests (None = chạy theo duration)
+        duration (Optional[float]): Thời gian chạy (giây), dùng khi requests là None
+        warmup (int): Số requests chạy trước, không tính vào kết quả
+        target (str): Mô tả target trong báo cáo
+
+    Returns:
+        BenchReport: Kết quả đo
+    """
+    for route in itertools.islice(itertools.cycle(routes), warmup):
+        await client.request(route.method, route.path)
+
+    stats = {str(route): RouteStats() for route in routes}
+    schedule = itertools.cycle(routes)
+    remaining = [requests] if requests is not None else None
+    started = time.perf_counter()
+    deadline = started + duration if duration is not None else math.inf
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            if remaining is not None:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+
+            route = next(schedule)
+            request_started = time.perf_counter()
+            try:
+                response = await client.request(route.method, route.path)
+            except httpx.HTTPError as error:
+                stats[str(route)].record(type(error).__name__, None)
+                continue
+
+            latency = time.perf_counter() - request_started
+            status = str(response.status_code)
+            stats[str(route)].record(status, latency if response.status_code < 400 else None)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return BenchReport(
+        target=target,
+        concurrency=concurrency,
+        elapsed=time.perf_counter() - started,
+        routes=stats,
+    )
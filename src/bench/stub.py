@@ -0,0 +1,84 @@
+"""
+Stub repository cho bench subcommand.
+
+StubHealthCheckRepository lưu health checks trong bộ nhớ và có cùng các
+methods mà HealthCheckService sử dụng, để đo overhead của framework
+(routing, DI, validation, serialization) mà không cần Postgres.
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from src.base.database.repository.count import CountStrategy
+from src.health.database.model.health_check import HealthCheck
+
+
+class StubHealthCheckRepository:
+    """
+    Repository giả lập HealthCheckRepository trong bộ nhớ.
+
+    Args:
+        latency (float): Độ trễ (giây) giả lập cho mỗi lời gọi, mô phỏng round trip tới database
+        initial_rows (int): Số health checks tạo sẵn
+    """
+
+    def __init__(self, latency: float = 0.0, initial_rows: int = 100) -> None:
+        self._latency = latency
+        self._rows: list[HealthCheck] = []
+        for _ in range(initial_rows):
+            self._rows.append(self._new_row())
+
+    async def create(self, values: dict[str, Any]) -> HealthCheck:
+        await self._round_trip()
+        row = self._new_row()
+        self._rows.append(row)
+        return row
+
+    async def get_multiple(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        count_strategy: Optional[CountStrategy] = None,
+    ) -> tuple[list[HealthCheck], int]:
+        await self._round_trip()
+        return self._rows[skip:skip + limit], len(self._rows)
+
+    async def get_multiple_rows(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        skip: int = 0,
+        limit: int = 20,
+        count_strategy: Optional[CountStrategy] = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        await self._round_trip()
+        names = tuple(columns) if columns is not None else ("id", "created_at", "updated_at")
+        rows = [{name: getattr(row, name) for name in names} for row in self._rows[skip:skip + limit]]
+        return rows, len(self._rows)
+
+    async def get_page_after(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        order_by: tuple[str, ...] = ("id",),
+    ) -> tuple[list[HealthCheck], Optional[str], Optional[str]]:
+        # Cursor không được hỗ trợ trong stub, luôn trả trang đầu
+        await self._round_trip()
+        return self._rows[:limit], None, None
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[HealthCheck]:
+        for start in range(0, len(self._rows), batch_size):
+            await self._round_trip()
+            for row in self._rows[start:start + batch_size]:
+                yield row
+
+    async def get_latest_check(self) -> Optional[HealthCheck]:
+        await self._round_trip()
+        return self._rows[-1] if self._rows else None
+
+    def _new_row(self) -> HealthCheck:
+        now = datetime.now()
+        return HealthCheck(id=len(self._rows) + 1, created_at=now, updated_at=now)
+
+    async def _round_trip(self) -> None:
+        # Luôn nhường event loop như một query thật
+        await asyncio.sleep(self._latency)
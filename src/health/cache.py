@@ -0,0 +1,12 @@
+"""
+HTTP response cache cho Health module.
+
+Endpoints GET dùng response_cache.cached(...), service invalidate theo
+HEALTH_CHECK_CACHE_TAG sau khi ghi health check mới.
+"""
+from src.base.response.cache import ResponseCache
+
+
+HEALTH_CHECK_CACHE_TAG = "health_check"
+
+response_cache = ResponseCache(max_entries=256)
@@ -3,11 +3,14 @@ Repository cho HealthCheck entity.
 Cung cấp các operations đặc thù cho health check data.
 """
 
-from typing import Optional
+from typing import Optional, Union
 
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from src.base.database.repository.base import Repository
+from src.base.database.repository.cache import ICacheBackend
+from src.base.database.repository.count import CountStrategy
+from src.base.engine_group import EngineGroup
 from src.health.database.model.health_check import HealthCheck
 
 
@@ -16,11 +19,18 @@ class HealthCheckRepository(Repository[HealthCheck]):
     Repository để quản lý HealthCheck entities.
 
     Args:
-        engine (AsyncEngine): SQLAlchemy async engine
+        engine (Union[AsyncEngine, EngineGroup]): SQLAlchemy async engine hoặc EngineGroup
+        count_strategy (CountStrategy): Chiến lược đếm mặc định cho get_multiple
+        cache (Optional[ICacheBackend]): Backend cho entity cache của get_one (None = tắt)
     """
 
-    def __init__(self, engine: AsyncEngine):
-        super().__init__(engine, HealthCheck)
+    def __init__(
+        self,
+        engine: Union[AsyncEngine, EngineGroup],
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        cache: Optional[ICacheBackend] = None,
+    ):
+        super().__init__(engine, HealthCheck, count_strategy=count_strategy, cache=cache)
 
 
     async def get_latest_check(self) -> Optional[HealthCheck]:
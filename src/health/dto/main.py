@@ -5,9 +5,13 @@ DTOs cho health check module.
 
 from datetime import datetime
 
-from pydantic import field_serializer
-
-from src.base.dto.main import PaginatedRequestBase, PaginatedResponseBase, ResponseBase
+from src.base.dto.main import (
+    CursorPaginatedRequestBase,
+    CursorPaginatedResponseBase,
+    PaginatedRequestBase,
+    PaginatedResponseBase,
+    ResponseBase,
+)
 
 
 class DbHealthCheckRequest(PaginatedRequestBase):
@@ -18,10 +22,20 @@ class DbHealthCheckRequest(PaginatedRequestBase):
     pass
 
 
+class DbHealthCheckCursorRequest(CursorPaginatedRequestBase):
+    """
+    Request params cho endpoint lấy danh sách health checks theo cursor.
+    """
+
+    pass
+
+
 class DbHealthCheckDto(ResponseBase):
     """
     DTO đại diện cho một health check entry.
 
+    Datetime được pydantic-core serialize sang ISO 8601 (không qua Python callback).
+
     Attributes:
         id (int): ID của health check
         created_at (datetime): Thời điểm tạo
@@ -32,19 +46,6 @@ class DbHealthCheckDto(ResponseBase):
     created_at: datetime
     updated_at: datetime
 
-    @field_serializer("created_at", "updated_at")
-    def serialize_dates(self, value: datetime) -> str:
-        """
-        Serialize datetime thành ISO format string.
-
-        Args:
-            value (datetime): Giá trị datetime
-
-        Returns:
-            str: ISO format string
-        """
-        return value.isoformat() if value else None  # type: ignore
-
 
 class DbHealthCheckCreateResponse(ResponseBase):
     """
@@ -68,3 +69,14 @@ class DbHealthCheckResponseDto(PaginatedResponseBase):
     """
 
     health_checks: list[DbHealthCheckDto]
+
+
+class DbHealthCheckCursorResponseDto(CursorPaginatedResponseBase):
+    """
+    Response chứa danh sách health checks với cursor pagination.
+
+    Attributes:
+        health_checks (list[DbHealthCheckDto]): Danh sách health checks
+    """
+
+    health_checks: list[DbHealthCheckDto]
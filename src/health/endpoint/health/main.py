@@ -4,13 +4,20 @@ Cung cấp các API endpoints để kiểm tra trạng thái database.
 """
 
 import logging
+from typing import Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from starlette.responses import StreamingResponse
 
-from src.base.dependency_injection import Injects
+from src.base.dependency_injection import Injects, UnitOfWork
+from src.base.response.streaming import JSONArrayStreamingResponse, NDJSONStreamingResponse
+from src.base.router.route import ModelResponseRoute
+from src.health.cache import HEALTH_CHECK_CACHE_TAG, response_cache
 from src.health.doc import Tags
 from src.health.service.health_check.main import HealthCheckService
 from src.health.dto.main import (
+    DbHealthCheckCursorRequest,
+    DbHealthCheckCursorResponseDto,
     DbHealthCheckRequest,
     DbHealthCheckDto,
     DbHealthCheckResponseDto,
@@ -20,7 +27,7 @@ from src.health.dto.main import (
 
 logger = logging.getLogger("app")
 
-router = APIRouter(tags=[Tags.HEALTH], prefix="/health")
+router = APIRouter(tags=[Tags.HEALTH], prefix="/health", route_class=ModelResponseRoute)
 
 
 @router.post(
@@ -29,6 +36,7 @@ router = APIRouter(tags=[Tags.HEALTH], prefix="/health")
     summary="Database Health Check",
     description="Tạo một health check entry mới để verify database connection",
     status_code=201,
+    dependencies=[UnitOfWork()],
 )
 async def check_db_health(
     health_check_service: HealthCheckService = Injects("health_check_service"),
@@ -52,6 +60,7 @@ async def check_db_health(
     description="Lấy danh sách health check entries với pagination",
     status_code=200,
 )
+@response_cache.cached(ttl=2.0, stale_while_revalidate=10.0, tags=[HEALTH_CHECK_CACHE_TAG])
 async def get_db_health(
     request: DbHealthCheckRequest = Depends(DbHealthCheckRequest.as_query),
     health_check_service: HealthCheckService = Injects("health_check_service"),
@@ -72,6 +81,60 @@ async def get_db_health(
     )
 
 
+@router.get(
+    path="/db/cursor",
+    response_model=DbHealthCheckCursorResponseDto,
+    summary="Get Database Health Checks (Cursor)",
+    description="Lấy danh sách health check entries với cursor pagination, chi phí không đổi theo độ sâu",
+    status_code=200,
+)
+async def get_db_health_by_cursor(
+    request: DbHealthCheckCursorRequest = Depends(DbHealthCheckCursorRequest.as_query),
+    health_check_service: HealthCheckService = Injects("health_check_service"),
+) -> DbHealthCheckCursorResponseDto:
+    """
+    Lấy danh sách health check entries với cursor pagination.
+
+    Args:
+        request (DbHealthCheckCursorRequest): Request params (cursor, page_size)
+        health_check_service (HealthCheckService): Service xử lý health check
+
+    Returns:
+        DbHealthCheckCursorResponseDto: Danh sách health checks với nextCursor/prevCursor
+    """
+    return await health_check_service.get_db_health_checks_after(
+        cursor=request.cursor,
+        page_size=request.page_size,
+    )
+
+
+@router.get(
+    path="/db/export",
+    response_class=StreamingResponse,
+    summary="Export Database Health Checks",
+    description="Stream toàn bộ health check entries dạng NDJSON hoặc JSON array",
+    status_code=200,
+)
+async def export_db_health(
+    export_format: Literal["ndjson", "json"] = Query(default="ndjson", alias="format"),
+    health_check_service: HealthCheckService = Injects("health_check_service"),
+) -> StreamingResponse:
+    """
+    Stream toàn bộ health check entries, bộ nhớ không tăng theo số records.
+
+    Args:
+        export_format (str): "ndjson" (mỗi dòng một object) hoặc "json" (JSON array)
+        health_check_service (HealthCheckService): Service xử lý health check
+
+    Returns:
+        StreamingResponse: Body được serialize dần trong lúc đọc từ database
+    """
+    rows = health_check_service.stream_db_health_checks()
+    if export_format == "json":
+        return JSONArrayStreamingResponse(rows)
+    return NDJSONStreamingResponse(rows)
+
+
 @router.get(
     path="/db/latest",
     response_model=DbHealthCheckDto,
@@ -79,6 +142,7 @@ async def get_db_health(
     description="Lấy health check entry mới nhất",
     status_code=200,
 )
+@response_cache.cached(ttl=2.0, stale_while_revalidate=10.0, tags=[HEALTH_CHECK_CACHE_TAG])
 async def get_latest_db_health(
     health_check_service: HealthCheckService = Injects("health_check_service"),
 ) -> DbHealthCheckDto:
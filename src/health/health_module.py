@@ -6,9 +6,14 @@ Cung cấp health check functionality cho application.
 """
 
 from dataclasses import dataclass
+from typing import ClassVar
 
+from src.base.database.repository.cache import InMemoryCacheBackend
+from src.base.dto.batch import list_adapter
 from src.base.module import IModule, ModuleContext, ModuleDependencies
+from src.health.cache import response_cache
 from src.health.database.repository.health import HealthCheckRepository
+from src.health.dto.main import DbHealthCheckDto
 from src.health.service.health_check.main import HealthCheckService
 
 
@@ -22,8 +27,15 @@ class HealthModule(IModule):
         - health_check_service: HealthCheckService instance
 
     Cross-module dependencies: Không có
+
+    Config:
+        HEALTH_CHECK_CACHE_SIZE: Số entries tối đa của entity cache (0 = tắt, mặc định)
+        HEALTH_CHECK_CACHE_TTL: TTL (giây) của entity cache, mặc định 60.0
     """
 
+    provides: ClassVar[tuple[str, ...]] = ("health_check_repository", "health_check_service")
+    requires: ClassVar[tuple[str, ...]] = ()
+
     _repository: HealthCheckRepository | None = None
     _service: HealthCheckService | None = None
 
@@ -37,15 +49,40 @@ class HealthModule(IModule):
         Returns:
             ModuleDependencies: health_check_repository, health_check_service
         """
-        # Khởi tạo repository
-        self._repository = HealthCheckRepository(engine=context.db_engine)
+        # Entity cache cho get_one (tắt nếu HEALTH_CHECK_CACHE_SIZE = 0)
+        cache_size = context.config.get_int("HEALTH_CHECK_CACHE_SIZE", 0)
+        cache = InMemoryCacheBackend(
+            max_size=cache_size,
+            ttl=context.config.get_float("HEALTH_CHECK_CACHE_TTL", 60.0),
+        ) if cache_size > 0 else None
+
+        # Khởi tạo repository (đọc từ replicas nếu có cấu hình)
+        self._repository = HealthCheckRepository(
+            engine=context.db_engine_group or context.db_engine,
+            cache=cache,
+        )
 
         # Khởi tạo service
         self._service = HealthCheckService(
             health_check_repository=self._repository,
+            response_cache=response_cache,
         )
 
         return ModuleDependencies(
             services={"health_check_service": self._service},
             repositories={"health_check_repository": self._repository},
         )
+
+    async def warmup(self, calls: int) -> None:
+        """
+        Dựng trước TypeAdapter của DbHealthCheckDto và chạy các lời gọi đọc danh sách.
+
+        Args:
+            calls (int): Số lần lặp lại các lời gọi đọc
+        """
+        list_adapter(DbHealthCheckDto)
+        if self._service is None:
+            return
+        for _ in range(calls):
+            await self._service.get_db_health_checks(target_page=1, page_size=20)
+            await self._service.get_db_health_checks_after(cursor=None, page_size=20)
@@ -4,28 +4,52 @@ Chứa business logic cho các operations liên quan đến health check.
 """
 
 import logging
-
+from typing import AsyncIterator, Optional
+
+from src.base.database.repository.count import CountStrategy
+from src.base.database.unit_of_work import after_commit
+from src.base.dto.batch import validate_many
+from src.base.response.cache import ResponseCache
+from src.base.single_flight import single_flight
+from src.logger.LogSampler import LogSampler
+from src.health.cache import HEALTH_CHECK_CACHE_TAG
 from src.health.database.repository.health import HealthCheckRepository
 from src.health.dto.main import (
     DbHealthCheckDto,
+    DbHealthCheckCursorResponseDto,
     DbHealthCheckResponseDto,
     DbHealthCheckCreateResponse,
 )
 
 
 logger = logging.getLogger("app")
+# Các log tần suất cao (mỗi request) ghi tối đa 1 dòng/giây
+sampled_logger = LogSampler(logger, limit=1, period=1.0)
+
+# Các cột của DbHealthCheckDto, list endpoints đọc rows thay vì ORM entities
+DB_HEALTH_CHECK_COLUMNS = ("id", "created_at", "updated_at")
 
 
 class HealthCheckService:
     """
     Service xử lý các operations liên quan đến health check.
 
+    Các method không tự quản lý transaction: khi endpoint mở UnitOfWork,
+    mọi repository call trong method dùng chung một connection.
+
     Args:
         health_check_repository (HealthCheckRepository): Repository để truy cập database
+        response_cache (Optional[ResponseCache]): HTTP response cache của các GET endpoints,
+            được invalidate sau khi ghi
     """
 
-    def __init__(self, health_check_repository: HealthCheckRepository):
+    def __init__(
+        self,
+        health_check_repository: HealthCheckRepository,
+        response_cache: Optional[ResponseCache] = None,
+    ):
         self._repository = health_check_repository
+        self._response_cache = response_cache
 
     async def check_db_health(self) -> DbHealthCheckCreateResponse:
         """
@@ -35,13 +59,18 @@ class HealthCheckService:
             DbHealthCheckCreateResponse: Response chứa message và id của entry vừa tạo
         """
         entity = await self._repository.create({})
-        logger.info(f"Created health check entry with id={entity.id}")
+        if self._response_cache is not None:
+            # Invalidate sau commit, tránh GET đồng thời cache lại dữ liệu chưa commit
+            response_cache = self._response_cache
+            after_commit(lambda: response_cache.invalidate_tags(HEALTH_CHECK_CACHE_TAG))
+        sampled_logger.info("Created health check entry with id=%s", entity.id)
         return DbHealthCheckCreateResponse(message="DB OK", id=entity.id)
 
     async def get_db_health_checks(
         self,
         target_page: int,
         page_size: int,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> DbHealthCheckResponseDto:
         """
         Lấy danh sách health check entries với pagination.
@@ -49,28 +78,81 @@ class HealthCheckService:
         Args:
             target_page (int): Trang cần lấy (1-indexed)
             page_size (int): Số records mỗi trang
+            count_strategy (Optional[CountStrategy]): Chiến lược đếm tổng số records.
+                None = dùng chiến lược mặc định của repository.
 
         Returns:
             DbHealthCheckResponseDto: Response chứa danh sách health checks và pagination info
         """
         skip = (target_page - 1) * page_size
-        result, count = await self._repository.get_multiple(
+        rows, count = await self._repository.get_multiple_rows(
+            columns=DB_HEALTH_CHECK_COLUMNS,
             limit=page_size,
             skip=skip,
+            count_strategy=count_strategy,
         )
 
         total_pages = (count + page_size - 1) // page_size
         return DbHealthCheckResponseDto(
-            health_checks=[DbHealthCheckDto.model_validate(item) for item in result],
+            # Rows từ database đã đúng kiểu của DTO, không cần validate lại
+            health_checks=validate_many(DbHealthCheckDto, rows, strict=True),
             current_page=target_page,
             total_pages=total_pages,
             page_size=page_size,
         )
 
+    async def get_db_health_checks_after(
+        self,
+        cursor: Optional[str],
+        page_size: int,
+    ) -> DbHealthCheckCursorResponseDto:
+        """
+        Lấy danh sách health check entries với cursor pagination.
+
+        Chi phí mỗi trang không phụ thuộc vào độ sâu như OFFSET pagination.
+
+        Args:
+            cursor (Optional[str]): Cursor từ response trước (None = trang đầu)
+            page_size (int): Số records mỗi trang
+
+        Returns:
+            DbHealthCheckCursorResponseDto: Response chứa danh sách health checks và cursors
+
+        Raises:
+            ValueError: Nếu cursor không hợp lệ
+        """
+        result, next_cursor, prev_cursor = await self._repository.get_page_after(
+            cursor=cursor,
+            limit=page_size,
+        )
+
+        return DbHealthCheckCursorResponseDto(
+            health_checks=validate_many(DbHealthCheckDto, result),
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            page_size=page_size,
+        )
+
+    async def stream_db_health_checks(self, batch_size: int = 1000) -> AsyncIterator[DbHealthCheckDto]:
+        """
+        Duyệt toàn bộ health check entries bằng server-side cursor.
+
+        Args:
+            batch_size (int): Số records mỗi lần fetch từ database
+
+        Yields:
+            DbHealthCheckDto: Từng health check entry
+        """
+        async for item in self._repository.stream_all(batch_size=batch_size):
+            yield DbHealthCheckDto.model_validate(item)
+
+    @single_flight(timeout=5.0)
     async def get_latest_db_health_check(self) -> DbHealthCheckDto:
         """
         Lấy health check entry mới nhất.
 
+        Các lời gọi đồng thời dùng chung một query (single-flight).
+
         Returns:
             DbHealthCheckDto: Health check entry mới nhất
 
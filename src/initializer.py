@@ -2,27 +2,34 @@
 Main application initializer module.
 
 AppInitializer là orchestrator chính, điều phối việc khởi tạo tất cả
-service modules theo đúng thứ tự dependencies.
+service modules theo DAG dựng từ provides/requires của từng module.
 
 Pattern: Composite Initializer
 - Kế thừa từ Initializer base (setup app, validate, engine)
 - Điều phối các IModule để đăng ký dependencies
-- Quản lý cross-module dependencies qua shared_repositories
+- Quản lý cross-module dependencies qua shared_repositories/shared_services
+- Modules không phụ thuộc nhau được khởi tạo đồng thời
 """
 
+import asyncio
+import logging
+import time
 from types import TracebackType
 from typing import Optional, Type, Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine
 from fastapi import FastAPI
 
+from src.base.engine_group import EngineGroup
 from src.base.initializer import State, Initializer
-from src.base.module import IModule, ModuleContext
+from src.base.module import IModule, ModuleContext, ModuleDependencies
+from src.base.module_graph import ModuleGraphError, resolve_module_levels
+from src.logger.LoggerFactory import LoggerFactory
 
 # =============================================================================
 # IMPORT MODULES
 # Các modules được import ở đây, thứ tự import không quan trọng.
-# Thứ tự khởi tạo được định nghĩa trong self._modules.
+# Thứ tự khởi tạo được suy ra từ provides/requires của từng module.
 # =============================================================================
 from src.health.health_module import HealthModule
 
@@ -47,6 +54,7 @@ class AppState(State):
 
     # Database
     db_engine: AsyncEngine
+    db_engine_group: EngineGroup
 
     # Services
     health_check_service: HealthCheckService
@@ -60,7 +68,8 @@ class AppInitializer(Initializer):
     Main initializer kế thừa từ Initializer base.
 
     Điều phối khởi tạo tất cả modules theo thứ tự dependencies.
-    Xử lý cross-module dependencies qua ModuleContext.shared_repositories.
+    Xử lý cross-module dependencies qua ModuleContext.shared_repositories
+    và ModuleContext.shared_services.
     """
 
     def __init__(self, app: FastAPI) -> None:
@@ -73,18 +82,22 @@ class AppInitializer(Initializer):
         super().__init__(app=app)
 
         # =================================================================
-        # ĐỊNH NGHĨA THỨ TỰ KHỞI TẠO MODULES
+        # ĐĂNG KÝ MODULES
         #
-        # THỨ TỰ RẤT QUAN TRỌNG khi có cross-module dependencies!
+        # Thứ tự trong danh sách KHÔNG quyết định thứ tự khởi tạo: mỗi
+        # module khai báo provides/requires, AppInitializer dựng DAG và
+        # chia modules thành các levels. Modules cùng level được khởi tạo
+        # đồng thời, level sau chỉ bắt đầu khi các levels trước xong.
         #
-        # Quy tắc:
-        # 1. Modules độc lập (không phụ thuộc module khác) có thể đặt
-        #    ở bất kỳ vị trí nào trong nhóm độc lập
-        # 2. Modules có dependencies PHẢI đặt SAU modules mà nó phụ thuộc
+        # Raises ModuleGraphError ngay khi startup nếu có cycle, tên được
+        # require nhưng không module nào provide, hoặc provide trùng tên.
         # =================================================================
         self._modules: list[IModule] = [
             HealthModule(),  # Module độc lập
         ]
+        self._module_levels = resolve_module_levels(self._modules)
+        # Levels đã khởi tạo xong, dùng để shutdown theo thứ tự ngược
+        self._initialized_levels: list[list[IModule]] = []
 
     async def __aenter__(self) -> AppState:
         """
@@ -92,13 +105,19 @@ class AppInitializer(Initializer):
 
         Flow:
         1. Gọi lớp cha để setup app, validate OpenAPI, khởi tạo engine
-        2. Tạo DB engine từ EngineFactory
-        3. Khởi tạo từng module theo thứ tự, thu thập dependencies
-        4. Cập nhật shared_repositories sau mỗi module để modules sau sử dụng
-        5. Trả về AppState chứa tất cả dependencies
+        2. Tạo DB engine group (primary + replicas) từ EngineFactory
+        3. Khởi tạo modules theo từng level của DAG (đồng thời trong một level),
+           thu thập dependencies
+        4. Cập nhật shared_repositories/shared_services sau mỗi module để các
+           modules phụ thuộc sử dụng
+        5. Bắt đầu warm-up trong background task
+        6. Trả về AppState chứa tất cả dependencies
 
         Returns:
             AppState: State chứa tất cả services và repositories
+
+        Raises:
+            ModuleGraphError: Nếu module không trả về đủ các tên đã khai báo trong provides
         """
         # =================================================================
         # BƯỚC 1: Gọi lớp cha
@@ -112,53 +131,76 @@ class AppInitializer(Initializer):
 
         # =================================================================
         # BƯỚC 2: Tạo DB engine
+        # EngineGroup gồm primary và read replicas (DB_REPLICA_HOSTS),
+        # db_engine là primary engine của group
         # =================================================================
-        db_engine = self.engine_factory.create_engine("DB")
+        db_engine_group = self.engine_factory.create_engine_group("DB")
+        db_engine = db_engine_group.primary
 
         # =================================================================
         # BƯỚC 3: Tạo ModuleContext
         # Context này được truyền xuống tất cả modules, chứa:
-        # - db_engine: Để tạo repositories
+        # - db_engine, db_engine_group: Để tạo repositories
         # - config: Để đọc configuration
-        # - shared_repositories: Dict rỗng ban đầu, sẽ được cập nhật
-        #   sau mỗi module để modules sau có thể sử dụng
+        # - shared_repositories, shared_services: Dict rỗng ban đầu, sẽ được
+        #   cập nhật sau mỗi module để modules phụ thuộc có thể sử dụng
         # =================================================================
         context = ModuleContext(
             db_engine=db_engine,
             config=self.config,
             shared_repositories={},
+            shared_services={},
+            db_engine_group=db_engine_group,
         )
 
         # =================================================================
-        # BƯỚC 4: Khởi tạo từng module và thu thập dependencies
+        # BƯỚC 4: Khởi tạo modules theo từng level và thu thập dependencies
+        # Modules trong một level không phụ thuộc nhau nên chạy đồng thời.
+        # Nếu một module lỗi, các modules cùng level vẫn chạy xong, sau đó
+        # các modules đã khởi tạo được shutdown trước khi raise lỗi.
         # =================================================================
+        logger = logging.getLogger("app")
+        started = time.perf_counter()
         all_services: dict[str, Any] = {}
         all_repositories: dict[str, Any] = {}
 
-        for module in self._modules:
-            # Module.initialize() trả về ModuleDependencies
-            # chứa services và repositories của module đó
-            deps = await module.initialize(context)
-
-            # Thu thập vào collections chung
-            all_services.update(deps.services)
-            all_repositories.update(deps.repositories)
+        for level in self._module_levels:
+            results = await asyncio.gather(
+                *(self._initialize_module(module, context) for module in level),
+                return_exceptions=True,
+            )
+            self._initialized_levels.append(
+                [module for module, result in zip(level, results) if not isinstance(result, BaseException)]
+            )
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors:
+                await self._shutdown_modules()
+                raise errors[0]
+
+            for deps in results:
+                # Thu thập vào collections chung
+                all_services.update(deps.services)
+                all_repositories.update(deps.repositories)
+
+        logger.info(
+            f"Initialized {len(self._modules)} modules in {len(self._module_levels)} levels "
+            f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
 
-            # =============================================================
-            # QUAN TRỌNG: Cập nhật shared_repositories
-            # Sau khi một module khởi tạo xong, repositories của nó
-            # được thêm vào shared_repositories để modules sau có thể
-            # sử dụng (cross-module dependencies).
-            # =============================================================
-            context.shared_repositories.update(deps.repositories)
+        # =================================================================
+        # BƯỚC 5: Bắt đầu warm-up trong background
+        # /health trả 503 cho tới khi warmup() xong (state.readiness)
+        # =================================================================
+        self._start_warmup()
 
         # =================================================================
-        # BƯỚC 5: Trả về AppState
+        # BƯỚC 6: Trả về AppState
         # Merge state từ lớp cha với tất cả dependencies đã thu thập
         # =================================================================
         return AppState(
             **state,
             db_engine=db_engine,
+            db_engine_group=db_engine_group,
             **all_services,
             **all_repositories,
         )
@@ -172,18 +214,103 @@ class AppInitializer(Initializer):
         """
         Shutdown application.
 
-        Gọi shutdown() của từng module theo thứ tự ngược lại,
-        sau đó gọi lớp cha để cleanup engine.
+        Gọi shutdown() của các modules theo thứ tự topo ngược (level sau
+        shutdown trước), sau đó gọi lớp cha để cleanup engine và flush log queue.
 
         Args:
             exc_type: Exception type nếu có
             exc_val: Exception value nếu có
             exc_tb: Exception traceback nếu có
         """
-        # Shutdown modules theo thứ tự ngược (LIFO)
-        # Module khởi tạo sau sẽ shutdown trước
-        for module in reversed(self._modules):
-            await module.shutdown()
+        # Module phụ thuộc module khác sẽ shutdown trước module đó
+        await self._shutdown_modules()
 
         # Gọi lớp cha để cleanup EngineFactory
         await super().__aexit__(exc_type, exc_val, exc_tb)
+
+        # Ghi hết log records còn trong queue (LOG_ASYNC) trước khi process thoát
+        dropped = LoggerFactory.dropped_records()
+        if dropped:
+            logging.getLogger("app").warning(f"Dropped {dropped} log records because the log queue was full")
+        LoggerFactory.flush()
+
+    async def warmup(self) -> None:
+        """
+        Warm-up của lớp cha (engines, mappers, validators), sau đó warm-up modules.
+
+        Modules được warm-up theo từng level như lúc khởi tạo, mỗi module chạy
+        WARMUP_CALLS lần các lời gọi warm-up của nó. Lỗi của một module được
+        ghi log và không chặn các modules khác.
+        """
+        await super().warmup()
+
+        calls = self.config.get_int("WARMUP_CALLS", 1)
+        for level in self._module_levels:
+            await asyncio.gather(*(self._warmup_module(module, calls) for module in level))
+
+    async def _warmup_module(self, module: IModule, calls: int) -> None:
+        """
+        Warm-up một module, ghi log thời gian hoặc lỗi.
+
+        Args:
+            module (IModule): Module cần warm-up
+            calls (int): Số lần lặp các lời gọi warm-up
+        """
+        logger = logging.getLogger("app")
+        started = time.perf_counter()
+        try:
+            await module.warmup(calls)
+        except Exception:
+            logger.exception(f"Failed to warm up module {module.name}")
+            return
+        logger.info(f"Warmed up module {module.name} in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    async def _initialize_module(self, module: IModule, context: ModuleContext) -> ModuleDependencies:
+        """
+        Khởi tạo một module, ghi log thời gian khởi tạo.
+
+        Repositories/services của module được thêm vào context ngay khi module
+        khởi tạo xong để các modules phụ thuộc sử dụng.
+
+        Args:
+            module (IModule): Module cần khởi tạo
+            context (ModuleContext): Shared resources
+
+        Returns:
+            ModuleDependencies: Services và repositories của module
+
+        Raises:
+            ModuleGraphError: Nếu module không trả về đủ các tên đã khai báo trong provides
+        """
+        started = time.perf_counter()
+        deps = await module.initialize(context)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        missing = set(module.provides) - deps.services.keys() - deps.repositories.keys()
+        if missing:
+            raise ModuleGraphError(f"{module.name} did not provide {', '.join(sorted(missing))}")
+
+        # =============================================================
+        # QUAN TRỌNG: Cập nhật shared_repositories/shared_services
+        # Modules phụ thuộc (level sau) đọc dependencies từ đây.
+        # =============================================================
+        context.shared_repositories.update(deps.repositories)
+        context.shared_services.update(deps.services)
+
+        logging.getLogger("app").info(f"Initialized module {module.name} in {elapsed_ms:.1f} ms")
+        return deps
+
+    async def _shutdown_modules(self) -> None:
+        """
+        Shutdown các modules đã khởi tạo theo thứ tự topo ngược.
+
+        Modules trong cùng level được shutdown đồng thời. Lỗi của một module
+        được ghi log và không chặn shutdown của các modules còn lại.
+        """
+        logger = logging.getLogger("app")
+        while self._initialized_levels:
+            level = self._initialized_levels.pop()
+            results = await asyncio.gather(*(module.shutdown() for module in level), return_exceptions=True)
+            for module, result in zip(level, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to shut down module {module.name}", exc_info=result)
@@ -0,0 +1,96 @@
+"""
+BoundedQueueHandler - QueueHandler với queue có giới hạn
+
+Handler này chỉ đưa log record vào queue, việc format và ghi ra file/console
+được thực hiện bởi QueueListener ở thread riêng, nên `logger.info(...)` không
+làm I/O trên event loop thread.
+
+Khi queue đầy:
+- drop: Bỏ record, tăng bộ đếm dropped
+- block: Chờ tối đa block_timeout giây, hết thời gian thì bỏ record
+"""
+import copy
+import logging
+import logging.handlers
+import queue
+from enum import Enum
+from typing import Optional
+
+
+class QueuePolicy(str, Enum):
+    """
+    Chính sách xử lý khi queue log đầy.
+
+    Attributes:
+        DROP: Bỏ record ngay, không bao giờ block caller
+        BLOCK: Block caller tới khi queue có chỗ (tối đa block_timeout)
+    """
+
+    DROP = "drop"
+    BLOCK = "block"
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler với queue có giới hạn và bộ đếm records bị bỏ.
+
+    Attributes:
+        dropped: Số records bị bỏ do queue đầy
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        policy: QueuePolicy = QueuePolicy.DROP,
+        block_timeout: Optional[float] = 1.0,
+    ) -> None:
+        """
+        Initialize handler.
+
+        Args:
+            log_queue: Queue (có maxsize) dùng chung với QueueListener
+            policy: Chính sách khi queue đầy
+            block_timeout: Thời gian chờ tối đa (giây) với policy block, None = chờ mãi
+        """
+        super().__init__(log_queue)
+        self._policy = policy
+        self._block_timeout = block_timeout
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Chuẩn bị record để gửi qua queue (có thể pickle, không giữ traceback object).
+
+        Khác QueueHandler mặc định, message và exception text được giữ riêng
+        (record.msg, record.exc_text) để formatter của listener tự format.
+
+        Args:
+            record: Log record gốc
+
+        Returns:
+            logging.LogRecord: Bản sao của record đã được chuẩn bị
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Đưa record vào queue theo policy.
+
+        Args:
+            record: Log record đã được prepare
+        """
+        try:
+            if self._policy == QueuePolicy.BLOCK:
+                self.queue.put(record, block=True, timeout=self._block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            # emit() được gọi trong handler lock nên tăng bộ đếm an toàn giữa các threads
+            self.dropped += 1
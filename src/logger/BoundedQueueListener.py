@@ -0,0 +1,24 @@
+"""
+BoundedQueueListener - QueueListener dùng với queue có giới hạn
+
+QueueListener mặc định gửi sentinel bằng put_nowait khi stop, sẽ lỗi nếu queue
+đang đầy. Listener này chờ tới khi có chỗ, nên stop() luôn ghi hết các
+records còn trong queue trước khi trả về.
+"""
+import logging.handlers
+
+
+class BoundedQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener an toàn với bounded queue.
+
+    Example:
+        listener = BoundedQueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        ...
+        listener.stop()  # Ghi hết records còn trong queue
+    """
+
+    def enqueue_sentinel(self) -> None:
+        """Đưa sentinel vào queue, chờ nếu queue đang đầy."""
+        self.queue.put(self._sentinel)
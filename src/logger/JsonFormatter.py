@@ -0,0 +1,56 @@
+"""
+JsonFormatter - Formatter ghi mỗi log record là một JSON object trên một dòng
+
+Ví dụ:
+    {"time":"2026-01-20T09:43:01.123+07:00","level":"INFO","logger":"app",
+     "path":"src/main.py","line":25,"message":"Hello",
+     "request_id":"3f2a...","route":"/api/health/db","latency_ms":1.27}
+"""
+import json
+import logging
+from datetime import datetime
+
+from src.logger.RelativePathFormatter import RelativePathFormatter
+
+
+class JsonFormatter(RelativePathFormatter):
+    """
+    Formatter JSON (một object mỗi dòng), dùng chung cache relative path
+    với RelativePathFormatter.
+
+    Các field request_id, route, latency_ms chỉ có khi record được gắn bởi
+    RequestContextFilter trong một request.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format log record thành JSON.
+
+        Args:
+            record: Log record cần format
+
+        Returns:
+            JSON string trên một dòng
+        """
+        payload = {
+            "time": datetime.fromtimestamp(record.created).astimezone().isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "path": self.get_relative_path(record),
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+
+        for key in ("request_id", "route", "latency_ms"):
+            value = getattr(record, key, None)
+            if value is not None:
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
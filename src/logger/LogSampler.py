@@ -0,0 +1,103 @@
+"""
+LogSampler - Rate-limit cho log messages tần suất cao
+
+Mỗi message template (hoặc key tự đặt) được ghi tối đa `limit` lần trong mỗi
+cửa sổ `period` giây; các lần gọi còn lại bị bỏ và được đếm. Record đầu tiên
+của cửa sổ kế tiếp có thêm số messages đã bị bỏ.
+
+Message nên dùng lazy formatting (`"id=%s", entity_id`) để các lần bị bỏ
+không tốn chi phí format.
+"""
+import logging
+import time
+from typing import Any, Hashable, Optional
+
+
+class LogSampler:
+    """
+    Wrapper quanh logging.Logger, giới hạn số lần ghi mỗi message.
+
+    Example:
+        sampled_logger = LogSampler(logging.getLogger("app"), limit=1, period=1.0)
+        sampled_logger.info("Created health check entry with id=%s", entity.id)
+        # Tối đa 1 dòng/giây, ví dụ:
+        # Created health check entry with id=42 (suppressed 318 similar messages)
+    """
+
+    def __init__(self, logger: logging.Logger, limit: int = 1, period: float = 1.0) -> None:
+        """
+        Initialize sampler.
+
+        Args:
+            logger: Logger đích
+            limit: Số records tối đa mỗi key trong một cửa sổ
+            period: Độ dài cửa sổ (giây)
+        """
+        self._logger = logger
+        self._limit = limit
+        self._period = period
+        # key -> [bắt đầu cửa sổ, số records đã ghi, số records đã bỏ]
+        self._windows: dict[Hashable, list] = {}
+        self.suppressed = 0
+
+    def log(self, level: int, msg: str, *args: Any, key: Optional[Hashable] = None, **kwargs: Any) -> None:
+        """
+        Ghi log nếu key chưa vượt giới hạn trong cửa sổ hiện tại.
+
+        Args:
+            level: Log level
+            msg: Message template
+            *args: Arguments của message
+            key: Key dùng để gộp messages, mặc định là (level, msg)
+            **kwargs: Keyword arguments của Logger.log (exc_info, extra, ...)
+        """
+        self._log(level, msg, args, key, kwargs)
+
+    def debug(self, msg: str, *args: Any, key: Optional[Hashable] = None, **kwargs: Any) -> None:
+        """Ghi log level DEBUG (có rate-limit)."""
+        self._log(logging.DEBUG, msg, args, key, kwargs)
+
+    def info(self, msg: str, *args: Any, key: Optional[Hashable] = None, **kwargs: Any) -> None:
+        """Ghi log level INFO (có rate-limit)."""
+        self._log(logging.INFO, msg, args, key, kwargs)
+
+    def warning(self, msg: str, *args: Any, key: Optional[Hashable] = None, **kwargs: Any) -> None:
+        """Ghi log level WARNING (có rate-limit)."""
+        self._log(logging.WARNING, msg, args, key, kwargs)
+
+    def _log(
+        self,
+        level: int,
+        msg: str,
+        args: tuple,
+        key: Optional[Hashable],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Kiểm tra giới hạn của key và ghi log.
+
+        Chỉ được gọi trực tiếp từ các public methods, để stacklevel trỏ tới caller.
+        """
+        if not self._logger.isEnabledFor(level):
+            return
+
+        if key is None:
+            key = (level, msg)
+
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self._period:
+            suppressed = window[2] if window is not None else 0
+            self._windows[key] = window = [now, 0, 0]
+            if suppressed:
+                msg = f"{msg} (suppressed {suppressed} similar messages)"
+
+        if window[1] >= self._limit:
+            window[2] += 1
+            self.suppressed += 1
+            return
+
+        window[1] += 1
+        # Bỏ qua _log và public method để record trỏ tới caller thật
+        kwargs.setdefault("stacklevel", 3)
+        self._logger.log(level, msg, *args, **kwargs)
@@ -5,9 +5,33 @@ Chứa các thông số cấu hình:
 - log_dir: Thư mục chứa file log
 - backup_days: Số ngày giữ lại log
 - project_root: Đường dẫn gốc của project để tính relative path
+- level, level_overrides: Log level của "app" logger và của từng logger khác
+- log_format: Định dạng log (text/json)
+- async_mode, queue_size, queue_policy, queue_block_timeout: Ghi log qua queue
+  và background thread thay vì ghi trực tiếp trên thread gọi logger
+- external_rotation: Không tự rotate file log (nhiều processes ghi chung một file)
 """
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
+from typing import Mapping, Optional
+
+from src.config import Config, ConfigInvalidValueError
+from src.logger.BoundedQueueHandler import QueuePolicy
+
+
+class LogFormat(str, Enum):
+    """
+    Định dạng output của log.
+
+    Attributes:
+        TEXT: Một dòng text dễ đọc (RelativePathFormatter)
+        JSON: Một JSON object mỗi dòng (JsonFormatter)
+    """
+
+    TEXT = "text"
+    JSON = "json"
 
 
 @dataclass(frozen=True)
@@ -19,8 +43,107 @@ class LoggerConfig:
         project_root: Đường dẫn gốc của project (để tính relative path)
         log_dir: Thư mục chứa file log
         backup_days: Số ngày giữ lại backup log
+        level: Log level của "app" logger (DEBUG, INFO, WARNING, ...)
+        level_overrides: Log level riêng theo tên logger, ví dụ {"uvicorn.access": "WARNING"}
+        log_format: Định dạng output (text/json)
+        async_mode: Ghi log qua QueueHandler/QueueListener (background thread)
+        queue_size: Số records tối đa trong queue khi async_mode
+        queue_policy: Xử lý khi queue đầy (drop/block)
+        queue_block_timeout: Thời gian chờ tối đa (giây) với policy block
+        external_rotation: Dùng WatchedFileHandler, file log được rotate bởi công cụ
+            bên ngoài (logrotate); bật khi nhiều worker processes ghi chung file
     """
 
     project_root: Path
     log_dir: str = "logs"
     backup_days: int = 30
+    level: str = "INFO"
+    level_overrides: Mapping[str, str] = field(default_factory=dict)
+    log_format: LogFormat = LogFormat.TEXT
+    async_mode: bool = False
+    queue_size: int = 10000
+    queue_policy: QueuePolicy = QueuePolicy.DROP
+    queue_block_timeout: Optional[float] = 1.0
+    external_rotation: bool = False
+
+    @classmethod
+    def from_config(cls, config: Config, project_root: Path) -> "LoggerConfig":
+        """
+        Tạo LoggerConfig từ Config (environment variables).
+
+        Đọc các keys: LOG_DIR, LOG_BACKUP_DAYS, LOG_LEVEL, LOG_LEVEL_OVERRIDES
+        (dạng "logger=LEVEL,logger=LEVEL"), LOG_FORMAT, LOG_ASYNC, LOG_QUEUE_SIZE,
+        LOG_QUEUE_POLICY, LOG_QUEUE_BLOCK_TIMEOUT, LOG_EXTERNAL_ROTATION.
+
+        Args:
+            config: Config instance
+            project_root: Đường dẫn gốc của project
+
+        Returns:
+            LoggerConfig: Configuration đã đọc
+
+        Raises:
+            ConfigInvalidValueError: Nếu một trong các giá trị không hợp lệ.
+        """
+        level = _parse_level("LOG_LEVEL", config.get_config("LOG_LEVEL", "INFO"))
+
+        level_overrides: dict[str, str] = {}
+        for item in config.get_list("LOG_LEVEL_OVERRIDES", ",", []):
+            if not item.strip():
+                continue
+            name, separator, value = item.partition("=")
+            if not separator or not name.strip():
+                raise ConfigInvalidValueError(
+                    f"value of LOG_LEVEL_OVERRIDES is not valid override: '{item}'"
+                )
+            level_overrides[name.strip()] = _parse_level("LOG_LEVEL_OVERRIDES", value)
+
+        value = config.get_config("LOG_FORMAT", LogFormat.TEXT.value)
+        try:
+            log_format = LogFormat(value.lower())
+        except ValueError as error:
+            raise ConfigInvalidValueError(
+                f"value of LOG_FORMAT is not valid log format: '{value}'"
+            ) from error
+
+        value = config.get_config("LOG_QUEUE_POLICY", QueuePolicy.DROP.value)
+        try:
+            queue_policy = QueuePolicy(value.lower())
+        except ValueError as error:
+            raise ConfigInvalidValueError(
+                f"value of LOG_QUEUE_POLICY is not valid queue policy: '{value}'"
+            ) from error
+
+        return cls(
+            project_root=project_root,
+            log_dir=config.get_config("LOG_DIR", "logs"),
+            backup_days=config.get_int("LOG_BACKUP_DAYS", 30),
+            level=level,
+            level_overrides=level_overrides,
+            log_format=log_format,
+            async_mode=config.get_bool("LOG_ASYNC", False),
+            queue_size=config.get_int("LOG_QUEUE_SIZE", 10000),
+            queue_policy=queue_policy,
+            queue_block_timeout=config.get_float("LOG_QUEUE_BLOCK_TIMEOUT", 1.0),
+            external_rotation=config.get_bool("LOG_EXTERNAL_ROTATION", False),
+        )
+
+
+def _parse_level(name: str, value: str) -> str:
+    """
+    Chuẩn hóa và validate tên log level.
+
+    Args:
+        name: Tên config key (dùng trong thông báo lỗi)
+        value: Tên level, không phân biệt hoa thường
+
+    Returns:
+        str: Tên level viết hoa
+
+    Raises:
+        ConfigInvalidValueError: Nếu level không tồn tại.
+    """
+    level = value.strip().upper()
+    if not isinstance(logging.getLevelName(level), int):
+        raise ConfigInvalidValueError(f"value of {name} is not valid log level: '{value}'")
+    return level
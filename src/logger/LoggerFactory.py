@@ -4,14 +4,24 @@ LoggerFactory - Factory để tạo Logger
 Trách nhiệm:
 - Tạo logging.Logger instance với custom formatter
 - Singleton pattern để reuse logger
-- Hỗ trợ console và file handler với rotation
+- Hỗ trợ console và file handler với rotation (hoặc rotation bên ngoài)
+- Async mode: ghi log qua bounded queue và background thread
+- Đổi log level lúc runtime (admin endpoint, signal SIGUSR1)
 """
 import logging
 import logging.handlers
 import os
+import queue
+import signal
+import threading
+from typing import Optional
 
-from src.logger.LoggerConfig import LoggerConfig
+from src.logger.BoundedQueueHandler import BoundedQueueHandler
+from src.logger.BoundedQueueListener import BoundedQueueListener
+from src.logger.JsonFormatter import JsonFormatter
+from src.logger.LoggerConfig import LogFormat, LoggerConfig
 from src.logger.RelativePathFormatter import RelativePathFormatter
+from src.logger.RequestContextFilter import RequestContextFilter
 
 
 class LoggerFactory:
@@ -31,6 +41,10 @@ class LoggerFactory:
     """
 
     _instance: logging.Logger | None = None
+    _queue_handler: BoundedQueueHandler | None = None
+    _listener: BoundedQueueListener | None = None
+    _base_level: str = "INFO"
+    _managed_loggers: set[str] = {"app"}
 
     def __init__(self, config: LoggerConfig) -> None:
         """
@@ -45,30 +59,51 @@ class LoggerFactory:
         """
         Tạo logging.Logger instance mới.
 
+        Khi config.async_mode, logger chỉ có một BoundedQueueHandler;
+        file và console handlers chạy trong QueueListener ở background thread.
+
         Returns:
             logging.Logger: Logger instance với console và file handlers
         """
         logger = logging.getLogger("app")
-        logger.setLevel(logging.DEBUG) # Hardcode log level DEBUG
+        logger.setLevel(self._config.level)
+        LoggerFactory._base_level = self._config.level
+
+        for name, level in self._config.level_overrides.items():
+            LoggerFactory.set_level(level, name)
 
         # Tránh duplicate handlers nếu logger đã tồn tại
         if logger.handlers:
             return logger
 
         # Tạo formatter với relative path
-        formatter = RelativePathFormatter(self._config.project_root)
+        formatter: RelativePathFormatter
+        if self._config.log_format == LogFormat.JSON:
+            formatter = JsonFormatter(self._config.project_root)
+        else:
+            formatter = RelativePathFormatter(self._config.project_root)
+
+        # Gắn request_id/route/latency_ms trên thread gọi logger (trước khi vào queue)
+        context_filter = RequestContextFilter()
 
         # Tạo thư mục log
         os.makedirs(self._config.log_dir, exist_ok=True)
 
-        # File handler với rotation hàng ngày
-        file_handler = logging.handlers.TimedRotatingFileHandler(
-            filename=os.path.join(self._config.log_dir, "app.log"),
-            when="D",
-            interval=1,
-            backupCount=self._config.backup_days,
-            encoding="utf-8",
-        )
+        file_handler: logging.FileHandler
+        log_file = os.path.join(self._config.log_dir, "app.log")
+        if self._config.external_rotation:
+            # Nhiều processes ghi chung file: không process nào tự rotate,
+            # handler mở lại file khi logrotate đổi tên nó
+            file_handler = logging.handlers.WatchedFileHandler(log_file, encoding="utf-8")
+        else:
+            # File handler với rotation hàng ngày
+            file_handler = logging.handlers.TimedRotatingFileHandler(
+                filename=log_file,
+                when="D",
+                interval=1,
+                backupCount=self._config.backup_days,
+                encoding="utf-8",
+            )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
 
@@ -77,6 +112,31 @@ class LoggerFactory:
         console_handler.setLevel(logging.DEBUG)
         console_handler.setFormatter(formatter)
 
+        if self._config.async_mode:
+            # Logger chỉ đưa records vào queue, listener thread format và ghi ra file/console
+            log_queue: queue.Queue = queue.Queue(maxsize=self._config.queue_size)
+            queue_handler = BoundedQueueHandler(
+                log_queue,
+                policy=self._config.queue_policy,
+                block_timeout=self._config.queue_block_timeout,
+            )
+            listener = BoundedQueueListener(
+                log_queue,
+                file_handler,
+                console_handler,
+                respect_handler_level=True,
+            )
+            queue_handler.addFilter(context_filter)
+            listener.start()
+
+            LoggerFactory._queue_handler = queue_handler
+            LoggerFactory._listener = listener
+            logger.addHandler(queue_handler)
+            return logger
+
+        file_handler.addFilter(context_filter)
+        console_handler.addFilter(context_filter)
+
         # Thêm handlers vào logger
         logger.addHandler(file_handler) # Ghi log vào file, hữu ích cho debug lâu dài
         logger.addHandler(console_handler) # Ghi log ra console, bỏ qua khi chạy trong môi trường production
@@ -94,9 +154,112 @@ class LoggerFactory:
             LoggerFactory._instance = self.create()
         return LoggerFactory._instance
 
+    @classmethod
+    def set_level(cls, level: str, name: str = "app") -> str:
+        """
+        Đổi log level của một logger lúc runtime.
+
+        Args:
+            level: Tên level (DEBUG, INFO, WARNING, ...), không phân biệt hoa thường
+            name: Tên logger
+
+        Returns:
+            str: Level trước khi đổi
+
+        Raises:
+            ValueError: Nếu level không tồn tại.
+        """
+        new_level = level.strip().upper()
+        if not isinstance(logging.getLevelName(new_level), int):
+            raise ValueError(f"Invalid log level: '{level}'")
+
+        target = logging.getLogger(name)
+        previous = logging.getLevelName(target.getEffectiveLevel())
+        target.setLevel(new_level)
+        cls._managed_loggers.add(name)
+        return previous
+
+    @classmethod
+    def get_levels(cls) -> dict[str, str]:
+        """
+        Lấy log level hiện tại của "app" và các loggers đã được cấu hình.
+
+        Returns:
+            dict[str, str]: Tên logger -> tên level
+        """
+        return {
+            name: logging.getLevelName(logging.getLogger(name).getEffectiveLevel())
+            for name in sorted(cls._managed_loggers)
+        }
+
+    @classmethod
+    def install_signal_handler(cls, signum: Optional[int] = None) -> bool:
+        """
+        Đăng ký signal handler chuyển "app" logger giữa DEBUG và level cấu hình.
+
+        Mặc định dùng SIGUSR1, ví dụ: `kill -USR1 <pid>`.
+
+        Args:
+            signum: Signal number, None = SIGUSR1
+
+        Returns:
+            bool: False nếu platform không hỗ trợ signal (ví dụ Windows)
+                hoặc không được gọi từ main thread
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        if signum is None:
+            signum = getattr(signal, "SIGUSR1", None)
+            if signum is None:
+                return False
+
+        def _toggle_debug(_signum: int, _frame: object) -> None:
+            # Không ghi log trong signal handler: có thể deadlock với lock của queue/handler
+            logger = logging.getLogger("app")
+            logger.setLevel(cls._base_level if logger.level == logging.DEBUG else "DEBUG")
+
+        signal.signal(signum, _toggle_debug)
+        return True
+
+    @classmethod
+    def dropped_records(cls) -> int:
+        """
+        Số log records bị bỏ do queue đầy (async mode).
+
+        Returns:
+            int: Số records bị bỏ, 0 nếu không dùng async mode
+        """
+        if cls._queue_handler is None:
+            return 0
+        return cls._queue_handler.dropped
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Ghi hết các records đang chờ trong queue ra file/console.
+
+        Listener được dừng (ghi hết queue) rồi khởi động lại, nên logger
+        vẫn dùng được sau khi flush. Không làm gì nếu không dùng async mode.
+        """
+        if cls._listener is None:
+            return
+
+        cls._listener.stop()
+        for handler in cls._listener.handlers:
+            handler.flush()
+        cls._listener.start()
+
     @classmethod
     def close_instance(cls) -> None:
         """Đóng singleton instance và cleanup handlers."""
+        if cls._listener is not None:
+            # Ghi hết queue trước khi đóng các handlers đích
+            cls._listener.stop()
+            for handler in cls._listener.handlers:
+                handler.close()
+            cls._listener = None
+            cls._queue_handler = None
+
         if cls._instance is not None:
             for handler in cls._instance.handlers[:]:
                 handler.close()
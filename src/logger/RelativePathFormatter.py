@@ -7,6 +7,9 @@ formatter này sẽ hiển thị path tương đối từ project root.
 Ví dụ:
     Absolute: /home/user/project/src/services/user.py
     Relative: src/services/user.py
+
+Relative path được cache theo record.pathname, nên chỉ resolve (syscall)
+một lần cho mỗi source file.
 """
 import logging
 from pathlib import Path
@@ -32,6 +35,7 @@ class RelativePathFormatter(logging.Formatter):
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         self._project_root = project_root.resolve()
+        self._path_cache: dict[str, str] = {}
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -43,17 +47,32 @@ class RelativePathFormatter(logging.Formatter):
         Returns:
             Formatted log string
         """
-        relative_path: Path | str
+        # Thêm relative_path vào record
+        record.relative_path = self.get_relative_path(record)
+
+        return super().format(record)
+
+    def get_relative_path(self, record: logging.LogRecord) -> str:
+        """
+        Lấy relative path của source file từ project root (có cache).
+
+        Args:
+            record: Log record
+
+        Returns:
+            Relative path, hoặc filename nếu file nằm ngoài project root
+        """
+        relative_path = self._path_cache.get(record.pathname)
+        if relative_path is not None:
+            return relative_path
 
         # Tính relative path từ project root
         try:
             absolute_path = Path(record.pathname).resolve()
-            relative_path = absolute_path.relative_to(self._project_root)
+            relative_path = str(absolute_path.relative_to(self._project_root))
         except ValueError:
             # Nếu không thể tính relative path, dùng filename
             relative_path = record.filename
 
-        # Thêm relative_path vào record
-        record.relative_path = str(relative_path)
-
-        return super().format(record)
+        self._path_cache[record.pathname] = relative_path
+        return relative_path
@@ -0,0 +1,75 @@
+"""
+RequestContext - Context của request hiện tại cho logging
+
+Middleware gọi bind_request_context() khi bắt đầu một request; mọi log record
+ghi trong request đó (cùng asyncio context) được RequestContextFilter gắn
+request_id, route và latency_ms.
+"""
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, MutableMapping, Optional
+
+
+@dataclass
+class RequestContext:
+    """
+    Thông tin của request đang xử lý.
+
+    Attributes:
+        request_id: ID của request (từ header X-Request-ID hoặc tự sinh)
+        scope: ASGI scope, dùng để lấy route template sau khi router đã match
+        started_at: Thời điểm (perf_counter) bắt đầu xử lý request
+    """
+
+    request_id: str
+    scope: MutableMapping[str, Any] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def route(self) -> Optional[str]:
+        """Route template (ví dụ /api/health/db/{id}), hoặc path nếu chưa match route."""
+        route = self.scope.get("route")
+        path = getattr(route, "path", None)
+        return path if path is not None else self.scope.get("path")
+
+    @property
+    def latency_ms(self) -> float:
+        """Thời gian (ms) từ khi bắt đầu request tới hiện tại."""
+        return (time.perf_counter() - self.started_at) * 1000
+
+
+_request_context: ContextVar[Optional[RequestContext]] = ContextVar("log_request_context", default=None)
+
+
+def bind_request_context(context: RequestContext) -> Token:
+    """
+    Gắn context cho request hiện tại.
+
+    Args:
+        context: Context của request
+
+    Returns:
+        Token: Token dùng cho reset_request_context()
+    """
+    return _request_context.set(context)
+
+
+def reset_request_context(token: Token) -> None:
+    """
+    Gỡ context đã gắn bởi bind_request_context().
+
+    Args:
+        token: Token trả về từ bind_request_context()
+    """
+    _request_context.reset(token)
+
+
+def current_request_context() -> Optional[RequestContext]:
+    """
+    Lấy context của request hiện tại.
+
+    Returns:
+        Optional[RequestContext]: Context, hoặc None nếu không ở trong request
+    """
+    return _request_context.get()
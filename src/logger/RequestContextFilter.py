@@ -0,0 +1,39 @@
+"""
+RequestContextFilter - Gắn request context vào log record
+
+Filter chạy trên thread gọi logger (trước khi record vào queue ở async mode),
+nên đọc được contextvars của request. Các attributes được gắn:
+request_id, route, latency_ms (None nếu không ở trong request).
+"""
+import logging
+
+from src.logger.RequestContext import current_request_context
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Filter gắn request_id, route, latency_ms vào log record.
+
+    Không bao giờ loại bỏ record.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Gắn request context vào record.
+
+        Args:
+            record: Log record
+
+        Returns:
+            bool: Luôn True
+        """
+        context = current_request_context()
+        if context is None:
+            record.request_id = None
+            record.route = None
+            record.latency_ms = None
+        else:
+            record.request_id = context.request_id
+            record.route = context.route
+            record.latency_ms = round(context.latency_ms, 3)
+        return True
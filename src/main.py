@@ -3,11 +3,13 @@ Entry point của FastAPI application.
 
 Module này khởi tạo FastAPI app với các cấu hình:
 - Load environment variables từ .env
+- Khởi tạo logger (mỗi worker process import module này)
 - Setup AppInitializer để quản lý lifecycle
 - Register tất cả routers từ các modules (health, ...)
 - Cấu hình OpenAPI documentation với tags từ các modules
 """
 from os import environ
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -15,6 +17,8 @@ from src.config import Config
 
 from src.base.app import create_fastapi_app
 from src.initializer import AppInitializer
+from src.logger.LoggerConfig import LoggerConfig
+from src.logger.LoggerFactory import LoggerFactory
 
 from src.health.endpoint.main import main_router as router_health
 from src.health.doc import Tags as HealthTags
@@ -23,6 +27,12 @@ from src.health.doc import Tags as HealthTags
 # Load environment variables
 config = Config(environ)
 
+# Khởi tạo logger cho process hiện tại. Với nhiều workers, process cha
+# (src/__main__.py) không chia sẻ handlers với các worker processes.
+LoggerFactory(LoggerConfig.from_config(config, project_root=Path(__file__).parent.parent)).get_instance()
+# kill -USR1 <worker pid> để bật/tắt DEBUG mà không cần restart
+LoggerFactory.install_signal_handler()
+
 # Lấy root_path từ config (prefix cho tất cả endpoints khi deploy sau reverse proxy)
 root_path = config.get_config("ROOT_PATH", "")
 
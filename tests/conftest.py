@@ -0,0 +1,53 @@
+"""
+Fixtures dùng chung cho tests.
+
+Async tests dùng plugin pytest của anyio (@pytest.mark.anyio) trên asyncio.
+"""
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.base.database.model.base import Base
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def sqlite_url(tmp_path: Path) -> str:
+    """SQLite file riêng cho mỗi test (in-memory thì mỗi connection là một database khác)."""
+    return f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+
+
+def make_engine(url: str) -> AsyncEngine:
+    """
+    Tạo SQLite engine bật foreign keys.
+
+    Args:
+        url: SQLite URL
+
+    Returns:
+        AsyncEngine: Engine
+    """
+    engine = create_async_engine(url)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, _):  # type: ignore[no-untyped-def]
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    return engine
+
+
+@pytest.fixture
+async def engine(sqlite_url: str) -> AsyncIterator[AsyncEngine]:
+    """Engine với các bảng của Base.metadata đã được tạo."""
+    engine = make_engine(sqlite_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
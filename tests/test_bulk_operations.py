@@ -0,0 +1,113 @@
+"""
+Tests cho các bulk operations của Repository trên SQLite.
+
+copy_many dùng COPY của asyncpg nên chỉ chạy trên Postgres, không được test ở đây.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.health.database.repository.health import HealthCheckRepository
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _row(day: int) -> dict[str, datetime]:
+    return {"created_at": datetime(2024, 1, day), "updated_at": datetime(2024, 1, day)}
+
+
+async def _created_days(repository: HealthCheckRepository) -> dict[int, int]:
+    return {entity.id: entity.created_at.day for entity in await repository.get_all()}
+
+
+@pytest.fixture
+def repository(engine: AsyncEngine) -> HealthCheckRepository:
+    return HealthCheckRepository(engine)
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 3, 7])
+async def test_create_many_returns_ids_in_input_order(repository: HealthCheckRepository, batch_size: int) -> None:
+    rows = [_row(day) for day in (5, 1, 4, 2, 7, 3, 6)]
+
+    ids = await repository.create_many(rows, batch_size=batch_size)
+
+    days = await _created_days(repository)
+    assert len(ids) == len(set(ids)) == 7
+    assert [days[entity_id] for entity_id in ids] == [5, 1, 4, 2, 7, 3, 6]
+
+
+async def test_empty_input_does_nothing(repository: HealthCheckRepository) -> None:
+    assert await repository.create_many([]) == []
+    assert await repository.upsert_many([], conflict_cols=["id"]) == []
+    assert await repository.update_many([]) == []
+    assert await repository.delete_many([]) == []
+    assert await repository.copy_many([], columns=["created_at"]) == 0
+
+
+async def test_invalid_batch_size_is_rejected(repository: HealthCheckRepository) -> None:
+    with pytest.raises(ValueError):
+        await repository.create_many([_row(1)], batch_size=0)
+
+
+async def test_upsert_many_updates_conflicts_and_inserts_new_rows(repository: HealthCheckRepository) -> None:
+    existing = await repository.create_many([_row(1), _row(2)])
+
+    ids = await repository.upsert_many(
+        [{"id": existing[1], **_row(20)}, {"id": 100, **_row(3)}, {"id": existing[0], **_row(10)}],
+        conflict_cols=["id"],
+        batch_size=2,
+    )
+
+    assert ids == [existing[1], 100, existing[0]]
+    assert await _created_days(repository) == {existing[0]: 10, existing[1]: 20, 100: 3}
+
+
+async def test_upsert_many_only_updates_update_cols(repository: HealthCheckRepository) -> None:
+    [entity_id] = await repository.create_many([_row(1)])
+
+    await repository.upsert_many(
+        [{"id": entity_id, "created_at": datetime(2024, 1, 9), "updated_at": datetime(2024, 1, 9)}],
+        conflict_cols=["id"],
+        update_cols=["updated_at"],
+    )
+
+    [entity] = await repository.get_all()
+    assert (entity.created_at.day, entity.updated_at.day) == (1, 9)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 10])
+async def test_update_many_skips_missing_ids(repository: HealthCheckRepository, batch_size: int) -> None:
+    ids = await repository.create_many([_row(day) for day in range(1, 5)])
+
+    updated = await repository.update_many(
+        [
+            {"id": ids[2], **_row(13)},
+            {"id": 999, **_row(20)},
+            {"id": ids[0], **_row(11)},
+        ],
+        batch_size=batch_size,
+    )
+
+    assert updated == [ids[2], ids[0]]
+    assert await _created_days(repository) == {ids[0]: 11, ids[1]: 2, ids[2]: 13, ids[3]: 4}
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 10])
+async def test_delete_many_skips_missing_ids(repository: HealthCheckRepository, batch_size: int) -> None:
+    ids = await repository.create_many([_row(day) for day in range(1, 6)])
+
+    deleted = await repository.delete_many([ids[3], 999, ids[0], ids[1]], batch_size=batch_size)
+
+    assert deleted == [ids[3], ids[0], ids[1]]
+    assert sorted(await _created_days(repository)) == [ids[2], ids[4]]
+
+
+async def test_bulk_operations_share_the_unit_of_work(repository: HealthCheckRepository) -> None:
+    with pytest.raises(RuntimeError):
+        async with repository.unit_of_work():
+            await repository.create_many([_row(1), _row(2), _row(3)], batch_size=2)
+            raise RuntimeError("boom")
+
+    assert await repository.get_all() == []
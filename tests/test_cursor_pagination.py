@@ -0,0 +1,74 @@
+"""
+Tests cho keyset pagination: encode/decode cursor và get_page_after qua nhiều trang.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.base.database.repository.cursor import decode_cursor, encode_cursor
+from src.health.database.repository.health import HealthCheckRepository
+
+
+def test_cursor_round_trip() -> None:
+    values = (datetime(2024, 1, 1, 12, 30, 0, 123456), 7)
+    cursor = encode_cursor(("created_at", "id"), values, backward=True)
+
+    position = decode_cursor(cursor, ("created_at", "id"), (datetime, int))
+
+    assert position.values == values
+    assert position.backward
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "eyJ4IjoxfQ", ""])
+def test_invalid_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, ("id",), (int,))
+
+
+def test_cursor_for_other_ordering_is_rejected() -> None:
+    cursor = encode_cursor(("id",), (1,))
+    with pytest.raises(ValueError, match="ordering"):
+        decode_cursor(cursor, ("created_at", "id"), (datetime, int))
+
+
+@pytest.fixture
+async def repository(engine: AsyncEngine) -> HealthCheckRepository:
+    """Repository với 25 entries, created_at trùng nhau theo nhóm 4 để kiểm tra tie-break theo id."""
+    repository = HealthCheckRepository(engine)
+    await repository.create_many([
+        {"created_at": datetime(2024, 1, 1, 0, 0, index // 4), "updated_at": datetime(2024, 1, 1)}
+        for index in range(1, 26)
+    ])
+    return repository
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("order_by", [("id",), ("created_at", "id")])
+async def test_forward_and_backward_pages(repository: HealthCheckRepository, order_by: tuple[str, ...]) -> None:
+    pages: list[list[int]] = []
+    cursors = []
+    cursor = None
+    while True:
+        entities, next_cursor, prev_cursor = await repository.get_page_after(cursor, limit=7, order_by=order_by)
+        pages.append([entity.id for entity in entities])
+        cursors.append(prev_cursor)
+        if next_cursor is None:
+            break
+        cursor = next_cursor
+
+    assert [len(page) for page in pages] == [7, 7, 7, 4]
+    assert [entity_id for page in pages for entity_id in page] == list(range(1, 26))
+    assert cursors[0] is None
+
+    # prev_cursor của mỗi trang trả lại đúng trang trước đó
+    for index in range(1, len(pages)):
+        entities, next_cursor, _ = await repository.get_page_after(cursors[index], limit=7, order_by=order_by)
+        assert [entity.id for entity in entities] == pages[index - 1]
+        assert next_cursor is not None
+
+
+@pytest.mark.anyio
+async def test_unknown_order_by_column(repository: HealthCheckRepository) -> None:
+    with pytest.raises(ValueError, match="Unknown order_by column"):
+        await repository.get_page_after(None, order_by=("missing",))
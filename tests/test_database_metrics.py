@@ -0,0 +1,34 @@
+"""
+Tests cho database metrics của engine.
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from src.base.metrics.database import instrument_engine
+from src.base.metrics.registry import MetricsRegistry
+from tests.conftest import make_engine
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_checkout_timing_survives_dispose(sqlite_url: str) -> None:
+    engine = make_engine(sqlite_url)
+    registry = MetricsRegistry()
+    instrument_engine(engine, "DB", registry)
+    checkout_seconds = registry.histogram("db_connection_checkout_seconds", "", ["engine"]).labels("DB")
+    assert isinstance(engine.sync_engine.pool, QueuePool)
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+    assert checkout_seconds.count == 1
+
+    await engine.dispose()
+    for _ in range(2):
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    await engine.dispose()
+
+    assert checkout_seconds.count == 3
+    assert "db_pool_size" in registry.render()
@@ -0,0 +1,45 @@
+"""
+Tests cho validate_many/dump_many_json.
+"""
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from src.base.dto.batch import dump_many_json, validate_many
+from src.health.dto.main import DbHealthCheckDto
+
+
+NAIVE = datetime(2024, 1, 1, 12, 30, 0, 123456)
+
+
+def test_lax_mode_coerces_values() -> None:
+    [dto] = validate_many(DbHealthCheckDto, [{"id": "1", "created_at": NAIVE.isoformat(), "updated_at": NAIVE}])
+
+    assert (dto.id, dto.created_at) == (1, NAIVE)
+
+
+def test_strict_mode_rejects_values_that_need_coercion() -> None:
+    with pytest.raises(ValidationError):
+        validate_many(DbHealthCheckDto, [{"id": "1", "created_at": NAIVE, "updated_at": NAIVE}], strict=True)
+
+
+def test_strict_mode_accepts_database_rows() -> None:
+    rows = [{"id": index, "created_at": NAIVE, "updated_at": NAIVE} for index in range(3)]
+
+    assert [dto.id for dto in validate_many(DbHealthCheckDto, rows, strict=True)] == [0, 1, 2]
+
+
+def test_naive_datetimes_serialize_like_isoformat() -> None:
+    items = validate_many(DbHealthCheckDto, [{"id": 1, "created_at": NAIVE, "updated_at": datetime(2024, 1, 1)}])
+
+    assert dump_many_json(DbHealthCheckDto, items) == (
+        b'[{"id":1,"createdAt":"2024-01-01T12:30:00.123456","updatedAt":"2024-01-01T00:00:00"}]'
+    )
+
+
+def test_aware_utc_datetimes_serialize_with_z_suffix() -> None:
+    aware = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    items = validate_many(DbHealthCheckDto, [{"id": 1, "created_at": aware, "updated_at": aware}])
+
+    assert b'"createdAt":"2024-01-01T00:00:00Z"' in dump_many_json(DbHealthCheckDto, items)
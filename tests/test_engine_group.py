@@ -0,0 +1,84 @@
+"""
+Tests cho EngineGroup: chọn replica và read-your-writes qua Repository.
+"""
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+
+from src.base.database.model.base import Base
+from src.base.engine_group import EngineGroup, read_your_writes
+from src.health.database.repository.health import HealthCheckRepository
+from tests.conftest import make_engine
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def group(tmp_path: Path) -> AsyncIterator[EngineGroup]:
+    """Primary và một replica là hai SQLite files riêng (replica không được đồng bộ)."""
+    primary = make_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = make_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    for engine in (primary, replica):
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+    yield EngineGroup(primary=primary, replicas=[replica], sticky_seconds=5.0)
+    await primary.dispose()
+    await replica.dispose()
+
+
+async def test_reads_go_to_replica_without_writes(group: EngineGroup) -> None:
+    assert group.reader() is group.replicas[0]
+
+
+async def test_write_pins_reads_to_primary_in_same_context(group: EngineGroup) -> None:
+    repository = HealthCheckRepository(group)
+    entity = await repository.create({})
+
+    assert group.reader() is group.primary
+    assert await repository.get_one(entity.id) is not None
+
+
+async def test_write_does_not_pin_other_contexts(group: EngineGroup) -> None:
+    repository = HealthCheckRepository(group)
+    # Task con chạy trong bản copy của context, như một request khác
+    entity = await asyncio.create_task(repository.create({}))
+
+    assert group.reader() is group.replicas[0]
+    assert await repository.get_one(entity.id) is None
+
+
+async def test_write_pins_only_its_own_group(group: EngineGroup) -> None:
+    other = EngineGroup(primary=group.primary, replicas=group.replicas, sticky_seconds=5.0)
+
+    group.mark_write()
+
+    assert group.reader() is group.primary
+    assert other.reader() is other.replicas[0]
+
+
+async def test_read_your_writes_window_can_be_disabled(group: EngineGroup) -> None:
+    repository = HealthCheckRepository(group)
+    with read_your_writes(0.0):
+        await repository.create({})
+        assert group.reader() is group.replicas[0]
+
+
+async def test_sticky_window_expires(group: EngineGroup, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("src.base.engine_group.time.monotonic", lambda: now[0])
+    group.mark_write()
+    assert group.reader() is group.primary
+    now[0] += 5.1
+    assert group.reader() is group.replicas[0]
+
+
+async def test_streaming_reads_do_not_count_as_writes(group: EngineGroup) -> None:
+    repository = HealthCheckRepository(group)
+
+    assert [entity async for entity in repository.stream_all()] == []
+    assert [row async for row in repository.stream_sql("SELECT id FROM health_check")] == []
+
+    assert group.reader() is group.replicas[0]
@@ -0,0 +1,74 @@
+"""
+Tests cho entity cache của Repository.get_one khi có ghi đồng thời.
+"""
+import asyncio
+import contextvars
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.base.database.repository.cache import EntityCache, InMemoryCacheBackend
+from src.health.database.model.health_check import HealthCheck
+from src.health.database.repository.health import HealthCheckRepository
+
+
+pytestmark = pytest.mark.anyio
+
+OLD = datetime(2024, 1, 1)
+NEW = datetime(2024, 6, 1)
+
+
+async def test_concurrent_read_during_unit_of_work_is_not_cached_after_commit(engine: AsyncEngine) -> None:
+    backend = InMemoryCacheBackend()
+    repository = HealthCheckRepository(engine, cache=backend)
+    created = await repository.create({"created_at": OLD, "updated_at": OLD})
+    await backend.clear()
+
+    async with repository.unit_of_work():
+        await repository.update(created.id, {"created_at": NEW})
+        # Request khác (context trống): đọc row đã commit và cache nó trước khi commit
+        reader = contextvars.Context().run(asyncio.create_task, repository.get_one(created.id))
+        assert (await reader).created_at == OLD
+
+    assert (await repository.get_one(created.id)).created_at == NEW
+
+
+async def test_read_through_is_discarded_when_id_is_written_during_read() -> None:
+    backend = InMemoryCacheBackend()
+    cache = EntityCache(backend, HealthCheck)
+    stale = HealthCheck(id=1, created_at=OLD, updated_at=OLD)
+
+    generation = cache.begin_read(1)
+    await cache.invalidate(1)
+    await cache.set(stale, generation)
+    cache.end_read(1)
+
+    assert await cache.get(1) is None
+    assert backend.stats.discarded == 1
+
+
+async def test_read_through_started_after_write_is_cached() -> None:
+    backend = InMemoryCacheBackend()
+    cache = EntityCache(backend, HealthCheck)
+    await cache.invalidate(1)
+
+    generation = cache.begin_read(1)
+    await cache.set(HealthCheck(id=1, created_at=NEW, updated_at=NEW), generation)
+    cache.end_read(1)
+
+    assert (await cache.get(1)).created_at == NEW
+    assert backend.stats.discarded == 0
+
+
+async def test_failed_commit_keeps_cache_consistent(engine: AsyncEngine) -> None:
+    backend = InMemoryCacheBackend()
+    repository = HealthCheckRepository(engine, cache=backend)
+    created = await repository.create({"created_at": OLD, "updated_at": OLD})
+
+    with pytest.raises(RuntimeError):
+        async with repository.unit_of_work():
+            await repository.update(created.id, {"created_at": NEW})
+            raise RuntimeError("boom")
+
+    assert (await repository.get_one(created.id)).created_at == OLD
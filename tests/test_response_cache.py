@@ -0,0 +1,189 @@
+"""
+Tests cho ResponseCache: ETag/304, invalidate trong lúc tính, stale-while-revalidate
+và invalidate sau commit của unit-of-work.
+"""
+import asyncio
+import contextvars
+import inspect
+import logging
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.requests import Request
+
+from src.base.database.unit_of_work import unit_of_work
+from src.base.dependency_injection import UnitOfWork
+from src.base.response.cache import ResponseCache
+from src.base.response.json import FastJSONResponse
+from src.health.cache import HEALTH_CHECK_CACHE_TAG
+from src.health.database.repository.health import HealthCheckRepository
+from src.health.dto.main import DbHealthCheckDto
+from src.health.service.health_check.main import HealthCheckService
+
+
+pytestmark = pytest.mark.anyio
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("test_request_id", default="none")
+
+
+def _request(path: str = "/items", headers: dict[str, str] | None = None) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()],
+    })
+
+
+async def test_cached_response_and_not_modified() -> None:
+    cache = ResponseCache()
+    calls = []
+
+    @cache.cached(ttl=60.0, tags=["items"])
+    async def endpoint() -> Any:
+        calls.append(1)
+        return {"count": len(calls)}
+
+    first = await endpoint(_response_cache_request=_request())
+    second = await endpoint(_response_cache_request=_request())
+    not_modified = await endpoint(_response_cache_request=_request(headers={"If-None-Match": first.headers["etag"]}))
+
+    assert first.body == second.body == b'{"count":1}'
+    assert not_modified.status_code == 304
+    assert len(calls) == 1
+    assert (cache.stats.misses, cache.stats.hits, cache.stats.not_modified) == (1, 2, 1)
+
+
+async def test_body_matches_uncached_response() -> None:
+    cache = ResponseCache()
+    result = {"item": DbHealthCheckDto(id=1, created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1))}
+
+    @cache.cached(ttl=60.0)
+    async def endpoint() -> Any:
+        return result
+
+    response = await endpoint(_response_cache_request=_request())
+    assert response.body == FastJSONResponse(result).body
+
+
+async def test_invalidate_during_compute_discards_result() -> None:
+    cache = ResponseCache()
+    started, release = asyncio.Event(), asyncio.Event()
+    version = ["old"]
+
+    @cache.cached(ttl=60.0, tags=["items"])
+    async def endpoint() -> Any:
+        value = version[0]
+        started.set()
+        await release.wait()
+        return {"version": value}
+
+    pending = asyncio.create_task(endpoint(_response_cache_request=_request()))
+    await started.wait()
+    version[0] = "new"
+    cache.invalidate_tags("items")
+    release.set()
+
+    assert (await pending).body == b'{"version":"old"}'
+    assert cache.stats.discarded == 1
+    assert (await endpoint(_response_cache_request=_request())).body == b'{"version":"new"}'
+
+
+async def test_stale_while_revalidate_refreshes_in_background() -> None:
+    cache = ResponseCache()
+    values = iter([1, 2])
+
+    @cache.cached(ttl=0.0, stale_while_revalidate=60.0)
+    async def endpoint() -> Any:
+        return {"value": next(values)}
+
+    assert (await endpoint(_response_cache_request=_request())).body == b'{"value":1}'
+    assert (await endpoint(_response_cache_request=_request())).body == b'{"value":1}'
+    await asyncio.gather(*cache._background_tasks)
+    assert (await endpoint(_response_cache_request=_request())).body == b'{"value":2}'
+    assert cache.stats.stale_hits == 2
+
+
+async def test_background_refresh_does_not_inherit_request_context() -> None:
+    cache = ResponseCache()
+    seen = []
+
+    @cache.cached(ttl=0.0, stale_while_revalidate=60.0)
+    async def endpoint() -> Any:
+        seen.append(_request_id.get())
+        return {"value": len(seen)}
+
+    _request_id.set("first")
+    await endpoint(_response_cache_request=_request())
+    _request_id.set("second")
+    await endpoint(_response_cache_request=_request())
+    await asyncio.gather(*cache._background_tasks)
+
+    assert seen == ["first", "none"]
+
+
+async def test_string_request_annotation_is_not_injected_twice() -> None:
+    cache = ResponseCache()
+
+    @cache.cached(ttl=60.0)
+    async def endpoint(request: "Request") -> Any:
+        return {"path": request.url.path}
+
+    assert list(inspect.signature(endpoint).parameters) == ["request"]
+    assert inspect.signature(endpoint).parameters["request"].annotation is Request
+    assert (await endpoint(request=_request())).body == b'{"path":"/items"}'
+
+
+def test_yield_dependency_is_rejected() -> None:
+    cache = ResponseCache()
+
+    with pytest.raises(TypeError, match="yield dependency 'session'"):
+        @cache.cached(ttl=60.0)
+        async def endpoint(session: Any = UnitOfWork()) -> Any:
+            return {}
+
+
+async def test_failed_background_refresh_is_logged_and_counted(caplog: pytest.LogCaptureFixture) -> None:
+    cache = ResponseCache()
+    calls = []
+
+    @cache.cached(ttl=0.0, stale_while_revalidate=60.0)
+    async def endpoint() -> Any:
+        calls.append(1)
+        if len(calls) > 1:
+            raise RuntimeError("database is down")
+        return {"value": 1}
+
+    await endpoint(_response_cache_request=_request())
+    with caplog.at_level(logging.ERROR, logger="app"):
+        stale = await endpoint(_response_cache_request=_request())
+        await asyncio.gather(*cache._background_tasks)
+
+    assert stale.body == b'{"value":1}'
+    assert cache.stats.refresh_errors == 1
+    assert "Failed to refresh cached response /items?" in caplog.text
+
+
+async def test_service_invalidates_only_after_commit(engine: AsyncEngine) -> None:
+    cache = ResponseCache()
+    service = HealthCheckService(HealthCheckRepository(engine), response_cache=cache)
+
+    @cache.cached(ttl=60.0, tags=[HEALTH_CHECK_CACHE_TAG])
+    async def endpoint() -> Any:
+        return {"ok": True}
+
+    await endpoint(_response_cache_request=_request())
+    async with unit_of_work(engine):
+        await service.check_db_health()
+        assert cache._entries, "invalidated before commit"
+    assert not cache._entries
+
+    await endpoint(_response_cache_request=_request())
+    with pytest.raises(RuntimeError):
+        async with unit_of_work(engine):
+            await service.check_db_health()
+            raise RuntimeError("rollback")
+    assert cache._entries, "invalidated although the transaction rolled back"
@@ -0,0 +1,122 @@
+"""
+Tests cho SingleFlight / single_flight: gộp lời gọi, exception, timeout và cancel.
+"""
+import asyncio
+
+import pytest
+
+from src.base.single_flight import SingleFlight, single_flight
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_calls_share_one_execution() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+    runs = []
+
+    async def fn() -> int:
+        runs.append(1)
+        await release.wait()
+        return 42
+
+    callers = [asyncio.create_task(flight.do("key", fn)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*callers) == [42] * 5
+    assert len(runs) == 1
+    assert (flight.stats.calls, flight.stats.executions, flight.stats.deduplicated) == (5, 1, 4)
+
+
+async def test_call_after_completion_runs_again() -> None:
+    flight = SingleFlight()
+    runs = []
+
+    async def fn() -> int:
+        runs.append(1)
+        return len(runs)
+
+    assert await flight.do("key", fn) == 1
+    assert await flight.do("key", fn) == 2
+
+
+async def test_exception_is_shared_and_not_cached() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing() -> int:
+        await release.wait()
+        raise RuntimeError("boom")
+
+    callers = [asyncio.create_task(flight.do("key", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.stats.errors == 1
+
+    async def succeeding() -> int:
+        return 1
+
+    assert await flight.do("key", succeeding) == 1
+
+
+async def test_timeout_only_affects_the_waiting_caller() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def slow() -> str:
+        await release.wait()
+        return "done"
+
+    patient = asyncio.create_task(flight.do("key", slow))
+    with pytest.raises(asyncio.TimeoutError):
+        await flight.do("key", slow, timeout=0.01)
+    release.set()
+
+    assert await patient == "done"
+    assert flight.stats.timeouts == 1
+    assert flight.stats.executions == 1
+
+
+async def test_cancelled_caller_does_not_cancel_shared_call() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def slow() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flight.do("key", slow))
+    second = asyncio.create_task(flight.do("key", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    release.set()
+
+    assert await second == "done"
+
+
+async def test_decorator_keys_by_arguments() -> None:
+    release = asyncio.Event()
+    runs = []
+
+    class Service:
+        @single_flight()
+        async def get(self, item_id: int) -> int:
+            runs.append(item_id)
+            await release.wait()
+            return item_id * 10
+
+    service = Service()
+    callers = [asyncio.create_task(service.get(item_id)) for item_id in (1, 1, 2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*callers) == [10, 10, 20]
+    assert sorted(runs) == [1, 2]
+    assert Service.get.single_flight.stats.deduplicated == 1
@@ -0,0 +1,135 @@
+"""
+Tests cho unit_of_work và dependency UnitOfWork.
+"""
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.base.database.unit_of_work import after_commit, current_session, unit_of_work
+from src.base.dependency_injection import UnitOfWork
+from src.base.exception.api.handler import generic_exception_handler
+from src.health.database.repository.health import HealthCheckRepository
+from tests.conftest import make_engine
+
+
+def _make_app(url: str, events: list[str]) -> FastAPI:
+    """
+    App với POST /children chèn một row trong UnitOfWork.
+
+    Foreign key của bảng child là DEFERRED, nên parent_id không tồn tại chỉ
+    lỗi lúc COMMIT.
+    """
+    engine = make_engine(url)
+    event.listen(engine.sync_engine, "commit", lambda _: events.append("commit"))
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):  # type: ignore[no-untyped-def]
+        async with engine.begin() as connection:
+            await connection.execute(text("CREATE TABLE parent (id INTEGER PRIMARY KEY)"))
+            await connection.execute(text(
+                "CREATE TABLE child (id INTEGER PRIMARY KEY, parent_id INTEGER "
+                "REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED)"
+            ))
+            await connection.execute(text("INSERT INTO parent (id) VALUES (1)"))
+        events.clear()
+        yield {"db_engine": engine}
+        await engine.dispose()
+
+    app = FastAPI(lifespan=lifespan, exception_handlers={Exception: generic_exception_handler})
+
+    @app.post("/children/{parent_id}", status_code=201)
+    async def create_child(parent_id: int, session: AsyncSession = UnitOfWork()) -> dict[str, Any]:
+        await session.execute(text("INSERT INTO child (parent_id) VALUES (:parent_id)"), {"parent_id": parent_id})
+        events.append("endpoint-return")
+        return {"ok": True}
+
+    @app.get("/children")
+    async def count_children(session: AsyncSession = UnitOfWork()) -> dict[str, Any]:
+        return {"count": (await session.execute(text("SELECT COUNT(*) FROM child"))).scalar_one()}
+
+    return app
+
+
+def _record_response_start(app: FastAPI, events: list[str]) -> Any:
+    """Bọc app để ghi lại thời điểm response bắt đầu được gửi."""
+
+    async def wrapper(scope: Any, receive: Any, send: Any) -> None:
+        async def recording_send(message: Any) -> None:
+            if message["type"] == "http.response.start":
+                events.append("response-start")
+            await send(message)
+
+        await app(scope, receive, recording_send)
+
+    return wrapper
+
+
+def test_commit_happens_before_response(sqlite_url: str) -> None:
+    events: list[str] = []
+    app = _make_app(sqlite_url, events)
+    with TestClient(_record_response_start(app, events)) as client:
+        response = client.post("/children/1")
+        assert response.status_code == 201
+        assert events == ["endpoint-return", "commit", "response-start"]
+        assert client.get("/children").json() == {"count": 1}
+
+
+def test_failed_commit_returns_server_error(sqlite_url: str) -> None:
+    events: list[str] = []
+    app = _make_app(sqlite_url, events)
+    with TestClient(app, raise_server_exceptions=False) as client:
+        response = client.post("/children/999")
+        assert response.status_code == 500
+        assert client.get("/children").json() == {"count": 0}
+
+
+@pytest.mark.anyio
+async def test_repositories_share_session_and_commit_together(engine: AsyncEngine) -> None:
+    repository = HealthCheckRepository(engine)
+    other = HealthCheckRepository(engine)
+    callbacks: list[str] = []
+
+    async with unit_of_work(engine) as session:
+        created = await repository.create({})
+        await other.update(created.id, {})
+        after_commit(lambda: callbacks.append("committed"))
+        assert current_session() is session
+        assert callbacks == []
+
+    assert current_session() is None
+    assert callbacks == ["committed"]
+    assert [entity.id for entity in await repository.get_all()] == [created.id]
+
+
+@pytest.mark.anyio
+async def test_exception_rolls_back_and_skips_callbacks(engine: AsyncEngine) -> None:
+    repository = HealthCheckRepository(engine)
+    callbacks: list[str] = []
+
+    with pytest.raises(RuntimeError):
+        async with unit_of_work(engine):
+            await repository.create({})
+            after_commit(lambda: callbacks.append("committed"))
+            raise RuntimeError("boom")
+
+    assert callbacks == []
+    assert await repository.get_all() == []
+
+
+@pytest.mark.anyio
+async def test_nested_unit_of_work_rolls_back_to_savepoint(engine: AsyncEngine) -> None:
+    repository = HealthCheckRepository(engine)
+
+    async with unit_of_work(engine):
+        kept = await repository.create({})
+        with pytest.raises(RuntimeError):
+            async with unit_of_work(engine):
+                await repository.create({})
+                raise RuntimeError("boom")
+
+    assert [entity.id for entity in await repository.get_all()] == [kept.id]